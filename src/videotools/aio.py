@@ -0,0 +1,240 @@
+"""Asyncio API for ffmpeg commands and video operations."""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import weakref
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, List, Optional, TypeVar
+
+from videotools.ffmpeg import (
+    STDERR_TAIL_LINES,
+    TERMINATE_GRACE_SECONDS,
+    FFmpegError,
+    ProcessScope,
+    process_scope,
+)
+from videotools.ops import audio_to_video as _audio_to_video
+from videotools.ops import concat as _concat
+from videotools.ops import cut_duration as _cut_duration
+from videotools.ops import cut_fixed as _cut_fixed
+from videotools.ops import extract_audio as _extract_audio
+from videotools.ops import ladder as _ladder
+from videotools.ops import loudness as _loudness
+from videotools.ops import normalize_audio as _normalize_audio
+from videotools.ops import probe as _probe
+from videotools.ops import scenes as _scenes
+from videotools.ops import smart_cut as _smart_cut
+from videotools.ops import thumbnail as _thumbnail
+from videotools.ops import transcode as _transcode
+from videotools.pool import available_cores
+
+T = TypeVar("T")
+
+_concurrency_limit = available_cores()
+_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+_executor: ThreadPoolExecutor | None = None
+
+
+def set_concurrency_limit(limit: int) -> None:
+    """
+    Set how many ffmpeg jobs may run at once across the async API.
+
+    The limit applies to :func:`run_ffmpeg_async`, :func:`run_ffprobe_async`
+    and every async operation in this module.
+    """
+    global _concurrency_limit, _executor
+    if limit < 1:
+        raise ValueError("Concurrency limit must be at least 1.")
+    _concurrency_limit = limit
+    _semaphores.clear()
+    if _executor is not None:
+        _executor.shutdown(wait=False)
+        _executor = None
+
+
+def get_concurrency_limit() -> int:
+    """Return the current concurrency limit."""
+    return _concurrency_limit
+
+
+@asynccontextmanager
+async def _job_slot() -> AsyncIterator[None]:
+    loop = asyncio.get_running_loop()
+    semaphore = _semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _semaphores[loop] = asyncio.Semaphore(_concurrency_limit)
+    async with semaphore:
+        yield
+
+
+async def run_ffmpeg_async(
+    args: List[str],
+    capture_output: bool = False,
+    timeout: float | None = None,
+) -> Optional[str]:
+    """
+    Run an ffmpeg command without blocking the event loop.
+
+    Args:
+        args: List of ffmpeg arguments (without the ffmpeg command itself)
+        capture_output: If True, capture and return output
+        timeout: Seconds to wait before the command is terminated
+
+    Returns:
+        Command output if capture_output is True, None otherwise
+    """
+    return await _run_command_async(["ffmpeg", *args], capture_output, timeout)
+
+
+async def run_ffprobe_async(
+    args: List[str],
+    capture_output: bool = True,
+    timeout: float | None = None,
+) -> Optional[str]:
+    """
+    Run an ffprobe command without blocking the event loop.
+
+    Args:
+        args: List of ffprobe arguments (without the ffprobe command itself)
+        capture_output: If True, capture and return output
+        timeout: Seconds to wait before the command is terminated
+
+    Returns:
+        Command output if capture_output is True, None otherwise
+    """
+    return await _run_command_async(["ffprobe", *args], capture_output, timeout)
+
+
+async def _run_command_async(
+    command: List[str],
+    capture_output: bool,
+    timeout: float | None,
+) -> Optional[str]:
+    async with _job_slot():
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *command,
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE if capture_output else asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE,
+            )
+        except FileNotFoundError as exc:
+            raise FFmpegError(
+                f"{command[0]} not found. Please ensure it is installed and in PATH."
+            ) from exc
+
+        stderr_tail: Deque[str] = deque(maxlen=STDERR_TAIL_LINES)
+
+        async def _drain_stderr() -> None:
+            assert process.stderr is not None
+            async for line in process.stderr:
+                stderr_tail.append(line.decode(errors="replace").rstrip())
+
+        async def _read_stdout() -> bytes:
+            if process.stdout is None:
+                return b""
+            return await process.stdout.read()
+
+        async def _communicate() -> bytes:
+            stdout, _, _ = await asyncio.gather(_read_stdout(), _drain_stderr(), process.wait())
+            return stdout
+
+        try:
+            stdout = await asyncio.wait_for(_communicate(), timeout)
+        except (asyncio.CancelledError, asyncio.TimeoutError):
+            await _terminate_async(process)
+            raise
+
+    if process.returncode != 0:
+        error_msg = f"Command failed: {' '.join(command)}"
+        if stderr_tail:
+            error_msg += "\nError: " + "\n".join(stderr_tail).strip()
+        raise FFmpegError(error_msg)
+    if capture_output:
+        return stdout.decode(errors="replace")
+    return None
+
+
+async def _terminate_async(process: asyncio.subprocess.Process) -> None:
+    if process.returncode is not None:
+        return
+    process.terminate()
+    try:
+        await asyncio.wait_for(asyncio.shield(process.wait()), TERMINATE_GRACE_SECONDS)
+    except asyncio.TimeoutError:
+        process.kill()
+        await process.wait()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=_concurrency_limit, thread_name_prefix="videotools-aio"
+        )
+    return _executor
+
+
+async def _run_in_scope(
+    func: Callable[..., T],
+    args: Any,
+    kwargs: Any,
+    timeout: float | None,
+) -> T:
+    scope = ProcessScope()
+
+    def _call() -> T:
+        with process_scope(scope):
+            return func(*args, **kwargs)
+
+    async with _job_slot():
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        future = loop.run_in_executor(_get_executor(), context.run, _call)
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        except (asyncio.CancelledError, asyncio.TimeoutError):
+            # Kill the ffmpeg children and let the operation unwind (and clean
+            # up its temporary files) before propagating.
+            scope.cancel()
+            await asyncio.wait({future})
+            raise
+
+
+def _async_op(func: Callable[..., T]) -> Callable[..., Awaitable[T]]:
+    @functools.wraps(func)
+    async def wrapper(*args: Any, timeout: float | None = None, **kwargs: Any) -> T:
+        return await _run_in_scope(func, args, kwargs, timeout)
+
+    wrapper.__doc__ = (
+        f"Async version of :func:`{func.__module__}.{func.__name__}`.\n\n"
+        "Runs in a worker thread under the module concurrency limit. Cancelling "
+        "the call or exceeding ``timeout`` terminates its ffmpeg processes."
+    )
+    return wrapper
+
+
+audio_to_video = _async_op(_audio_to_video.audio_to_video)
+concat_videos = _async_op(_concat.concat_videos)
+create_sprite_sheets = _async_op(_thumbnail.create_sprite_sheets)
+cut_by_duration = _async_op(_cut_duration.cut_by_duration)
+cut_fixed_clips = _async_op(_cut_fixed.cut_fixed_clips)
+detect_scenes = _async_op(_scenes.detect_scenes)
+encode_ladder = _async_op(_ladder.encode_ladder)
+extract_audio = _async_op(_extract_audio.extract_audio)
+extract_audio_tracks = _async_op(_extract_audio.extract_audio_tracks)
+extract_thumbnail = _async_op(_thumbnail.extract_thumbnail)
+extract_thumbnails = _async_op(_thumbnail.extract_thumbnails)
+measure_loudness = _async_op(_loudness.measure_loudness)
+normalize_audio = _async_op(_normalize_audio.normalize_audio)
+probe_metadata = _async_op(_probe.probe_metadata)
+probe_video = _async_op(_probe.probe_video)
+smart_cut_clip = _async_op(_smart_cut.smart_cut_clip)
+transcode_video = _async_op(_transcode.transcode_video)
@@ -0,0 +1,139 @@
+"""SQLite-backed metadata cache keyed by source file identity."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Tuple
+
+from videotools.paths import CACHE_DIR
+
+CACHE_DB_PATH = CACHE_DIR / "metadata.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    namespace TEXT NOT NULL,
+    path TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    inode INTEGER NOT NULL,
+    value TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    PRIMARY KEY (namespace, path)
+)
+"""
+
+
+def file_identity(path: Path) -> Tuple[str, int, int, int]:
+    """Return ``(resolved path, size, mtime_ns, inode)`` for a file."""
+    stat = path.stat()
+    return str(path.resolve()), stat.st_size, stat.st_mtime_ns, stat.st_ino
+
+
+def get_cached(namespace: str, path: Path) -> Any | None:
+    """
+    Return the cached value for ``path`` in ``namespace``.
+
+    Returns None when there is no entry or the file changed since it was
+    stored. Cache failures are treated as misses.
+    """
+    resolved, size, mtime_ns, inode = file_identity(path)
+    try:
+        with closing(_connect()) as connection, connection:
+            row = connection.execute(
+                "SELECT size, mtime_ns, inode, value FROM entries WHERE namespace = ? AND path = ?",
+                (namespace, resolved),
+            ).fetchone()
+            if row is None:
+                return None
+            if tuple(row[:3]) != (size, mtime_ns, inode):
+                connection.execute(
+                    "DELETE FROM entries WHERE namespace = ? AND path = ?",
+                    (namespace, resolved),
+                )
+                return None
+            connection.execute(
+                "UPDATE entries SET accessed_at = ? WHERE namespace = ? AND path = ?",
+                (time.time(), namespace, resolved),
+            )
+            return json.loads(row[3])
+    except (OSError, sqlite3.Error, ValueError):
+        return None
+
+
+def put_cached(namespace: str, path: Path, value: Any) -> None:
+    """Store a JSON-serializable value for ``path`` in ``namespace``."""
+    resolved, size, mtime_ns, inode = file_identity(path)
+    now = time.time()
+    try:
+        with closing(_connect()) as connection, connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO entries "
+                "(namespace, path, size, mtime_ns, inode, value, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (namespace, resolved, size, mtime_ns, inode, json.dumps(value), now, now),
+            )
+    except (OSError, sqlite3.Error):
+        pass
+
+
+def evict_cache(
+    namespace: str | None = None,
+    max_age_seconds: float | None = None,
+    max_entries: int | None = None,
+    max_bytes: int | None = None,
+) -> int:
+    """
+    Evict cache entries and return how many were removed.
+
+    Entries not accessed within ``max_age_seconds`` are removed first; then
+    the least recently used entries beyond ``max_entries`` are dropped, and
+    finally the least recently used entries are dropped until the stored
+    values take at most ``max_bytes``. The database file is compacted after
+    a size-based eviction.
+    """
+    if not CACHE_DB_PATH.exists():
+        return 0
+
+    scope = "namespace = ?" if namespace else "1 = 1"
+    scope_params: tuple = (namespace,) if namespace else ()
+    removed = 0
+    with closing(_connect()) as connection, connection:
+        if max_age_seconds is not None:
+            cursor = connection.execute(
+                f"DELETE FROM entries WHERE {scope} AND accessed_at < ?",
+                (*scope_params, time.time() - max_age_seconds),
+            )
+            removed += cursor.rowcount
+        if max_entries is not None:
+            cursor = connection.execute(
+                f"DELETE FROM entries WHERE {scope} AND rowid NOT IN ("
+                f"SELECT rowid FROM entries WHERE {scope} ORDER BY accessed_at DESC LIMIT ?)",
+                (*scope_params, *scope_params, max_entries),
+            )
+            removed += cursor.rowcount
+        if max_bytes is not None:
+            cursor = connection.execute(
+                "DELETE FROM entries WHERE rowid IN ("
+                "SELECT rowid FROM (SELECT rowid, SUM(LENGTH(CAST(value AS BLOB))) OVER ("
+                "ORDER BY accessed_at DESC, rowid DESC) AS running "
+                f"FROM entries WHERE {scope}) WHERE running > ?)",
+                (*scope_params, max_bytes),
+            )
+            removed += cursor.rowcount
+    if max_bytes is not None and removed:
+        with closing(_connect()) as connection:
+            connection.execute("VACUUM")
+    return removed
+
+
+def _connect() -> sqlite3.Connection:
+    CACHE_DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(CACHE_DB_PATH, timeout=30)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute(_SCHEMA)
+    return connection
@@ -0,0 +1,120 @@
+"""Cached detection of the installed ffmpeg build and its features."""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List
+
+from videotools.ffmpeg import find_ffmpeg_binaries, run_ffmpeg
+from videotools.paths import CACHE_DIR
+
+CAPABILITIES_CACHE_PATH = CACHE_DIR / "ffmpeg_capabilities.json"
+
+_LISTING_LINE = re.compile(r"^\s*([A-Z.|]{1,8})\s+(\S+)\s")
+
+_loaded: Dict[str, "FFmpegCapabilities"] = {}
+
+
+@dataclass(frozen=True)
+class FFmpegCapabilities:
+    """Paths, version and available components of the ffmpeg build."""
+
+    ffmpeg_path: str
+    ffprobe_path: str
+    fingerprint: str
+    version: str
+    encoders: List[str] = field(default_factory=list)
+    filters: List[str] = field(default_factory=list)
+    muxers: List[str] = field(default_factory=list)
+
+    def has_encoder(self, name: str) -> bool:
+        return name in self.encoders
+
+    def has_filter(self, name: str) -> bool:
+        return name in self.filters
+
+    def has_muxer(self, name: str) -> bool:
+        return name in self.muxers
+
+
+def get_capabilities(refresh: bool = False) -> FFmpegCapabilities:
+    """
+    Return the capabilities of the ffmpeg build on PATH.
+
+    Capabilities are collected once, stored in the cache directory and reused
+    until the path or mtime of either binary changes. Only a PATH lookup and
+    two ``stat`` calls happen on the hot path.
+    """
+    ffmpeg_path, ffprobe_path = find_ffmpeg_binaries()
+    fingerprint = _fingerprint(ffmpeg_path, ffprobe_path)
+
+    if not refresh:
+        if fingerprint in _loaded:
+            return _loaded[fingerprint]
+        cached = _read_cache(fingerprint)
+        if cached is not None:
+            _loaded[fingerprint] = cached
+            return cached
+
+    capabilities = FFmpegCapabilities(
+        ffmpeg_path=ffmpeg_path,
+        ffprobe_path=ffprobe_path,
+        fingerprint=fingerprint,
+        version=_parse_version(run_ffmpeg(["-hide_banner", "-version"], capture_output=True)),
+        encoders=_parse_listing(run_ffmpeg(["-hide_banner", "-encoders"], capture_output=True)),
+        filters=_parse_listing(run_ffmpeg(["-hide_banner", "-filters"], capture_output=True)),
+        muxers=_parse_listing(run_ffmpeg(["-hide_banner", "-muxers"], capture_output=True)),
+    )
+    _write_cache(capabilities)
+    _loaded[fingerprint] = capabilities
+    return capabilities
+
+
+def _fingerprint(ffmpeg_path: str, ffprobe_path: str) -> str:
+    parts = []
+    for path in (ffmpeg_path, ffprobe_path):
+        resolved = os.path.realpath(path)
+        parts.append(f"{resolved}:{os.stat(resolved).st_mtime_ns}")
+    return "|".join(parts)
+
+
+def _parse_version(output: str | None) -> str:
+    first_line = (output or "").splitlines()[0] if output else ""
+    match = re.match(r"\S+ version (\S+)", first_line)
+    return match.group(1) if match else "unknown"
+
+
+def _parse_listing(output: str | None) -> List[str]:
+    names: List[str] = []
+    for line in (output or "").splitlines():
+        if " = " in line:
+            continue
+        match = _LISTING_LINE.match(line)
+        if match:
+            names.extend(name for name in match.group(2).split(",") if name)
+    return sorted(set(names))
+
+
+def _read_cache(fingerprint: str) -> FFmpegCapabilities | None:
+    try:
+        data = json.loads(CAPABILITIES_CACHE_PATH.read_text(encoding="utf-8"))
+        capabilities = FFmpegCapabilities(**data)
+    except (OSError, TypeError, ValueError):
+        return None
+    if capabilities.fingerprint != fingerprint:
+        return None
+    return capabilities
+
+
+def _write_cache(capabilities: FFmpegCapabilities) -> None:
+    try:
+        CAPABILITIES_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = CAPABILITIES_CACHE_PATH.with_suffix(f".{os.getpid()}.tmp")
+        temp_path.write_text(json.dumps(asdict(capabilities)), encoding="utf-8")
+        temp_path.replace(CAPABILITIES_CACHE_PATH)
+    except OSError:
+        pass
@@ -2,26 +2,42 @@
 
 from __future__ import annotations
 
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Annotated, List, Optional
+from typing import Annotated, Iterator, List, Optional
 
 import typer
 
-from videotools.ffmpeg import FFmpegError, ensure_ffmpeg_exists
+from videotools.cache import evict_cache
+from videotools.capabilities import get_capabilities
+from videotools.ffmpeg import FFmpegError, FFmpegProgress, ProgressCallback, ensure_ffmpeg_exists
+from videotools.keyframes import snap_cut
+from videotools.manifest import NodeResult, run_manifest
 from videotools.ops.audio_to_video import audio_to_video
 from videotools.ops.concat import concat_videos
 from videotools.ops.cut_duration import cut_by_duration
 from videotools.ops.cut_fixed import cut_fixed_clips
-from videotools.ops.extract_audio import extract_audio
+from videotools.ops.extract_audio import extract_audio, extract_audio_tracks
+from videotools.ops.ladder import DEFAULT_LADDER, encode_ladder, load_ladder_preset
+from videotools.ops.loudness import (
+    DEFAULT_TARGET_I,
+    DEFAULT_TARGET_LRA,
+    DEFAULT_TARGET_TP,
+    scan_loudness,
+)
 from videotools.ops.normalize_audio import normalize_audio
-from videotools.ops.probe import probe_video
-from videotools.ops.thumbnail import extract_thumbnail
-from videotools.ops.transcode import transcode_video
+from videotools.ops.probe import probe_video, warm_probe_cache
+from videotools.ops.scenes import detect_scenes
+from videotools.ops.thumbnail import create_sprite_sheets, extract_thumbnail, extract_thumbnails
+from videotools.ops.transcode import CHUNK_DIR, transcode_video, transcode_video_chunked
+from videotools.output_cache import prune_output_cache
 from videotools.presets import (
     get_optional_preset_path,
     get_optional_preset_string,
     load_audio_to_video_preset,
 )
+from videotools.timecode import format_timecode, parse_timecode
+from videotools.workspace import gc_workspaces
 
 app = typer.Typer(
     name="video-tools",
@@ -46,6 +62,38 @@ def _exit_with_error(exc: Exception) -> None:
     raise typer.Exit(1)
 
 
+def _echo_snapped_range(input_file: Path, start_seconds: float, duration_seconds: float) -> None:
+    actual_start, actual_duration = snap_cut(input_file, start_seconds, duration_seconds)
+    typer.echo(
+        f"    keyframe-aligned: {format_timecode(actual_start)} -> "
+        f"{format_timecode(actual_start + actual_duration)}"
+    )
+
+
+@contextmanager
+def _progress_bar(label: str) -> Iterator[ProgressCallback]:
+    steps = 1000
+    with typer.progressbar(length=steps, label=label, show_eta=False) as bar:
+        position = 0
+
+        def update(progress: FFmpegProgress) -> None:
+            nonlocal position
+            details = []
+            if progress.speed:
+                details.append(f"{progress.speed:.2f}x")
+            if progress.bitrate:
+                details.append(progress.bitrate)
+            if progress.eta is not None:
+                details.append(f"ETA {format_timecode(round(progress.eta))}")
+            bar.label = f"{label} {' '.join(details)}".rstrip()
+            if progress.fraction is not None:
+                target = int(progress.fraction * steps)
+                bar.update(target - position)
+                position = target
+
+        yield update
+
+
 @app.command("cut-fixed")
 def cut_fixed(
     input_file: Annotated[Path, typer.Argument(help="Input video file", exists=True, dir_okay=False)],
@@ -65,6 +113,26 @@ def cut_fixed(
         bool,
         typer.Option("--copy", help="Use stream copy mode instead of re-encoding"),
     ] = False,
+    single_pass: Annotated[
+        bool,
+        typer.Option("--single-pass", help="Write every clip from a single ffmpeg decode"),
+    ] = False,
+    jobs: Annotated[
+        int,
+        typer.Option("--jobs", "-j", min=1, help="Number of concurrent ffmpeg processes"),
+    ] = 1,
+    seek: Annotated[
+        Optional[str],
+        typer.Option("--seek", help="Seek strategy: fast, accurate or hybrid"),
+    ] = None,
+    snap: Annotated[
+        bool,
+        typer.Option("--snap", help="Align stream-copy cuts to real keyframes"),
+    ] = False,
+    smart: Annotated[
+        bool,
+        typer.Option("--smart", help="Re-encode only the GOPs at the clip edges"),
+    ] = False,
 ) -> None:
     """Cut fixed-duration clips from specified timestamps."""
     if not timestamps:
@@ -78,13 +146,20 @@ def cut_fixed(
             duration=duration,
             output_dir=output_dir,
             copy_streams=copy_streams,
+            single_pass=single_pass,
+            jobs=jobs,
+            seek=seek,
+            snap=snap,
+            smart=smart,
         )
     except Exception as exc:  # noqa: BLE001 - CLI output
         _exit_with_error(exc)
 
     typer.echo("\n✓ Successfully created clips:")
-    for output_file in output_files:
+    for timestamp, output_file in zip(timestamps, output_files):
         typer.echo(f"  - {output_file}")
+        if snap:
+            _echo_snapped_range(input_file, parse_timecode(timestamp), duration)
 
 
 @app.command("cut")
@@ -100,6 +175,22 @@ def cut(
         Optional[Path],
         typer.Option("--out-dir", help="Output directory"),
     ] = None,
+    seek: Annotated[
+        Optional[str],
+        typer.Option("--seek", help="Seek strategy: fast, accurate or hybrid"),
+    ] = None,
+    copy_streams: Annotated[
+        bool,
+        typer.Option("--copy", help="Use stream copy mode instead of re-encoding"),
+    ] = False,
+    snap: Annotated[
+        bool,
+        typer.Option("--snap", help="Align stream-copy cuts to real keyframes"),
+    ] = False,
+    smart: Annotated[
+        bool,
+        typer.Option("--smart", help="Re-encode only the GOPs at the clip edges"),
+    ] = False,
 ) -> None:
     """Cut a clip using start time and duration."""
     try:
@@ -109,12 +200,18 @@ def cut(
             duration=duration,
             output_file=output_file,
             output_dir=output_dir,
+            seek=seek,
+            copy_streams=copy_streams,
+            snap=snap,
+            smart=smart,
         )
     except Exception as exc:  # noqa: BLE001 - CLI output
         _exit_with_error(exc)
 
     typer.echo("\n✓ Successfully created clip:")
     typer.echo(f"  {output_path}")
+    if snap:
+        _echo_snapped_range(input_file, parse_timecode(start_time), parse_timecode(duration))
 
 
 @app.command("concat")
@@ -131,10 +228,27 @@ def concat(
         Optional[Path],
         typer.Option("--out-dir", help="Output directory"),
     ] = None,
+    no_conform: Annotated[
+        bool,
+        typer.Option(
+            "--no-conform",
+            help="Fail instead of re-encoding inputs that don't match the majority format",
+        ),
+    ] = False,
+    jobs: Annotated[
+        int,
+        typer.Option("--jobs", "-j", min=1, help="Inputs to probe and conform in parallel"),
+    ] = 4,
 ) -> None:
     """Concatenate multiple videos into one output file."""
     try:
-        output_path = concat_videos(input_files, output_file=output_file, output_dir=output_dir)
+        output_path = concat_videos(
+            input_files,
+            output_file=output_file,
+            output_dir=output_dir,
+            conform=not no_conform,
+            jobs=jobs,
+        )
     except Exception as exc:  # noqa: BLE001 - CLI output
         _exit_with_error(exc)
 
@@ -147,30 +261,60 @@ def extract_audio_cmd(
     input_file: Annotated[Path, typer.Argument(help="Input video file", exists=True, dir_okay=False)],
     output_file: Annotated[
         Optional[Path],
-        typer.Option("--out", "-o", help="Output audio file"),
+        typer.Option("--out", "-o", help="Output audio file (single track and format only)"),
     ] = None,
     output_dir: Annotated[
         Optional[Path],
         typer.Option("--out-dir", help="Output directory"),
     ] = None,
-    audio_format: Annotated[
-        str,
-        typer.Option("--format", help="Output format: wav or mp3"),
-    ] = "wav",
+    audio_formats: Annotated[
+        Optional[List[str]],
+        typer.Option("--format", help="Output format: wav, mp3, m4a or opus (repeatable)"),
+    ] = None,
+    tracks: Annotated[
+        Optional[List[int]],
+        typer.Option("--track", min=0, help="Audio track index to extract (repeatable)"),
+    ] = None,
+    all_tracks: Annotated[
+        bool,
+        typer.Option("--all-tracks", help="Extract every audio track"),
+    ] = False,
+    no_copy: Annotated[
+        bool,
+        typer.Option("--no-copy", help="Always transcode instead of stream-copying"),
+    ] = False,
 ) -> None:
-    """Extract audio track from a video file."""
+    """Extract audio tracks from a video file in one pass."""
+    formats = audio_formats or ["wav"]
     try:
-        output_path = extract_audio(
-            input_file=input_file,
-            output_file=output_file,
-            output_dir=output_dir,
-            audio_format=audio_format,
-        )
+        if all_tracks and tracks:
+            raise ValueError("Use either --track or --all-tracks, not both.")
+        selected_tracks = None if all_tracks else (tracks or [0])
+        if output_file is not None:
+            if len(formats) > 1 or selected_tracks is None or len(selected_tracks) > 1:
+                raise ValueError("--out can only be used with a single track and format.")
+            output_paths = [
+                extract_audio(
+                    input_file=input_file,
+                    output_file=output_file,
+                    track=selected_tracks[0],
+                    allow_copy=not no_copy,
+                )
+            ]
+        else:
+            output_paths = extract_audio_tracks(
+                input_file=input_file,
+                formats=formats,
+                tracks=selected_tracks,
+                output_dir=output_dir,
+                allow_copy=not no_copy,
+            )
     except Exception as exc:  # noqa: BLE001 - CLI output
         _exit_with_error(exc)
 
     typer.echo("\n✓ Successfully extracted audio:")
-    typer.echo(f"  {output_path}")
+    for output_path in output_paths:
+        typer.echo(f"  {output_path}")
 
 
 @app.command("normalize-audio")
@@ -184,14 +328,46 @@ def normalize_audio_cmd(
         Optional[Path],
         typer.Option("--out-dir", help="Output directory"),
     ] = None,
+    no_cache: Annotated[
+        bool,
+        typer.Option("--no-cache", help="Neither reuse nor store cached outputs"),
+    ] = False,
+    refresh: Annotated[
+        bool,
+        typer.Option("--refresh", help="Re-encode even if a cached output exists"),
+    ] = False,
+    two_pass: Annotated[
+        bool,
+        typer.Option("--two-pass", help="Measure loudness first and normalize linearly"),
+    ] = False,
+    target_i: Annotated[
+        float,
+        typer.Option("--target-i", help="Integrated loudness target in LUFS"),
+    ] = DEFAULT_TARGET_I,
+    target_tp: Annotated[
+        float,
+        typer.Option("--target-tp", help="True peak target in dBTP"),
+    ] = DEFAULT_TARGET_TP,
+    target_lra: Annotated[
+        float,
+        typer.Option("--target-lra", help="Loudness range target in LU"),
+    ] = DEFAULT_TARGET_LRA,
 ) -> None:
     """Normalize audio loudness using ffmpeg loudnorm."""
     try:
-        output_path = normalize_audio(
-            input_file=input_file,
-            output_file=output_file,
-            output_dir=output_dir,
-        )
+        with _progress_bar("Normalizing") as on_progress:
+            output_path = normalize_audio(
+                input_file=input_file,
+                output_file=output_file,
+                output_dir=output_dir,
+                on_progress=on_progress,
+                use_cache=not no_cache,
+                refresh=refresh,
+                two_pass=two_pass,
+                target_i=target_i,
+                target_tp=target_tp,
+                target_lra=target_lra,
+            )
     except Exception as exc:  # noqa: BLE001 - CLI output
         _exit_with_error(exc)
 
@@ -237,6 +413,21 @@ def audio_to_video_cmd(
         Optional[str],
         typer.Option("--pixel-format", help="Pixel format (default: yuv420p)"),
     ] = None,
+    no_cache: Annotated[
+        bool,
+        typer.Option("--no-cache", help="Neither reuse nor store cached outputs"),
+    ] = False,
+    refresh: Annotated[
+        bool,
+        typer.Option("--refresh", help="Re-encode even if a cached output exists"),
+    ] = False,
+    encode_every_frame: Annotated[
+        bool,
+        typer.Option(
+            "--encode-every-frame",
+            help="Encode the looped image for the full length instead of repeating a short clip",
+        ),
+    ] = False,
 ) -> None:
     """Create a video by combining a still image with audio."""
     try:
@@ -263,17 +454,21 @@ def audio_to_video_cmd(
             pixel_format or get_optional_preset_string(preset_data, "pixel_format") or "yuv420p"
         )
 
-        typer.echo("Combining audio and image into video...")
-        output_path = audio_to_video(
-            audio_file=audio_path,
-            image_file=image_path,
-            output_file=output_file or preset_output,
-            output_dir=output_dir,
-            video_codec=selected_video_codec,
-            audio_codec=selected_audio_codec,
-            audio_bitrate=selected_audio_bitrate,
-            pixel_format=selected_pixel_format,
-        )
+        with _progress_bar("Combining audio and image into video") as on_progress:
+            output_path = audio_to_video(
+                audio_file=audio_path,
+                image_file=image_path,
+                output_file=output_file or preset_output,
+                output_dir=output_dir,
+                video_codec=selected_video_codec,
+                audio_codec=selected_audio_codec,
+                audio_bitrate=selected_audio_bitrate,
+                pixel_format=selected_pixel_format,
+                on_progress=on_progress,
+                use_cache=not no_cache,
+                refresh=refresh,
+                encode_once=not encode_every_frame,
+            )
     except Exception as exc:  # noqa: BLE001 - CLI output
         _exit_with_error(exc)
 
@@ -292,14 +487,63 @@ def transcode(
         Optional[Path],
         typer.Option("--out-dir", help="Output directory"),
     ] = None,
+    no_cache: Annotated[
+        bool,
+        typer.Option("--no-cache", help="Neither reuse nor store cached outputs"),
+    ] = False,
+    refresh: Annotated[
+        bool,
+        typer.Option("--refresh", help="Re-encode even if a cached output exists"),
+    ] = False,
+    no_copy: Annotated[
+        bool,
+        typer.Option("--no-copy", help="Re-encode even streams that are already H.264/AAC"),
+    ] = False,
+    chunked: Annotated[
+        bool,
+        typer.Option("--chunked", help="Encode keyframe-aligned chunks in parallel (resumable)"),
+    ] = False,
+    chunk_seconds: Annotated[
+        float,
+        typer.Option("--chunk-seconds", min=1.0, help="Minimum chunk length for --chunked"),
+    ] = 60.0,
+    jobs: Annotated[
+        int,
+        typer.Option("--jobs", "-j", min=1, help="Chunks encoded concurrently with --chunked"),
+    ] = 4,
+    keep_chunks: Annotated[
+        bool,
+        typer.Option("--keep-chunks", help="Keep encoded chunks after a --chunked run"),
+    ] = False,
 ) -> None:
     """Transcode a video to H.264/AAC MP4."""
-    try:
-        output_path = transcode_video(
-            input_file=input_file,
-            output_file=output_file,
-            output_dir=output_dir,
+    if chunked and (no_cache or refresh or no_copy):
+        _exit_with_error(
+            ValueError("--no-cache, --refresh and --no-copy do not apply to --chunked.")
         )
+
+    try:
+        with _progress_bar("Transcoding") as on_progress:
+            if chunked:
+                output_path = transcode_video_chunked(
+                    input_file=input_file,
+                    output_file=output_file,
+                    output_dir=output_dir,
+                    chunk_seconds=chunk_seconds,
+                    jobs=jobs,
+                    on_progress=on_progress,
+                    keep_chunks=keep_chunks,
+                )
+            else:
+                output_path = transcode_video(
+                    input_file=input_file,
+                    output_file=output_file,
+                    output_dir=output_dir,
+                    on_progress=on_progress,
+                    use_cache=not no_cache,
+                    refresh=refresh,
+                    allow_copy=not no_copy,
+                )
     except Exception as exc:  # noqa: BLE001 - CLI output
         _exit_with_error(exc)
 
@@ -307,13 +551,64 @@ def transcode(
     typer.echo(f"  {output_path}")
 
 
+@app.command("encode-ladder")
+def encode_ladder_cmd(
+    input_file: Annotated[Path, typer.Argument(help="Input video file", exists=True, dir_okay=False)],
+    preset: Annotated[
+        Optional[Path],
+        typer.Option("--preset", "-p", help="Preset JSON/YAML file with a renditions list"),
+    ] = None,
+    hls: Annotated[
+        bool,
+        typer.Option("--hls", help="Write HLS playlists and segments instead of MP4 files"),
+    ] = False,
+    segment_seconds: Annotated[
+        float,
+        typer.Option("--segment-seconds", min=1.0, help="HLS segment length"),
+    ] = 6.0,
+    output_dir: Annotated[
+        Optional[Path],
+        typer.Option("--out-dir", help="Output directory"),
+    ] = None,
+) -> None:
+    """Encode several H.264/AAC renditions from a single decode."""
+    try:
+        renditions = load_ladder_preset(preset) if preset else DEFAULT_LADDER
+        with _progress_bar("Encoding ladder") as on_progress:
+            output_paths = encode_ladder(
+                input_file,
+                renditions=renditions,
+                output_dir=output_dir,
+                hls=hls,
+                segment_seconds=segment_seconds,
+                on_progress=on_progress,
+            )
+    except Exception as exc:  # noqa: BLE001 - CLI output
+        _exit_with_error(exc)
+
+    typer.echo("\n✓ Successfully encoded ladder:")
+    for output_path in output_paths:
+        typer.echo(f"  {output_path}")
+
+
 @app.command("thumbnail")
 def thumbnail(
     input_file: Annotated[Path, typer.Argument(help="Input video file", exists=True, dir_okay=False)],
-    timestamp: Annotated[str, typer.Option(..., "--at", help="Timestamp for thumbnail (e.g., 0:05)")],
+    timestamps: Annotated[
+        Optional[List[str]],
+        typer.Option("--at", help="Timestamp for a thumbnail (e.g., 0:05); repeatable"),
+    ] = None,
+    every: Annotated[
+        Optional[float],
+        typer.Option("--every", min=0.01, help="Extract one thumbnail every N seconds"),
+    ] = None,
+    width: Annotated[
+        Optional[int],
+        typer.Option("--width", min=16, help="Scale thumbnails to this width"),
+    ] = None,
     output_file: Annotated[
         Optional[Path],
-        typer.Option("--out", "-o", help="Output image file"),
+        typer.Option("--out", "-o", help="Output image file (single --at only)"),
     ] = None,
     output_dir: Annotated[
         Optional[Path],
@@ -323,30 +618,181 @@ def thumbnail(
         str,
         typer.Option("--format", help="Image format: png or jpg"),
     ] = "png",
+    seek: Annotated[
+        str,
+        typer.Option("--seek", help="Seek strategy: fast, accurate or hybrid"),
+    ] = "hybrid",
 ) -> None:
-    """Extract a thumbnail image from a video."""
+    """Extract thumbnail images from a video."""
+    if bool(timestamps) == (every is not None):
+        _exit_with_error(ValueError("Provide either --at or --every."))
+    if output_file and (every is not None or len(timestamps or []) > 1):
+        _exit_with_error(ValueError("--out can only be used with a single --at."))
+
     try:
-        output_path = extract_thumbnail(
-            input_file=input_file,
-            timestamp=timestamp,
-            output_file=output_file,
+        if timestamps and len(timestamps) == 1:
+            output_paths = [
+                extract_thumbnail(
+                    input_file=input_file,
+                    timestamp=timestamps[0],
+                    output_file=output_file,
+                    output_dir=output_dir,
+                    image_format=image_format,
+                    seek=seek,
+                    width=width,
+                )
+            ]
+        else:
+            output_paths = extract_thumbnails(
+                input_file,
+                timestamps=timestamps or None,
+                interval=every,
+                output_dir=output_dir,
+                image_format=image_format,
+                seek=seek,
+                width=width,
+            )
+    except Exception as exc:  # noqa: BLE001 - CLI output
+        _exit_with_error(exc)
+
+    typer.echo(f"\n✓ Successfully created {len(output_paths)} thumbnail(s):")
+    for output_path in output_paths:
+        typer.echo(f"  {output_path}")
+
+
+@app.command("thumbnail-sprites")
+def thumbnail_sprites(
+    input_file: Annotated[Path, typer.Argument(help="Input video file", exists=True, dir_okay=False)],
+    interval: Annotated[
+        float,
+        typer.Option("--every", min=0.1, help="Seconds between thumbnails"),
+    ] = 10.0,
+    width: Annotated[
+        int,
+        typer.Option("--width", min=16, help="Width of each thumbnail"),
+    ] = 160,
+    columns: Annotated[
+        int,
+        typer.Option("--columns", min=1, help="Thumbnails per sprite row"),
+    ] = 10,
+    rows: Annotated[
+        int,
+        typer.Option("--rows", min=1, help="Rows per sprite sheet"),
+    ] = 10,
+    base_url: Annotated[
+        str,
+        typer.Option("--base-url", help="Prefix for sprite URLs in the WebVTT file"),
+    ] = "",
+    output_dir: Annotated[
+        Optional[Path],
+        typer.Option("--out-dir", help="Output directory"),
+    ] = None,
+) -> None:
+    """Create sprite sheets and a WebVTT thumbnail track for scrubbing previews."""
+    try:
+        sheets, vtt_path = create_sprite_sheets(
+            input_file,
+            interval=interval,
+            width=width,
+            columns=columns,
+            rows=rows,
             output_dir=output_dir,
-            image_format=image_format,
+            base_url=base_url,
         )
     except Exception as exc:  # noqa: BLE001 - CLI output
         _exit_with_error(exc)
 
-    typer.echo("\n✓ Successfully created thumbnail:")
-    typer.echo(f"  {output_path}")
+    typer.echo(f"\n✓ Created {len(sheets)} sprite sheet(s):")
+    for sheet in sheets:
+        typer.echo(f"  {sheet}")
+    typer.echo(f"  → {vtt_path}")
+
+
+@app.command("detect-scenes")
+def detect_scenes_cmd(
+    input_file: Annotated[Path, typer.Argument(help="Input video file", exists=True, dir_okay=False)],
+    threshold: Annotated[
+        float,
+        typer.Option(
+            "--threshold",
+            min=0.0,
+            max=1.0,
+            min_open=True,
+            max_open=True,
+            help="Scene score threshold, exclusive (0-1)",
+        ),
+    ] = 0.3,
+    fps: Annotated[
+        float,
+        typer.Option("--fps", min=0.1, help="Frames per second analyzed"),
+    ] = 5.0,
+    width: Annotated[
+        int,
+        typer.Option("--width", min=16, help="Width the video is downscaled to for analysis"),
+    ] = 320,
+    min_scene: Annotated[
+        float,
+        typer.Option("--min-scene", min=0.0, help="Minimum seconds between scene changes"),
+    ] = 1.0,
+    no_cache: Annotated[
+        bool,
+        typer.Option("--no-cache", help="Bypass the scene cache"),
+    ] = False,
+    cut_duration: Annotated[
+        Optional[float],
+        typer.Option("--cut", help="Cut a clip of this many seconds at every scene change"),
+    ] = None,
+    thumbnails: Annotated[
+        bool,
+        typer.Option("--thumbnails", help="Extract a thumbnail at every scene change"),
+    ] = False,
+    output_dir: Annotated[
+        Optional[Path],
+        typer.Option("--out-dir", help="Output directory for clips and thumbnails"),
+    ] = None,
+) -> None:
+    """Detect scene changes and optionally cut clips or thumbnails at them."""
+    try:
+        scenes = detect_scenes(
+            input_file,
+            threshold=threshold,
+            fps=fps,
+            width=width,
+            min_scene_seconds=min_scene,
+            use_cache=not no_cache,
+        )
+        timestamps = [format_timecode(round(seconds, 3)) for seconds in scenes]
+        clips = (
+            cut_fixed_clips(input_file, timestamps, duration=cut_duration, output_dir=output_dir)
+            if cut_duration and timestamps
+            else []
+        )
+        images = (
+            extract_thumbnails(input_file, timestamps=timestamps, output_dir=output_dir)
+            if thumbnails and timestamps
+            else []
+        )
+    except Exception as exc:  # noqa: BLE001 - CLI output
+        _exit_with_error(exc)
+
+    typer.echo(f"\n✓ Detected {len(timestamps)} scene changes:")
+    for timestamp in timestamps:
+        typer.echo(f"  {timestamp}")
+    for path in [*clips, *images]:
+        typer.echo(f"  → {path}")
 
 
 @app.command("probe")
 def probe(
     input_file: Annotated[Path, typer.Argument(help="Input video file", exists=True, dir_okay=False)],
+    no_cache: Annotated[
+        bool,
+        typer.Option("--no-cache", help="Bypass the probe metadata cache"),
+    ] = False,
 ) -> None:
     """Display metadata about a video file."""
     try:
-        metadata = probe_video(input_file)
+        metadata = probe_video(input_file, use_cache=not no_cache)
     except Exception as exc:  # noqa: BLE001 - CLI output
         _exit_with_error(exc)
 
@@ -358,5 +804,234 @@ def probe(
     typer.echo(f"  Audio codec: {metadata['audio_codec']}")
 
 
+@app.command("run")
+def run(
+    manifest: Annotated[Path, typer.Argument(help="Manifest JSON/YAML file", exists=True, dir_okay=False)],
+    jobs: Annotated[
+        Optional[int],
+        typer.Option("--jobs", "-j", min=1, help="Maximum number of nodes running at once"),
+    ] = None,
+    resume: Annotated[
+        bool,
+        typer.Option("--resume/--no-resume", help="Skip nodes completed in a previous run"),
+    ] = True,
+) -> None:
+    """Run a manifest of operations with dependencies, in parallel."""
+
+    def report(result: NodeResult) -> None:
+        status = "resumed" if result.resumed else "done"
+        outputs = ", ".join(str(path) for path in result.outputs)
+        typer.echo(f"  [{status}] {result.name}: {outputs}")
+
+    typer.echo(f"Running manifest {manifest}...")
+    try:
+        results = run_manifest(manifest, jobs=jobs, resume=resume, on_node_done=report)
+    except Exception as exc:  # noqa: BLE001 - CLI output
+        _exit_with_error(exc)
+
+    typer.echo(f"\n✓ Successfully completed {len(results)} nodes")
+
+
+@app.command("ffmpeg-info")
+def ffmpeg_info(
+    refresh: Annotated[
+        bool,
+        typer.Option("--refresh", help="Re-detect capabilities instead of using the cache"),
+    ] = False,
+) -> None:
+    """Display the detected ffmpeg build and its capabilities."""
+    try:
+        capabilities = get_capabilities(refresh=refresh)
+    except Exception as exc:  # noqa: BLE001 - CLI output
+        _exit_with_error(exc)
+
+    typer.echo("\n✓ ffmpeg capabilities:")
+    typer.echo(f"  ffmpeg: {capabilities.ffmpeg_path}")
+    typer.echo(f"  ffprobe: {capabilities.ffprobe_path}")
+    typer.echo(f"  Version: {capabilities.version}")
+    typer.echo(f"  Encoders: {len(capabilities.encoders)}")
+    typer.echo(f"  Filters: {len(capabilities.filters)}")
+    typer.echo(f"  Muxers: {len(capabilities.muxers)}")
+
+
+@app.command("probe-warm")
+def probe_warm(
+    directory: Annotated[
+        Path,
+        typer.Argument(help="Directory to scan recursively", exists=True, file_okay=False),
+    ],
+    jobs: Annotated[
+        int,
+        typer.Option("--jobs", "-j", min=1, help="Number of concurrent ffprobe processes"),
+    ] = 4,
+) -> None:
+    """Probe every media file in a directory tree to warm the metadata cache."""
+    try:
+        results = warm_probe_cache(directory, jobs=jobs)
+    except Exception as exc:  # noqa: BLE001 - CLI output
+        _exit_with_error(exc)
+
+    failures = [result for result in results if not result.ok]
+    typer.echo(f"\n✓ Probed {len(results) - len(failures)} of {len(results)} files")
+    for result in failures:
+        typer.echo(f"  - {result.item}: {result.error}", err=True)
+
+
+@app.command("loudness-scan")
+def loudness_scan(
+    paths: Annotated[
+        List[Path],
+        typer.Argument(help="Media files or directories to scan recursively", exists=True),
+    ],
+    jobs: Annotated[
+        int,
+        typer.Option("--jobs", "-j", min=1, help="Number of concurrent measurements"),
+    ] = 4,
+    no_cache: Annotated[
+        bool,
+        typer.Option("--no-cache", help="Re-measure files that are already cached"),
+    ] = False,
+) -> None:
+    """Measure loudness of many files in parallel and cache the results."""
+    try:
+        results = scan_loudness(paths, jobs=jobs, use_cache=not no_cache)
+    except Exception as exc:  # noqa: BLE001 - CLI output
+        _exit_with_error(exc)
+
+    failures = [result for result in results if not result.ok]
+    typer.echo(f"\n✓ Measured {len(results) - len(failures)} of {len(results)} files")
+    for result in results:
+        if result.ok:
+            value = result.value
+            typer.echo(
+                f"  {result.item}: I={value['input_i']:.1f} LUFS  "
+                f"TP={value['input_tp']:.1f} dBTP  LRA={value['input_lra']:.1f} LU"
+            )
+    for result in failures:
+        typer.echo(f"  - {result.item}: {result.error}", err=True)
+
+
+@app.command("analyze-audio")
+def analyze_audio_cmd(
+    paths: Annotated[
+        List[Path],
+        typer.Argument(help="Media files or directories to scan recursively", exists=True),
+    ],
+    jobs: Annotated[
+        int,
+        typer.Option("--jobs", "-j", min=1, help="Number of worker processes"),
+    ] = 4,
+    silence_db: Annotated[
+        float,
+        typer.Option("--silence-db", help="Level below which audio counts as silence (dBFS)"),
+    ] = -40.0,
+    min_silence: Annotated[
+        float,
+        typer.Option("--min-silence", min=0, help="Minimum silence length in seconds"),
+    ] = 0.5,
+    duration: Annotated[
+        float,
+        typer.Option("--duration", "-d", min=0, help="Clip duration; candidates are this far apart"),
+    ] = 60.0,
+    max_clips: Annotated[
+        Optional[int],
+        typer.Option("--max-clips", min=1, help="Maximum number of candidate clips per file"),
+    ] = None,
+) -> None:
+    """Find silences and high-energy sections and suggest cut-fixed timestamps."""
+    # Imported here so NumPy is only loaded by the command that needs it,
+    # not on every CLI start.
+    from videotools.ops.analyze_audio import analyze_audio_files
+
+    try:
+        results = analyze_audio_files(
+            paths,
+            jobs=jobs,
+            silence_db=silence_db,
+            min_silence_seconds=min_silence,
+            clip_duration=duration,
+            max_candidates=max_clips,
+        )
+    except Exception as exc:  # noqa: BLE001 - CLI output
+        _exit_with_error(exc)
+
+    for result in results:
+        if not result.ok:
+            typer.echo(f"\n✗ {result.item}: {result.error}", err=True)
+            continue
+        analysis = result.value
+        typer.echo(f"\n{analysis.input_file} ({format_timecode(round(analysis.duration, 3))})")
+        typer.echo(f"  {len(analysis.silences)} silences, {len(analysis.highlights)} highlights")
+        for section in analysis.highlights:
+            typer.echo(
+                f"  highlight {format_timecode(round(section.start, 3))}"
+                f" - {format_timecode(round(section.end, 3))} ({section.level_db:.1f} dBFS)"
+            )
+        if analysis.candidates:
+            at_args = " ".join(f"--at {timestamp}" for timestamp in analysis.timestamps())
+            typer.echo(
+                f"  video-tools cut-fixed {analysis.input_file} {at_args} --duration {duration:g}"
+            )
+
+
+@app.command("cache-evict")
+def cache_evict(
+    max_age_days: Annotated[
+        Optional[float],
+        typer.Option("--max-age-days", help="Remove entries not used for this many days"),
+    ] = None,
+    max_entries: Annotated[
+        Optional[int],
+        typer.Option("--max-entries", min=0, help="Keep at most this many recently used entries"),
+    ] = None,
+    max_mb: Annotated[
+        Optional[float],
+        typer.Option("--max-mb", min=0, help="Shrink the metadata cache to this many megabytes"),
+    ] = None,
+    outputs_max_gb: Annotated[
+        Optional[float],
+        typer.Option("--outputs-max-gb", min=0, help="Shrink the output cache to this size"),
+    ] = None,
+) -> None:
+    """Evict entries from the metadata and output caches."""
+    try:
+        removed = evict_cache(
+            max_age_seconds=max_age_days * 86400 if max_age_days is not None else None,
+            max_entries=max_entries,
+            max_bytes=int(max_mb * 1024**2) if max_mb is not None else None,
+        )
+        removed_outputs = (
+            prune_output_cache(int(outputs_max_gb * 1024**3)) if outputs_max_gb is not None else 0
+        )
+    except Exception as exc:  # noqa: BLE001 - CLI output
+        _exit_with_error(exc)
+
+    typer.echo(f"\n✓ Removed {removed} cache entries")
+    if outputs_max_gb is not None:
+        typer.echo(f"✓ Removed {removed_outputs} cached outputs")
+
+
+@app.command("workspace-gc")
+def workspace_gc(
+    max_age_hours: Annotated[
+        float,
+        typer.Option(
+            "--max-age-hours",
+            min=0,
+            help="Remove workspaces without a checkable owner older than this",
+        ),
+    ] = 24.0,
+) -> None:
+    """Remove scratch workspaces and chunk caches left behind by crashed jobs."""
+    try:
+        removed = gc_workspaces(max_age_seconds=max_age_hours * 3600, shared_dirs=[CHUNK_DIR])
+    except Exception as exc:  # noqa: BLE001 - CLI output
+        _exit_with_error(exc)
+
+    typer.echo(f"\n✓ Removed {len(removed)} stale workspaces")
+    for path in removed:
+        typer.echo(f"  {path}")
+
+
 if __name__ == "__main__":
     app()
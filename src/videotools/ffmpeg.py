@@ -2,40 +2,194 @@
 
 from __future__ import annotations
 
+import io
+import shutil
 import subprocess
-from typing import List, Optional
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import IO, Callable, Deque, Dict, Iterator, List, Optional, Set, Tuple
+
+# Number of stderr lines kept for error messages by the streaming runner.
+STDERR_TAIL_LINES = 40
+
+# Seconds a cancelled process gets to exit after SIGTERM before it is killed.
+TERMINATE_GRACE_SECONDS = 5.0
 
 
 class FFmpegError(Exception):
     """Exception raised when ffmpeg or ffprobe command fails."""
 
 
-def _run_command(command: List[str], capture_output: bool) -> Optional[str]:
+class FFmpegCancelledError(FFmpegError):
+    """Exception raised when an ffmpeg or ffprobe command was cancelled."""
+
+
+class ProcessScope:
+    """
+    Tracks the child processes started within a context so they can be cancelled.
+
+    Activate a scope with :func:`process_scope`; every ffmpeg/ffprobe process
+    started by this module inside it is registered, and :meth:`cancel`
+    terminates them and refuses to start new ones.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._processes: Set[subprocess.Popen] = set()
+        self.cancelled = False
+
+    def register(self, process: subprocess.Popen) -> None:
+        with self._lock:
+            if not self.cancelled:
+                self._processes.add(process)
+                return
+        _terminate(process)
+        raise FFmpegCancelledError("Command was cancelled.")
+
+    def unregister(self, process: subprocess.Popen) -> None:
+        with self._lock:
+            self._processes.discard(process)
+
+    def cancel(self) -> None:
+        """Terminate every running process and reject new ones."""
+        with self._lock:
+            self.cancelled = True
+            processes = list(self._processes)
+        for process in processes:
+            _terminate(process)
+
+
+_current_scope: ContextVar[ProcessScope | None] = ContextVar(
+    "videotools_process_scope", default=None
+)
+
+
+@contextmanager
+def process_scope(scope: ProcessScope) -> Iterator[ProcessScope]:
+    """Register processes started in this context with ``scope``."""
+    token = _current_scope.set(scope)
     try:
-        result = subprocess.run(
-            command,
-            capture_output=capture_output,
-            text=True,
-            check=True,
-        )
-        if capture_output:
-            return result.stdout
-        return None
-    except subprocess.CalledProcessError as e:
-        error_msg = f"Command failed: {' '.join(command)}"
-        if e.stderr:
-            error_msg += f"\nError: {e.stderr.strip()}"
-        raise FFmpegError(error_msg) from e
+        yield scope
+    finally:
+        _current_scope.reset(token)
+
+
+def _terminate(process: subprocess.Popen) -> None:
+    if process.poll() is not None:
+        return
+    process.terminate()
+
+    def _kill_if_alive() -> None:
+        if process.poll() is None:
+            process.kill()
+
+    timer = threading.Timer(TERMINATE_GRACE_SECONDS, _kill_if_alive)
+    timer.daemon = True
+    timer.start()
+
+
+@contextmanager
+def _tracked(process: subprocess.Popen) -> Iterator[None]:
+    scope = _current_scope.get()
+    if scope is None:
+        yield
+        return
+    scope.register(process)
+    try:
+        yield
+    finally:
+        scope.unregister(process)
+        if scope.cancelled and process.returncode != 0:
+            raise FFmpegCancelledError("Command was cancelled.")
+
+
+def _spawn(command: List[str], **kwargs) -> subprocess.Popen:
+    try:
+        return subprocess.Popen(command, **kwargs)
     except FileNotFoundError as exc:
         raise FFmpegError(
             f"{command[0]} not found. Please ensure it is installed and in PATH."
         ) from exc
 
 
-def ensure_ffmpeg_exists() -> None:
-    """Ensure ffmpeg and ffprobe are installed and available."""
+@dataclass(frozen=True)
+class FFmpegProgress:
+    """A progress snapshot reported by ffmpeg's ``-progress`` output."""
+
+    out_time: float
+    duration: float | None = None
+    fps: float | None = None
+    speed: float | None = None
+    bitrate: str | None = None
+    total_size: int | None = None
+    elapsed: float = 0.0
+    finished: bool = False
+
+    @property
+    def fraction(self) -> float | None:
+        """Completed fraction between 0 and 1, if the total duration is known."""
+        if self.finished:
+            return 1.0
+        if not self.duration:
+            return None
+        return min(max(self.out_time / self.duration, 0.0), 1.0)
+
+    @property
+    def eta(self) -> float | None:
+        """Estimated seconds remaining, if the total duration is known."""
+        if self.finished:
+            return 0.0
+        if not self.duration:
+            return None
+        remaining = max(self.duration - self.out_time, 0.0)
+        if self.speed:
+            return remaining / self.speed
+        if self.out_time > 0 and self.elapsed > 0:
+            return remaining * self.elapsed / self.out_time
+        return None
+
+
+ProgressCallback = Callable[[FFmpegProgress], None]
+
+
+def _run_command(command: List[str], capture_output: bool) -> Optional[str]:
+    pipe = subprocess.PIPE if capture_output else None
+    process = _spawn(command, stdout=pipe, stderr=pipe, text=True)
+    with _tracked(process):
+        stdout, stderr = process.communicate()
+    if process.returncode != 0:
+        error_msg = f"Command failed: {' '.join(command)}"
+        if stderr:
+            error_msg += f"\nError: {stderr.strip()}"
+        raise FFmpegError(error_msg)
+    if capture_output:
+        return stdout
+    return None
+
+
+def find_ffmpeg_binaries() -> Tuple[str, str]:
+    """Return the resolved paths of ffmpeg and ffprobe on PATH."""
+    paths = []
     for tool in ("ffmpeg", "ffprobe"):
-        _run_command([tool, "-version"], capture_output=True)
+        path = shutil.which(tool)
+        if path is None:
+            raise FFmpegError(f"{tool} not found. Please ensure it is installed and in PATH.")
+        paths.append(path)
+    return paths[0], paths[1]
+
+
+def ensure_ffmpeg_exists() -> None:
+    """
+    Ensure ffmpeg and ffprobe are installed and available.
+
+    This only looks the binaries up on PATH and does not spawn them; see
+    :mod:`videotools.capabilities` for version and feature detection.
+    """
+    find_ffmpeg_binaries()
 
 
 def check_ffmpeg_installed() -> bool:
@@ -61,6 +215,211 @@ def run_ffmpeg(args: List[str], capture_output: bool = False) -> Optional[str]:
     return _run_command(["ffmpeg"] + args, capture_output=capture_output)
 
 
+def run_ffmpeg_analysis(args: List[str]) -> str:
+    """
+    Run an ffmpeg analysis command and return its stderr log.
+
+    Analysis filters such as ``loudnorm`` report their results on stderr
+    rather than stdout.
+
+    Args:
+        args: List of ffmpeg arguments (without the ffmpeg command itself)
+    """
+    command = ["ffmpeg", "-hide_banner", "-nostats", *args]
+    process = _spawn(
+        command,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    with _tracked(process):
+        _, stderr = process.communicate()
+    if process.returncode != 0:
+        tail = "\n".join(stderr.strip().splitlines()[-STDERR_TAIL_LINES:])
+        raise FFmpegError(f"Command failed: {' '.join(command)}\nError: {tail}")
+    return stderr
+
+
+def iter_ffmpeg_progress(
+    args: List[str],
+    duration: float | None = None,
+) -> Iterator[FFmpegProgress]:
+    """
+    Run ffmpeg and yield progress snapshots while it works.
+
+    ffmpeg is started with ``-progress pipe:1`` and its key=value report is
+    parsed incrementally. Only the last :data:`STDERR_TAIL_LINES` lines of
+    stderr are kept for the error raised when ffmpeg fails.
+
+    Args:
+        args: List of ffmpeg arguments (without the ffmpeg command itself)
+        duration: Total media duration in seconds, used for ETA/fraction
+    """
+    started = time.monotonic()
+    fields: Dict[str, str] = {}
+    for line in iter_ffmpeg_lines(["-progress", "pipe:1", *args]):
+        key, sep, value = line.strip().partition("=")
+        if not sep:
+            continue
+        fields[key] = value.strip()
+        if key == "progress":
+            yield _parse_progress(fields, duration, time.monotonic() - started)
+            fields = {}
+
+
+def iter_ffmpeg_lines(args: List[str]) -> Iterator[str]:
+    """
+    Run ffmpeg and yield the lines it writes to stdout as they arrive.
+
+    Useful with outputs such as ``-progress pipe:1`` or
+    ``metadata=print:file=-``. Only the last :data:`STDERR_TAIL_LINES` lines
+    of stderr are kept for the error raised when ffmpeg fails. Closing the
+    generator early terminates ffmpeg.
+
+    Args:
+        args: List of ffmpeg arguments (without the ffmpeg command itself)
+    """
+    command = ["ffmpeg", "-hide_banner", "-nostats", *args]
+    process = _spawn(
+        command,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+
+    stderr_tail: Deque[str] = deque(maxlen=STDERR_TAIL_LINES)
+    stderr_thread = threading.Thread(
+        target=_drain_lines, args=(process.stderr, stderr_tail), daemon=True
+    )
+    stderr_thread.start()
+
+    finished = False
+    with _tracked(process):
+        try:
+            assert process.stdout is not None
+            for line in process.stdout:
+                yield line
+            finished = True
+        finally:
+            if not finished and process.poll() is None:
+                process.terminate()
+            process.wait()
+            stderr_thread.join()
+
+    if process.returncode != 0:
+        error_msg = f"Command failed: {' '.join(command)}"
+        if stderr_tail:
+            error_msg += "\nError: " + "\n".join(stderr_tail).strip()
+        raise FFmpegError(error_msg)
+
+
+def iter_ffmpeg_output(args: List[str], buffer: bytearray) -> Iterator[int]:
+    """
+    Run ffmpeg writing to ``pipe:1`` and stream its output through ``buffer``.
+
+    The buffer is refilled in place with ``readinto`` and the number of bytes
+    filled is yielded each time; every chunk except the last fills the whole
+    buffer. Closing the generator early terminates ffmpeg.
+
+    Args:
+        args: List of ffmpeg arguments (without the ffmpeg command itself)
+        buffer: Preallocated buffer reused for every chunk
+    """
+    command = ["ffmpeg", "-hide_banner", "-nostats", *args]
+    process = _spawn(
+        command,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        bufsize=0,
+    )
+
+    stderr_tail: Deque[str] = deque(maxlen=STDERR_TAIL_LINES)
+    assert process.stderr is not None
+    stderr_thread = threading.Thread(
+        target=_drain_lines,
+        args=(io.TextIOWrapper(process.stderr, errors="replace"), stderr_tail),
+        daemon=True,
+    )
+    stderr_thread.start()
+
+    view = memoryview(buffer)
+    finished = False
+    with _tracked(process):
+        try:
+            assert process.stdout is not None
+            while not finished:
+                filled = 0
+                while filled < len(view):
+                    count = process.stdout.readinto(view[filled:])
+                    if not count:
+                        finished = True
+                        break
+                    filled += count
+                if filled:
+                    yield filled
+        finally:
+            if not finished and process.poll() is None:
+                process.terminate()
+            process.wait()
+            stderr_thread.join()
+
+    if process.returncode != 0:
+        error_msg = f"Command failed: {' '.join(command)}"
+        if stderr_tail:
+            error_msg += "\nError: " + "\n".join(stderr_tail).strip()
+        raise FFmpegError(error_msg)
+
+
+def run_ffmpeg_with_progress(
+    args: List[str],
+    on_progress: ProgressCallback,
+    duration: float | None = None,
+) -> None:
+    """Run ffmpeg and call ``on_progress`` with every progress snapshot."""
+    for progress in iter_ffmpeg_progress(args, duration=duration):
+        on_progress(progress)
+
+
+def _drain_lines(stream: IO[str] | None, tail: Deque[str]) -> None:
+    if stream is None:
+        return
+    for line in stream:
+        tail.append(line.rstrip())
+
+
+def _parse_progress(
+    fields: Dict[str, str],
+    duration: float | None,
+    elapsed: float,
+) -> FFmpegProgress:
+    out_time_us = _parse_number(fields.get("out_time_us") or fields.get("out_time_ms"))
+    speed = _parse_number(fields.get("speed", "").rstrip("x"))
+    total_size = _parse_number(fields.get("total_size"))
+    bitrate = fields.get("bitrate")
+    return FFmpegProgress(
+        out_time=max(out_time_us or 0.0, 0.0) / 1_000_000,
+        duration=duration,
+        fps=_parse_number(fields.get("fps")),
+        speed=speed or None,
+        bitrate=bitrate if bitrate and bitrate != "N/A" else None,
+        total_size=int(total_size) if total_size is not None else None,
+        elapsed=elapsed,
+        finished=fields.get("progress") == "end",
+    )
+
+
+def _parse_number(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
 def run_ffprobe(args: List[str], capture_output: bool = True) -> Optional[str]:
     """
     Run an ffprobe command with the given arguments.
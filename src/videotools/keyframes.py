@@ -0,0 +1,172 @@
+"""Persistent keyframe index for planning cuts on keyframe boundaries."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from videotools.ffmpeg import run_ffprobe
+from videotools.paths import CACHE_DIR
+
+KEYFRAME_CACHE_DIR = CACHE_DIR / "keyframes"
+
+# Sidecar layout: magic, source size, source mtime (ns), keyframe count,
+# followed by ``count`` little-endian float64 PTS values in seconds.
+_MAGIC = b"VTKF\x02\x00"
+_HEADER = struct.Struct("<6sQqQ")
+
+_loaded: Dict[Tuple[str, int, int], "KeyframeIndex"] = {}
+
+
+@dataclass(frozen=True)
+class KeyframeIndex:
+    """Sorted keyframe presentation timestamps of a video stream."""
+
+    times: Tuple[float, ...]
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def previous(self, seconds: float) -> float:
+        """Return the last keyframe at or before ``seconds`` (or the first keyframe)."""
+        if not self.times:
+            raise ValueError("Keyframe index is empty.")
+        position = bisect_right(self.times, seconds)
+        return self.times[max(position - 1, 0)]
+
+    def next(self, seconds: float) -> float | None:
+        """Return the first keyframe at or after ``seconds``, or None past the last one."""
+        position = bisect_left(self.times, seconds)
+        if position >= len(self.times):
+            return None
+        return self.times[position]
+
+    def between(self, start: float, end: float) -> Tuple[float, ...]:
+        """Return keyframes in the half-open range ``[start, end)``."""
+        return self.times[bisect_left(self.times, start) : bisect_left(self.times, end)]
+
+
+def load_keyframe_index(input_file: Path, use_cache: bool = True) -> KeyframeIndex:
+    """
+    Return the keyframe index for a video file.
+
+    The index is built once with ffprobe, stored as a binary sidecar under
+    the cache directory keyed by path, size and mtime, and memoized for the
+    lifetime of the process.
+    """
+    if not input_file.exists():
+        raise FileNotFoundError(f"Input file not found: {input_file}")
+
+    stat = input_file.stat()
+    key = (str(input_file.resolve()), stat.st_size, stat.st_mtime_ns)
+    if use_cache and key in _loaded:
+        return _loaded[key]
+
+    sidecar = _sidecar_path(key[0])
+    index = _read_sidecar(sidecar, stat.st_size, stat.st_mtime_ns) if use_cache else None
+    if index is None:
+        index = KeyframeIndex(tuple(sorted(_probe_keyframes(input_file))))
+        _write_sidecar(sidecar, index, stat.st_size, stat.st_mtime_ns)
+
+    _loaded[key] = index
+    return index
+
+
+def snap_cut(input_file: Path, start_seconds: float, duration_seconds: float) -> Tuple[float, float]:
+    """
+    Align a stream-copy cut to keyframes.
+
+    The start moves back to the previous keyframe and the end moves forward
+    to the next keyframe (or stays put past the last one), so the requested
+    range stays covered. Returns the actual ``(start, duration)``.
+    """
+    index = load_keyframe_index(input_file)
+    if not len(index):
+        raise ValueError(f"No keyframes found in {input_file}.")
+    end_seconds = start_seconds + duration_seconds
+    snapped_start = index.previous(start_seconds)
+    snapped_end = index.next(end_seconds)
+    if snapped_end is None:
+        snapped_end = end_seconds
+    return snapped_start, snapped_end - snapped_start
+
+
+def _probe_keyframes(input_file: Path) -> List[float]:
+    """
+    Return keyframe times relative to the container start.
+
+    Packet PTS are absolute, but ``-ss`` and ``-t`` count from the file's
+    ``start_time`` (non-zero in MPEG-TS and many camera files), so it is
+    subtracted.
+    """
+    output = run_ffprobe(
+        [
+            "-v",
+            "error",
+            "-select_streams",
+            "v:0",
+            "-show_entries",
+            "packet=pts_time,flags:format=start_time",
+            "-of",
+            "csv",
+            str(input_file),
+        ],
+        capture_output=True,
+    )
+    start_time = 0.0
+    times = []
+    for line in (output or "").splitlines():
+        section, _, values = line.strip().partition(",")
+        if section == "format":
+            try:
+                start_time = float(values)
+            except ValueError:
+                pass
+            continue
+        pts_time, _, flags = values.partition(",")
+        if section != "packet" or not flags.startswith("K"):
+            continue
+        try:
+            times.append(float(pts_time))
+        except ValueError:
+            continue
+    return [max(0.0, time - start_time) for time in times]
+
+
+def _sidecar_path(resolved_path: str) -> Path:
+    digest = hashlib.sha1(resolved_path.encode("utf-8")).hexdigest()
+    return KEYFRAME_CACHE_DIR / f"{digest}.kfi"
+
+
+def _read_sidecar(sidecar: Path, size: int, mtime_ns: int) -> KeyframeIndex | None:
+    try:
+        data = sidecar.read_bytes()
+        magic, cached_size, cached_mtime, count = _HEADER.unpack_from(data)
+    except (OSError, struct.error):
+        return None
+    if magic != _MAGIC or cached_size != size or cached_mtime != mtime_ns:
+        return None
+    values = array("d")
+    values.frombytes(data[_HEADER.size : _HEADER.size + count * values.itemsize])
+    if len(values) != count:
+        return None
+    if sys.byteorder == "big":
+        values.byteswap()
+    return KeyframeIndex(tuple(values))
+
+
+def _write_sidecar(sidecar: Path, index: KeyframeIndex, size: int, mtime_ns: int) -> None:
+    values = array("d", index.times)
+    if sys.byteorder == "big":
+        values.byteswap()
+    sidecar.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = sidecar.with_suffix(f".{os.getpid()}.tmp")
+    temp_path.write_bytes(_HEADER.pack(_MAGIC, size, mtime_ns, len(values)) + values.tobytes())
+    temp_path.replace(sidecar)
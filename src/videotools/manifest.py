@@ -0,0 +1,326 @@
+"""Run a graph of video operations described by a JSON/YAML manifest.
+
+A manifest maps node names to operations. Each node names an ``op`` (the
+CLI command name) and passes the remaining fields as keyword arguments of
+the operation function. Path fields are resolved relative to the manifest,
+and a value of ``"@other"`` refers to the output(s) of node ``other``,
+which also makes it a dependency::
+
+    jobs: 4
+    nodes:
+      intro:
+        op: cut
+        input_file: raw/intro.mp4
+        start_time: "0:05"
+        duration: "30"
+      merged:
+        op: concat
+        input_files: ["@intro", raw/main.mp4]
+        output_file: out/merged.mp4
+      cover:
+        op: thumbnail
+        input_file: "@merged"
+        timestamp: "0:10"
+        needs: [intro]
+
+Completed nodes are recorded in a journal next to the manifest, so a
+re-run skips nodes whose inputs and parameters are unchanged and whose
+outputs still exist.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from videotools.ops.audio_to_video import audio_to_video
+from videotools.ops.concat import concat_videos
+from videotools.ops.cut_duration import cut_by_duration
+from videotools.ops.cut_fixed import cut_fixed_clips
+from videotools.ops.extract_audio import extract_audio
+from videotools.ops.normalize_audio import normalize_audio
+from videotools.ops.thumbnail import extract_thumbnail
+from videotools.ops.transcode import transcode_video
+from videotools.presets import load_preset_file, resolve_preset_path
+
+MANIFEST_OPS: Dict[str, Callable[..., Any]] = {
+    "audio-to-video": audio_to_video,
+    "concat": concat_videos,
+    "cut": cut_by_duration,
+    "cut-fixed": cut_fixed_clips,
+    "extract-audio": extract_audio,
+    "normalize-audio": normalize_audio,
+    "thumbnail": extract_thumbnail,
+    "transcode": transcode_video,
+}
+
+PATH_FIELDS = {"input_file", "output_file", "output_dir", "audio_file", "image_file"}
+PATH_LIST_FIELDS = {"input_files"}
+# Fields whose file identity (size and mtime) is part of a node's fingerprint.
+INPUT_FIELDS = {"input_file", "audio_file", "image_file", "input_files"}
+_RESERVED_FIELDS = {"op", "needs"}
+
+
+class ManifestError(Exception):
+    """Exception raised when a manifest is invalid or one of its nodes fails."""
+
+
+@dataclass
+class ManifestNode:
+    """A single operation in a manifest graph."""
+
+    name: str
+    op: str
+    params: Dict[str, Any]
+    needs: List[str] = field(default_factory=list)
+
+
+@dataclass
+class NodeResult:
+    """Outcome of a manifest node."""
+
+    name: str
+    outputs: List[Path]
+    resumed: bool = False
+
+
+def load_manifest(manifest_path: Path) -> tuple[List[ManifestNode], int | None]:
+    """Load and validate a manifest, returning its nodes and default job count."""
+    data = load_preset_file(manifest_path)
+    raw_nodes = data.get("nodes")
+    if not isinstance(raw_nodes, dict) or not raw_nodes:
+        raise ManifestError("Manifest must define a non-empty 'nodes' mapping.")
+
+    jobs = data.get("jobs")
+    if jobs is not None and (not isinstance(jobs, int) or jobs < 1):
+        raise ManifestError("Manifest field 'jobs' must be a positive integer.")
+
+    nodes: List[ManifestNode] = []
+    for name, spec in raw_nodes.items():
+        if not isinstance(spec, dict):
+            raise ManifestError(f"Node '{name}' must be an object.")
+        op = spec.get("op")
+        if op not in MANIFEST_OPS:
+            known = ", ".join(sorted(MANIFEST_OPS))
+            raise ManifestError(f"Node '{name}' has unknown op {op!r}. Use one of: {known}.")
+        needs = spec.get("needs", [])
+        if not isinstance(needs, list) or not all(isinstance(item, str) for item in needs):
+            raise ManifestError(f"Node '{name}' field 'needs' must be a list of node names.")
+        params = {key: value for key, value in spec.items() if key not in _RESERVED_FIELDS}
+        path_values = [
+            value for key, value in params.items() if key in PATH_FIELDS | PATH_LIST_FIELDS
+        ]
+        needs = sorted(set(needs) | _references(path_values))
+        for dependency in needs:
+            if dependency not in raw_nodes:
+                raise ManifestError(f"Node '{name}' depends on unknown node '{dependency}'.")
+        nodes.append(ManifestNode(name=str(name), op=op, params=params, needs=needs))
+
+    _check_acyclic(nodes)
+    return nodes, jobs
+
+
+def run_manifest(
+    manifest_path: Path,
+    jobs: int | None = None,
+    resume: bool = True,
+    on_node_done: Callable[[NodeResult], None] | None = None,
+) -> Dict[str, NodeResult]:
+    """
+    Run every node of a manifest, in parallel where dependencies allow.
+
+    Args:
+        manifest_path: JSON/YAML manifest file
+        jobs: Maximum number of nodes running at once (default: manifest ``jobs`` or 1)
+        resume: Skip nodes already recorded as completed in the journal
+        on_node_done: Called with each node result as it completes
+
+    Returns:
+        Results keyed by node name
+    """
+    nodes, manifest_jobs = load_manifest(manifest_path)
+    max_workers = jobs or manifest_jobs or 1
+    journal_path = journal_path_for(manifest_path)
+    journal = _read_journal(journal_path) if resume else {}
+    if not resume and journal_path.exists():
+        journal_path.unlink()
+
+    by_name = {node.name: node for node in nodes}
+    results: Dict[str, NodeResult] = {}
+    fingerprints: Dict[str, str] = {}
+    pending = dict(by_name)
+    running: Dict[Future, ManifestNode] = {}
+    failures: Dict[str, BaseException] = {}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while True:
+            progressed = not failures
+            while progressed:
+                progressed = False
+                ready = [n for n in pending.values() if all(d in results for d in n.needs)]
+                for node in ready:
+                    del pending[node.name]
+                    params = _resolve_params(node, manifest_path, results)
+                    fingerprints[node.name] = _fingerprint(node, params, fingerprints)
+                    resumed = _resume_from_journal(node, fingerprints[node.name], journal)
+                    if resumed is None:
+                        running[executor.submit(MANIFEST_OPS[node.op], **params)] = node
+                        continue
+                    results[node.name] = resumed
+                    if on_node_done:
+                        on_node_done(resumed)
+                    progressed = True
+
+            if not running:
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                node = running.pop(future)
+                try:
+                    value = future.result()
+                except Exception as exc:  # noqa: BLE001 - reported together below
+                    failures[node.name] = exc
+                    continue
+                outputs = list(value) if isinstance(value, list) else [value]
+                result = NodeResult(node.name, outputs)
+                results[node.name] = result
+                _append_journal(journal_path, node.name, fingerprints[node.name], outputs)
+                if on_node_done:
+                    on_node_done(result)
+
+    if failures:
+        lines = [f"{len(failures)} manifest node(s) failed:"]
+        lines += [f"  {name}: {exc}" for name, exc in failures.items()]
+        skipped = sorted(set(by_name) - set(results) - set(failures))
+        if skipped:
+            lines.append(f"  not run: {', '.join(skipped)}")
+        raise ManifestError("\n".join(lines))
+    return results
+
+
+def journal_path_for(manifest_path: Path) -> Path:
+    """Return the journal file used for a manifest."""
+    return manifest_path.with_name(f"{manifest_path.name}.journal")
+
+
+def _resume_from_journal(
+    node: ManifestNode,
+    fingerprint: str,
+    journal: Dict[str, Dict[str, Any]],
+) -> NodeResult | None:
+    recorded = journal.get(node.name)
+    if not recorded or recorded.get("fingerprint") != fingerprint:
+        return None
+    outputs = [Path(path) for path in recorded.get("outputs", [])]
+    if not outputs or not all(path.exists() for path in outputs):
+        return None
+    return NodeResult(node.name, outputs, resumed=True)
+
+
+def _references(value: Any) -> set[str]:
+    if isinstance(value, str) and value.startswith("@"):
+        return {value[1:]}
+    if isinstance(value, list):
+        return set().union(*(_references(item) for item in value)) if value else set()
+    if isinstance(value, dict):
+        return set().union(*(_references(item) for item in value.values())) if value else set()
+    return set()
+
+
+def _check_acyclic(nodes: List[ManifestNode]) -> None:
+    remaining = {node.name: set(node.needs) for node in nodes}
+    while remaining:
+        ready = [name for name, needs in remaining.items() if not needs]
+        if not ready:
+            cycle = ", ".join(sorted(remaining))
+            raise ManifestError(f"Manifest has a dependency cycle among: {cycle}.")
+        for name in ready:
+            del remaining[name]
+        for needs in remaining.values():
+            needs.difference_update(ready)
+
+
+def _resolve_params(
+    node: ManifestNode,
+    manifest_path: Path,
+    results: Dict[str, NodeResult],
+) -> Dict[str, Any]:
+    def resolve_path(value: Any) -> List[Path]:
+        if isinstance(value, str) and value.startswith("@"):
+            return list(results[value[1:]].outputs)
+        if not isinstance(value, str):
+            raise ManifestError(f"Node '{node.name}' has a non-string path value: {value!r}")
+        return [resolve_preset_path(manifest_path, value)]
+
+    params: Dict[str, Any] = {}
+    for key, value in node.params.items():
+        if key in PATH_FIELDS:
+            paths = resolve_path(value)
+            if len(paths) != 1:
+                raise ManifestError(
+                    f"Node '{node.name}' field '{key}' refers to {len(paths)} outputs; "
+                    "expected one."
+                )
+            params[key] = paths[0]
+        elif key in PATH_LIST_FIELDS:
+            items = value if isinstance(value, list) else [value]
+            params[key] = [path for item in items for path in resolve_path(item)]
+        else:
+            params[key] = value
+    return params
+
+
+def _fingerprint(node: ManifestNode, params: Dict[str, Any], fingerprints: Dict[str, str]) -> str:
+    payload = {
+        "op": node.op,
+        "params": {
+            key: _describe(value) if key in INPUT_FIELDS else _jsonable(value)
+            for key, value in sorted(params.items())
+        },
+        "upstream": {name: fingerprints[name] for name in node.needs},
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _describe(value: Any) -> Any:
+    if isinstance(value, Path) and value.is_file():
+        stat = value.stat()
+        return [str(value), stat.st_size, stat.st_mtime_ns]
+    if isinstance(value, list):
+        return [_describe(item) for item in value]
+    return _jsonable(value)
+
+
+def _jsonable(value: Any) -> Any:
+    if isinstance(value, Path):
+        return str(value)
+    if isinstance(value, list):
+        return [_jsonable(item) for item in value]
+    return value
+
+
+def _read_journal(journal_path: Path) -> Dict[str, Dict[str, Any]]:
+    entries: Dict[str, Dict[str, Any]] = {}
+    if not journal_path.exists():
+        return entries
+    for line in journal_path.read_text(encoding="utf-8").splitlines():
+        try:
+            entry = json.loads(line)
+            entries[entry["node"]] = entry
+        except (ValueError, KeyError, TypeError):
+            # A crash can leave a truncated last line behind.
+            continue
+    return entries
+
+
+def _append_journal(journal_path: Path, name: str, fingerprint: str, outputs: List[Path]) -> None:
+    entry = {"node": name, "fingerprint": fingerprint, "outputs": [str(path) for path in outputs]}
+    with journal_path.open("a", encoding="utf-8") as handle:
+        handle.write(json.dumps(entry) + "\n")
+        handle.flush()
+        os.fsync(handle.fileno())
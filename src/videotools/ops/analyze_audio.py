@@ -0,0 +1,248 @@
+"""Detect silences and high-energy sections to suggest clip start times."""
+
+from __future__ import annotations
+
+import functools
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, List, Tuple
+
+from videotools.ops.audio_stream import iter_pcm_chunks
+from videotools.ops.probe import MEDIA_EXTENSIONS
+from videotools.pool import JobResult
+from videotools.timecode import format_timecode
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+if TYPE_CHECKING:  # pragma: no cover
+    import numpy
+
+ANALYSIS_SAMPLE_RATE = 16000
+
+# Level used for digital silence so log10 never sees zero.
+_FLOOR_DB = -120.0
+
+
+@dataclass
+class AudioSection:
+    """A time range with its mean level in dBFS."""
+
+    start: float
+    end: float
+    level_db: float
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+
+@dataclass
+class AudioAnalysis:
+    """Silences, high-energy sections and suggested clip starts of one file."""
+
+    input_file: Path
+    duration: float
+    silences: List[AudioSection] = field(default_factory=list)
+    highlights: List[AudioSection] = field(default_factory=list)
+    candidates: List[float] = field(default_factory=list)
+
+    def timestamps(self) -> List[str]:
+        """Candidate start times formatted for :func:`cut_fixed_clips`."""
+        return [format_timecode(round(seconds, 3)) for seconds in self.candidates]
+
+
+def analyze_audio(
+    input_file: Path,
+    window_seconds: float = 0.25,
+    silence_db: float = -40.0,
+    min_silence_seconds: float = 0.5,
+    smoothing_seconds: float = 3.0,
+    highlight_percentile: float = 90.0,
+    min_highlight_seconds: float = 2.0,
+    clip_duration: float = 60.0,
+    lead_in_seconds: float = 2.0,
+    max_candidates: int | None = None,
+) -> AudioAnalysis:
+    """
+    Analyze an audio track in a single streaming pass.
+
+    A short-term RMS envelope (one value per ``window_seconds``) is computed
+    from mono PCM streamed out of ffmpeg. Silences are runs below
+    ``silence_db``; highlights are runs where the smoothed envelope exceeds
+    the ``highlight_percentile`` of the non-silent level. Each highlight
+    yields a candidate clip start ``lead_in_seconds`` earlier (moved to the
+    end of a silence if one lies in that range); candidates closer than
+    ``clip_duration`` are merged, keeping the louder one.
+    """
+    if np is None:
+        raise ValueError("Audio analysis requires NumPy to be installed.")
+    if window_seconds <= 0:
+        raise ValueError("Window length must be positive.")
+
+    window_frames = max(1, int(round(window_seconds * ANALYSIS_SAMPLE_RATE)))
+    chunks = iter_pcm_chunks(
+        input_file,
+        sample_rate=ANALYSIS_SAMPLE_RATE,
+        channels=1,
+        chunk_frames=window_frames * 256,
+    )
+    envelope = rms_envelope(chunks, window_frames)
+    window_seconds = window_frames / ANALYSIS_SAMPLE_RATE
+
+    silences = [
+        section
+        for section in _sections(envelope, envelope < silence_db, window_seconds)
+        if section.duration >= min_silence_seconds
+    ]
+    highlights = _highlights(
+        envelope,
+        window_seconds,
+        silence_db,
+        smoothing_seconds,
+        highlight_percentile,
+        min_highlight_seconds,
+    )
+    candidates = _candidates(
+        highlights, silences, clip_duration, lead_in_seconds, max_candidates
+    )
+    return AudioAnalysis(
+        input_file=input_file,
+        duration=len(envelope) * window_seconds,
+        silences=silences,
+        highlights=highlights,
+        candidates=candidates,
+    )
+
+
+def analyze_audio_files(
+    paths: Iterable[Path],
+    jobs: int = 4,
+    **options: float,
+) -> List[JobResult]:
+    """
+    Analyze files (and media files under directories) in worker processes.
+
+    The envelope math runs in Python/NumPy, so files are spread over up to
+    ``jobs`` processes rather than threads. ``options`` are passed to
+    :func:`analyze_audio`.
+    """
+    if jobs < 1:
+        raise ValueError("Number of jobs must be at least 1.")
+
+    media_files: List[Path] = []
+    for path in paths:
+        if path.is_dir():
+            media_files += sorted(
+                item
+                for item in path.rglob("*")
+                if item.is_file() and item.suffix.lower() in MEDIA_EXTENSIONS
+            )
+        else:
+            media_files.append(path)
+
+    analyze = functools.partial(analyze_audio, **options)
+    if jobs == 1 or len(media_files) <= 1:
+        return [_analyze_job(analyze, index, path) for index, path in enumerate(media_files)]
+
+    with ProcessPoolExecutor(max_workers=min(jobs, len(media_files))) as executor:
+        futures = [
+            executor.submit(_analyze_job, analyze, index, path)
+            for index, path in enumerate(media_files)
+        ]
+        return [future.result() for future in futures]
+
+
+def rms_envelope(chunks: Iterable["numpy.ndarray"], window_frames: int) -> "numpy.ndarray":
+    """Return the RMS level in dBFS of consecutive ``window_frames`` windows."""
+    levels = []
+    carry = np.zeros(0, dtype=np.float32)
+    for chunk in chunks:
+        samples = np.concatenate((carry, chunk.reshape(-1)))
+        usable = len(samples) - len(samples) % window_frames
+        windows = samples[:usable].reshape(-1, window_frames)
+        levels.append(np.sqrt(np.mean(np.square(windows, dtype=np.float64), axis=1)))
+        carry = samples[usable:].copy()
+    if len(carry):
+        levels.append(np.sqrt(np.mean(np.square(carry, dtype=np.float64), keepdims=True)))
+    if not levels:
+        return np.zeros(0)
+    rms = np.concatenate(levels)
+    return np.maximum(20 * np.log10(np.maximum(rms, 1e-12)), _FLOOR_DB)
+
+
+def _analyze_job(analyze: functools.partial, index: int, path: Path) -> JobResult:
+    try:
+        return JobResult(index=index, item=path, value=analyze(path))
+    except Exception as exc:  # noqa: BLE001 - collected per job
+        return JobResult(index=index, item=path, error=exc)
+
+
+def _runs(mask: "numpy.ndarray") -> List[Tuple[int, int]]:
+    padded = np.concatenate(([0], mask.astype(np.int8), [0]))
+    edges = np.flatnonzero(np.diff(padded))
+    return list(zip(edges[::2].tolist(), edges[1::2].tolist()))
+
+
+def _sections(
+    envelope: "numpy.ndarray",
+    mask: "numpy.ndarray",
+    window_seconds: float,
+) -> List[AudioSection]:
+    return [
+        AudioSection(
+            start=start * window_seconds,
+            end=end * window_seconds,
+            level_db=float(np.mean(envelope[start:end])),
+        )
+        for start, end in _runs(mask)
+    ]
+
+
+def _highlights(
+    envelope: "numpy.ndarray",
+    window_seconds: float,
+    silence_db: float,
+    smoothing_seconds: float,
+    percentile: float,
+    min_seconds: float,
+) -> List[AudioSection]:
+    voiced = envelope[envelope >= silence_db]
+    if not len(voiced):
+        return []
+    width = max(1, int(round(smoothing_seconds / window_seconds)))
+    smoothed = np.convolve(envelope, np.ones(width) / width, mode="same")
+    threshold = np.percentile(voiced, percentile)
+    return [
+        section
+        for section in _sections(envelope, smoothed >= threshold, window_seconds)
+        if section.duration >= min_seconds
+    ]
+
+
+def _candidates(
+    highlights: List[AudioSection],
+    silences: List[AudioSection],
+    clip_duration: float,
+    lead_in_seconds: float,
+    max_candidates: int | None,
+) -> List[float]:
+    scored = []
+    for highlight in highlights:
+        start = max(0.0, highlight.start - lead_in_seconds)
+        # Prefer starting right after a pause shortly before the highlight.
+        pauses = [s.end for s in silences if start <= s.end <= highlight.start]
+        if pauses:
+            start = max(pauses)
+        scored.append((highlight.level_db, start))
+
+    chosen: List[float] = []
+    for _, start in sorted(scored, reverse=True):
+        if all(abs(start - other) >= clip_duration for other in chosen):
+            chosen.append(start)
+        if max_candidates is not None and len(chosen) >= max_candidates:
+            break
+    return sorted(chosen)
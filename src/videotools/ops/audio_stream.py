@@ -0,0 +1,93 @@
+"""Stream decoded PCM audio from ffmpeg as NumPy arrays."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterator
+
+from videotools.ffmpeg import iter_ffmpeg_output
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+if TYPE_CHECKING:  # pragma: no cover
+    import numpy
+
+# Raw PCM formats ffmpeg can write to stdout, with their NumPy dtypes.
+PCM_FORMATS = {
+    "f32le": "<f4",
+    "s16le": "<i2",
+}
+
+
+def iter_pcm_chunks(
+    input_file: Path,
+    sample_rate: int = 16000,
+    channels: int = 1,
+    chunk_frames: int = 65536,
+    sample_format: str = "f32le",
+    track: int = 0,
+    start: float | None = None,
+    duration: float | None = None,
+    copy: bool = False,
+) -> Iterator["numpy.ndarray"]:
+    """
+    Decode an audio track and yield it as fixed-size NumPy chunks.
+
+    ffmpeg resamples and remixes the track to ``sample_rate`` and
+    ``channels`` and writes raw PCM to a pipe, which is read into one
+    preallocated buffer, so memory stays constant however long the input is.
+
+    Args:
+        input_file: Source media file
+        sample_rate: Output sample rate in Hz
+        channels: Output channel count (e.g. 1 for mono, 2 for stereo)
+        chunk_frames: Sample frames per chunk; only the last chunk is shorter
+        sample_format: ``f32le`` (float32 in [-1, 1]) or ``s16le`` (int16)
+        track: Audio track index
+        start: Start time in seconds
+        duration: Maximum duration in seconds
+        copy: Yield independent arrays instead of views of the reused buffer
+
+    Yields:
+        Arrays of shape ``(frames, channels)``. Unless ``copy`` is True, each
+        array is overwritten by the next chunk.
+    """
+    if np is None:
+        raise ValueError("PCM streaming requires NumPy to be installed.")
+    if not input_file.exists():
+        raise FileNotFoundError(f"Input file not found: {input_file}")
+    if sample_format not in PCM_FORMATS:
+        raise ValueError(f"Unsupported PCM format: {sample_format}. Use f32le or s16le.")
+    if sample_rate <= 0 or channels <= 0 or chunk_frames <= 0:
+        raise ValueError("Sample rate, channels and chunk size must be positive.")
+
+    args = []
+    if start is not None:
+        args += ["-ss", str(start)]
+    args += ["-i", str(input_file)]
+    if duration is not None:
+        args += ["-t", str(duration)]
+    args += [
+        "-map",
+        f"0:a:{track}",
+        "-ac",
+        str(channels),
+        "-ar",
+        str(sample_rate),
+        "-c:a",
+        f"pcm_{sample_format}",
+        "-f",
+        sample_format,
+        "pipe:1",
+    ]
+
+    dtype = np.dtype(PCM_FORMATS[sample_format])
+    frame_bytes = dtype.itemsize * channels
+    buffer = bytearray(chunk_frames * frame_bytes)
+    samples = np.frombuffer(buffer, dtype=dtype).reshape(chunk_frames, channels)
+    for filled in iter_ffmpeg_output(args, buffer):
+        chunk = samples[: filled // frame_bytes]
+        yield chunk.copy() if copy else chunk
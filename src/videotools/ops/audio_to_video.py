@@ -4,8 +4,16 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from videotools.ffmpeg import run_ffmpeg
+from videotools.ffmpeg import ProgressCallback, run_ffmpeg, run_ffmpeg_with_progress
+from videotools.ops.probe import probe_metadata, probe_video
+from videotools.output_cache import output_cache_key, restore_output, store_output
 from videotools.paths import PROCESSED_DIR, ensure_directories
+from videotools.workspace import job_workspace
+
+# The still image is encoded once as a short clip at this frame rate and
+# length, then repeated with stream copy for the length of the audio.
+STILL_FRAME_RATE = 1
+STILL_SEGMENT_SECONDS = 10
 
 
 def audio_to_video(
@@ -17,8 +25,20 @@ def audio_to_video(
     audio_codec: str = "aac",
     audio_bitrate: str = "192k",
     pixel_format: str = "yuv420p",
+    on_progress: ProgressCallback | None = None,
+    use_cache: bool = True,
+    refresh: bool = False,
+    encode_once: bool = True,
 ) -> Path:
-    """Combine a still image with audio to create an MP4 video."""
+    """
+    Combine a still image with audio to create an MP4 video.
+
+    By default the image is encoded only once, as a short
+    :data:`STILL_FRAME_RATE` fps clip, which is then repeated with
+    ``-stream_loop`` and stream copy until the audio ends. AAC audio is
+    copied instead of re-encoded when ``audio_codec`` is ``aac``. Pass
+    ``encode_once=False`` to encode every frame of a looped image instead.
+    """
     if not audio_file.exists():
         raise FileNotFoundError(f"Audio file not found: {audio_file}")
     if not image_file.exists():
@@ -34,6 +54,125 @@ def audio_to_video(
     if output_file.suffix.lower() != ".mp4":
         raise ValueError("Output video file must end with .mp4.")
 
+    if not encode_once:
+        return _encode_looped_image(
+            audio_file,
+            image_file,
+            output_file,
+            video_codec,
+            audio_codec,
+            audio_bitrate,
+            pixel_format,
+            on_progress,
+            use_cache,
+            refresh,
+        )
+
+    source_codecs = {
+        stream.get("codec_name")
+        for stream in probe_metadata(audio_file).get("streams", [])
+        if stream.get("codec_type") == "audio"
+    }
+    if audio_codec == "aac" and source_codecs == {"aac"}:
+        audio_args = ["-c:a", "copy"]
+    else:
+        audio_args = ["-c:a", audio_codec, "-b:a", audio_bitrate]
+    segment_frames = STILL_FRAME_RATE * STILL_SEGMENT_SECONDS
+    video_args = [
+        # Even dimensions are required for 4:2:0 output.
+        "-vf",
+        "scale=trunc(iw/2)*2:trunc(ih/2)*2",
+        "-c:v",
+        video_codec,
+        "-tune",
+        "stillimage",
+        "-pix_fmt",
+        pixel_format,
+        "-g",
+        str(segment_frames),
+        # No B-frames: each repetition then starts cleanly on its keyframe.
+        "-bf",
+        "0",
+    ]
+    key_args = [
+        "-framerate",
+        str(STILL_FRAME_RATE),
+        "-t",
+        str(STILL_SEGMENT_SECONDS),
+        *video_args,
+        *audio_args,
+        "-shortest",
+        "-movflags",
+        "+faststart",
+        "-y",
+        str(output_file),
+    ]
+    cache_key = (
+        output_cache_key(key_args, [image_file, audio_file], output_file) if use_cache else None
+    )
+    if cache_key and not refresh and restore_output(cache_key, output_file):
+        return output_file
+
+    with job_workspace("stillvideo") as work_dir:
+        segment = work_dir / "still.mp4"
+        run_ffmpeg(
+            [
+                "-loop",
+                "1",
+                "-framerate",
+                str(STILL_FRAME_RATE),
+                "-i",
+                str(image_file),
+                "-t",
+                str(STILL_SEGMENT_SECONDS),
+                *video_args,
+                "-an",
+                "-y",
+                str(segment),
+            ]
+        )
+        args = [
+            "-stream_loop",
+            "-1",
+            "-i",
+            str(segment),
+            "-i",
+            str(audio_file),
+            "-map",
+            "0:v:0",
+            "-map",
+            "1:a:0",
+            "-c:v",
+            "copy",
+            *audio_args,
+            "-shortest",
+            "-movflags",
+            "+faststart",
+            "-y",
+            str(output_file),
+        ]
+        if on_progress is None:
+            run_ffmpeg(args)
+        else:
+            duration = probe_video(audio_file)["duration"]
+            run_ffmpeg_with_progress(args, on_progress, duration=duration)
+    if cache_key:
+        store_output(cache_key, output_file)
+    return output_file
+
+
+def _encode_looped_image(
+    audio_file: Path,
+    image_file: Path,
+    output_file: Path,
+    video_codec: str,
+    audio_codec: str,
+    audio_bitrate: str,
+    pixel_format: str,
+    on_progress: ProgressCallback | None,
+    use_cache: bool,
+    refresh: bool,
+) -> Path:
     args = [
         "-loop",
         "1",
@@ -55,5 +194,15 @@ def audio_to_video(
         "-y",
         str(output_file),
     ]
-    run_ffmpeg(args)
+    cache_key = output_cache_key(args, [image_file, audio_file], output_file) if use_cache else None
+    if cache_key and not refresh and restore_output(cache_key, output_file):
+        return output_file
+
+    if on_progress is None:
+        run_ffmpeg(args)
+    else:
+        duration = probe_video(audio_file)["duration"]
+        run_ffmpeg_with_progress(args, on_progress, duration=duration)
+    if cache_key:
+        store_output(cache_key, output_file)
     return output_file
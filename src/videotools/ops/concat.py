@@ -2,19 +2,152 @@
 
 from __future__ import annotations
 
+from collections import Counter
+from dataclasses import dataclass, fields
+from fractions import Fraction
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, List, Tuple
 
 from videotools.ffmpeg import run_ffmpeg
-from videotools.paths import PROCESSED_DIR, TEMP_DIR, ensure_directories
+from videotools.ops.probe import probe_metadata
+from videotools.paths import PROCESSED_DIR, ensure_directories
+from videotools.pool import apply_thread_budget, raise_for_failures, run_parallel, threads_per_job
+from videotools.workspace import job_workspace
+
+# Encoders used to conform mismatched inputs to the codec of the majority.
+CONFORM_VIDEO_ENCODERS = {
+    "h264": ["-c:v", "libx264", "-crf", "18", "-preset", "medium"],
+    "hevc": ["-c:v", "libx265", "-crf", "20", "-preset", "medium"],
+    "mpeg4": ["-c:v", "mpeg4", "-q:v", "2"],
+    "vp9": ["-c:v", "libvpx-vp9", "-crf", "30", "-b:v", "0"],
+}
+CONFORM_AUDIO_ENCODERS = {
+    "aac": ["-c:a", "aac", "-b:a", "192k"],
+    "mp3": ["-c:a", "libmp3lame", "-q:a", "2"],
+    "opus": ["-c:a", "libopus", "-b:a", "160k"],
+    "pcm_s16le": ["-c:a", "pcm_s16le"],
+}
+_TIMESCALE_SUFFIXES = {".mp4", ".m4v", ".mov"}
+# Relative difference under which two frame rates count as the same rate;
+# small enough to keep 29.97 and 30 fps apart.
+FRAME_RATE_TOLERANCE = 1e-4
+
+
+@dataclass(frozen=True)
+class StreamSignature:
+    """Stream parameters that must match for a stream-copy concat."""
+
+    video_codec: str | None = None
+    width: int | None = None
+    height: int | None = None
+    pixel_format: str | None = None
+    frame_rate: str | None = None
+    time_base: str | None = None
+    audio_codec: str | None = None
+    sample_rate: int | None = None
+    channels: int | None = None
+    channel_layout: str | None = None
+
+    @property
+    def audio(self) -> Tuple[Any, ...]:
+        return (self.audio_codec, self.sample_rate, self.channels, self.channel_layout)
+
+    def video_matches(self, other: StreamSignature) -> bool:
+        """
+        Return whether the video stream can be copied next to ``other``'s.
+
+        The timebase is left out: a stream that only differs in it is copied
+        and given the target timescale when remuxed.
+        """
+        return (self.video_codec, self.width, self.height, self.pixel_format) == (
+            other.video_codec,
+            other.width,
+            other.height,
+            other.pixel_format,
+        ) and _same_frame_rate(self.frame_rate, other.frame_rate)
+
+    def matches(self, other: StreamSignature) -> bool:
+        """Return whether the inputs can be joined as they are."""
+        return (
+            self.video_matches(other)
+            and self.time_base == other.time_base
+            and self.audio == other.audio
+        )
+
+    def differences(self, other: StreamSignature) -> List[str]:
+        """Return the names of the fields that differ from ``other``."""
+        return [
+            item.name
+            for item in fields(self)
+            if getattr(self, item.name) != getattr(other, item.name)
+            and not (
+                item.name == "frame_rate" and _same_frame_rate(self.frame_rate, other.frame_rate)
+            )
+        ]
+
+
+def stream_signature(metadata: Dict[str, Any]) -> StreamSignature:
+    """Build the signature of the first video and audio stream in ffprobe JSON."""
+    streams = metadata.get("streams", [])
+    video = next((s for s in streams if s.get("codec_type") == "video"), None)
+    audio = next((s for s in streams if s.get("codec_type") == "audio"), None)
+    values: Dict[str, Any] = {}
+    if video:
+        values.update(
+            video_codec=video.get("codec_name"),
+            width=video.get("width"),
+            height=video.get("height"),
+            pixel_format=video.get("pix_fmt"),
+            frame_rate=video.get("r_frame_rate"),
+            time_base=video.get("time_base"),
+        )
+    if audio:
+        values.update(
+            audio_codec=audio.get("codec_name"),
+            sample_rate=int(audio["sample_rate"]) if audio.get("sample_rate") else None,
+            channels=audio.get("channels"),
+            channel_layout=audio.get("channel_layout"),
+        )
+    return StreamSignature(**values)
+
+
+def concat_preflight(
+    input_files: List[Path],
+    jobs: int = 4,
+) -> Tuple[StreamSignature, List[int]]:
+    """
+    Probe inputs in parallel and check whether they can be stream-copied together.
+
+    Returns:
+        The majority stream signature and the indices of inputs that differ from it
+    """
+    results = run_parallel(probe_metadata, input_files, jobs)
+    raise_for_failures(results)
+    signatures = [stream_signature(result.value) for result in results]
+    # Ties go to the signature seen first, so the first input wins by default.
+    target = Counter(signatures).most_common(1)[0][0]
+    mismatched = [
+        index for index, signature in enumerate(signatures) if not signature.matches(target)
+    ]
+    return target, mismatched
 
 
 def concat_videos(
     input_files: List[Path],
     output_file: Path | None = None,
     output_dir: Path | None = None,
+    conform: bool = True,
+    jobs: int = 4,
 ) -> Path:
-    """Concatenate multiple video files into a single output file."""
+    """
+    Concatenate multiple video files into a single output file.
+
+    Inputs are probed first. When they share codecs, resolution, timebase and
+    audio layout they are joined with the concat demuxer and stream copy.
+    Otherwise the inputs that differ from the majority are re-encoded to match
+    it in parallel (only the mismatched streams), unless ``conform`` is False,
+    in which case a ValueError is raised.
+    """
     if not input_files:
         raise ValueError("At least one input file is required.")
 
@@ -30,31 +163,153 @@ def concat_videos(
         first_file = input_files[0]
         output_file = output_dir / f"{first_file.stem}_concat{first_file.suffix}"
 
-    TEMP_DIR.mkdir(parents=True, exist_ok=True)
-    list_path = TEMP_DIR / "concat_list.txt"
+    target, mismatched = (
+        concat_preflight(input_files, jobs) if len(input_files) > 1 else (None, [])
+    )
+    if mismatched and not conform:
+        raise ValueError(_describe_mismatch(input_files, target, mismatched))
+
+    with job_workspace("concat") as work_dir:
+        parts = list(input_files)
+        if mismatched:
+            assert target is not None
+            conformed = {
+                index: work_dir / f"conformed_{index:03d}{output_file.suffix}"
+                for index in mismatched
+            }
+            arg_lists = [
+                _conform_args(input_files[index], target, conformed[index])
+                for index in mismatched
+            ]
+            if jobs > 1:
+                threads = threads_per_job(min(jobs, len(arg_lists)))
+                arg_lists = [apply_thread_budget(args, threads) for args in arg_lists]
+            raise_for_failures(run_parallel(run_ffmpeg, arg_lists, jobs))
+            parts = [conformed.get(index, file) for index, file in enumerate(input_files)]
+
+        list_path = write_concat_list(parts, work_dir / "concat_list.txt")
+        args = [
+            "-f",
+            "concat",
+            "-safe",
+            "0",
+            "-i",
+            str(list_path),
+            "-c",
+            "copy",
+            "-y",
+            str(output_file),
+        ]
+        run_ffmpeg(args)
+    return output_file
+
+
+def write_concat_list(input_files: List[Path], list_path: Path) -> Path:
+    """Write a concat demuxer list file referencing ``input_files``."""
     list_contents = "\n".join(
         f"file '{_escape_concat_path(file.resolve())}'" for file in input_files
     )
     list_path.write_text(list_contents, encoding="utf-8")
+    return list_path
 
-    args = [
-        "-f",
-        "concat",
-        "-safe",
-        "0",
-        "-i",
-        str(list_path),
-        "-c",
-        "copy",
-        "-y",
-        str(output_file),
-    ]
+
+def _conform_args(input_file: Path, target: StreamSignature, output_file: Path) -> List[str]:
+    source = stream_signature(probe_metadata(input_file))
+    args = ["-i", str(input_file)]
+    audio_input = "0:a:0"
+    if target.audio_codec and not source.audio_codec:
+        # Pad inputs without audio with silence so every part has the same streams.
+        layout = target.channel_layout or f"{target.channels or 2}c"
+        args += ["-f", "lavfi", "-i", f"anullsrc=r={target.sample_rate or 48000}:cl={layout}"]
+        audio_input = "1:a:0"
+
+    if target.video_codec:
+        args += ["-map", "0:v:0"]
+        if source.video_matches(target):
+            args += ["-c:v", "copy"]
+            if source.time_base != target.time_base:
+                args += _timescale_args(target, output_file)
+        else:
+            args += _video_conform_args(target, output_file)
+    else:
+        args += ["-vn"]
+
+    if target.audio_codec:
+        args += ["-map", audio_input]
+        if source.audio == target.audio:
+            args += ["-c:a", "copy"]
+        else:
+            args += _audio_conform_args(target)
+        if audio_input != "0:a:0":
+            args += ["-shortest"]
+    else:
+        args += ["-an"]
+
+    return [*args, "-y", str(output_file)]
+
+
+def _video_conform_args(target: StreamSignature, output_file: Path) -> List[str]:
+    encoder_args = CONFORM_VIDEO_ENCODERS.get(target.video_codec or "")
+    if encoder_args is None:
+        raise ValueError(f"Cannot conform inputs to video codec: {target.video_codec}")
+    filters = []
+    if target.width and target.height:
+        width, height = target.width, target.height
+        filters += [
+            f"scale={width}:{height}:force_original_aspect_ratio=decrease",
+            f"pad={width}:{height}:(ow-iw)/2:(oh-ih)/2",
+            "setsar=1",
+        ]
+    if target.frame_rate and target.frame_rate != "0/0":
+        filters.append(f"fps={target.frame_rate}")
+    args = list(encoder_args)
+    if filters:
+        args += ["-vf", ",".join(filters)]
+    if target.pixel_format:
+        args += ["-pix_fmt", target.pixel_format]
+    return args + _timescale_args(target, output_file)
+
+
+def _timescale_args(target: StreamSignature, output_file: Path) -> List[str]:
+    if target.time_base and output_file.suffix.lower() in _TIMESCALE_SUFFIXES:
+        return ["-video_track_timescale", target.time_base.partition("/")[2]]
+    return []
+
+
+def _same_frame_rate(rate: str | None, other: str | None) -> bool:
+    # ffprobe spells the same rate differently across muxers (30000/1001 vs 2997/100).
+    if rate == other:
+        return True
     try:
-        run_ffmpeg(args)
-    finally:
-        if list_path.exists():
-            list_path.unlink()
-    return output_file
+        first, second = Fraction(rate or ""), Fraction(other or "")
+    except (ValueError, ZeroDivisionError):
+        return False
+    return abs(first - second) <= FRAME_RATE_TOLERANCE * second
+
+
+def _audio_conform_args(target: StreamSignature) -> List[str]:
+    encoder_args = CONFORM_AUDIO_ENCODERS.get(target.audio_codec or "")
+    if encoder_args is None:
+        raise ValueError(f"Cannot conform inputs to audio codec: {target.audio_codec}")
+    args = list(encoder_args)
+    if target.sample_rate:
+        args += ["-ar", str(target.sample_rate)]
+    if target.channels:
+        args += ["-ac", str(target.channels)]
+    return args
+
+
+def _describe_mismatch(
+    input_files: List[Path],
+    target: StreamSignature | None,
+    mismatched: List[int],
+) -> str:
+    assert target is not None
+    lines = ["Inputs cannot be stream-copied together:"]
+    for index in mismatched:
+        source = stream_signature(probe_metadata(input_files[index]))
+        lines.append(f"  {input_files[index]}: differs in {', '.join(source.differences(target))}")
+    return "\n".join(lines)
 
 
 def _escape_concat_path(path: Path) -> str:
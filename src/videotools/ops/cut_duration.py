@@ -5,7 +5,10 @@ from __future__ import annotations
 from pathlib import Path
 
 from videotools.ffmpeg import run_ffmpeg
+from videotools.keyframes import snap_cut
+from videotools.ops.smart_cut import smart_cut_clip
 from videotools.paths import PROCESSED_DIR, ensure_directories
+from videotools.seek import build_seek_args, default_seek_strategy
 from videotools.timecode import format_timecode, parse_timecode, sanitize_timecode_label
 
 
@@ -15,8 +18,29 @@ def cut_by_duration(
     duration: str,
     output_file: Path | None = None,
     output_dir: Path | None = None,
+    seek: str | None = None,
+    copy_streams: bool = False,
+    snap: bool = False,
+    smart: bool = False,
 ) -> Path:
-    """Cut a clip using start time and duration."""
+    """
+    Cut a clip using start time and duration.
+
+    ``seek`` selects where ``-ss`` is placed (see :mod:`videotools.seek`) and
+    defaults to ``hybrid`` when re-encoding and ``accurate`` for stream copy.
+
+    With ``snap`` (stream copy only) the cut is aligned to real keyframes from
+    the keyframe index; see :func:`videotools.keyframes.snap_cut`.
+
+    With ``smart`` the clip is cut frame-accurately by re-encoding only the
+    GOPs at its edges; see :func:`videotools.ops.smart_cut.smart_cut_clip`.
+    """
+    if snap and not copy_streams:
+        raise ValueError("Keyframe snapping requires stream copy mode.")
+    if smart and copy_streams:
+        raise ValueError("Smart cut cannot be combined with stream copy mode.")
+    if smart and seek is not None:
+        raise ValueError("Smart cut places its own seeks and cannot take a seek strategy.")
     if not input_file.exists():
         raise FileNotFoundError(f"Input file not found: {input_file}")
 
@@ -36,15 +60,27 @@ def cut_by_duration(
         output_filename = f"{input_stem}_clip_{start_formatted}_dur_{duration_formatted}{input_ext}"
         output_file = output_dir / output_filename
 
+    if smart:
+        return smart_cut_clip(input_file, start_seconds, duration_seconds, output_file)
+
+    if snap:
+        start_seconds, duration_seconds = snap_cut(input_file, start_seconds, duration_seconds)
+        if seek is None:
+            seek = "fast"
+
+    input_seek, output_seek = build_seek_args(
+        start_seconds, seek or default_seek_strategy(copy_streams)
+    )
     args = [
+        *input_seek,
         "-i",
         str(input_file),
-        "-ss",
-        str(start_seconds),
+        *output_seek,
         "-t",
         str(duration_seconds),
-        "-y",
-        str(output_file),
     ]
+    if copy_streams:
+        args += ["-c", "copy"]
+    args += ["-y", str(output_file)]
     run_ffmpeg(args)
     return output_file
@@ -6,7 +6,11 @@ from pathlib import Path
 from typing import List
 
 from videotools.ffmpeg import run_ffmpeg
+from videotools.keyframes import snap_cut
+from videotools.ops.smart_cut import smart_cut_clip
 from videotools.paths import PROCESSED_DIR, ensure_directories
+from videotools.pool import apply_thread_budget, raise_for_failures, run_parallel, threads_per_job
+from videotools.seek import build_seek_args, default_seek_strategy, validate_seek_strategy
 from videotools.timecode import parse_timecode, sanitize_timecode_label
 
 
@@ -16,8 +20,35 @@ def cut_fixed_clips(
     duration: float = 60.0,
     output_dir: Path | None = None,
     copy_streams: bool = False,
+    single_pass: bool = False,
+    jobs: int = 1,
+    seek: str | None = None,
+    snap: bool = False,
+    smart: bool = False,
 ) -> List[Path]:
-    """Cut fixed-duration clips from specified timestamps."""
+    """
+    Cut fixed-duration clips from specified timestamps.
+
+    With ``single_pass`` every clip is written by one ffmpeg invocation that
+    reads and decodes the source once and fans out to one output per
+    timestamp, instead of running ffmpeg once per clip.
+
+    With ``jobs`` greater than one, clips are cut by concurrent ffmpeg
+    processes that share the available cores through ``-threads``.
+
+    ``seek`` selects where ``-ss`` is placed (see :mod:`videotools.seek`);
+    it defaults to ``hybrid`` when re-encoding and ``accurate`` for stream
+    copy. Single-pass mode shares one input between every clip and always
+    trims on the output side.
+
+    With ``snap`` (stream copy only) each clip is aligned to real keyframes
+    from the keyframe index: the start moves back to the previous keyframe
+    and the end forward to the next one. Use
+    :func:`videotools.keyframes.snap_cut` to report the actual boundaries.
+
+    With ``smart`` each clip is cut frame-accurately by re-encoding only the
+    GOPs at its edges (see :func:`videotools.ops.smart_cut.smart_cut_clip`).
+    """
     if not input_file.exists():
         raise FileNotFoundError(f"Input file not found: {input_file}")
 
@@ -26,17 +57,73 @@ def cut_fixed_clips(
         output_dir = PROCESSED_DIR
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    output_files: List[Path] = []
+    if snap and not copy_streams:
+        raise ValueError("Keyframe snapping requires stream copy mode.")
+    if smart and (copy_streams or single_pass):
+        raise ValueError("Smart cut cannot be combined with stream copy or single-pass mode.")
+    if smart and seek is not None:
+        raise ValueError("Smart cut places its own seeks and cannot take a seek strategy.")
+    if seek is None:
+        if single_pass:
+            seek = "accurate"
+        elif snap:
+            # Snapped starts sit exactly on keyframes, so an input-side seek lands on them.
+            seek = "fast"
+        else:
+            seek = default_seek_strategy(copy_streams)
+    seek = validate_seek_strategy(seek)
+    if single_pass and seek != "accurate":
+        raise ValueError("Single-pass mode only supports the accurate seek strategy.")
+
+    clips = []
     for timestamp in timestamps:
         start_seconds = parse_timecode(timestamp)
-        timestamp_label = sanitize_timecode_label(timestamp)
-        output_file = output_dir / f"{input_file.stem}_clip_{timestamp_label}{input_file.suffix}"
+        clip_duration = duration
+        if snap:
+            start_seconds, clip_duration = snap_cut(input_file, start_seconds, duration)
+        clips.append(
+            (start_seconds, clip_duration, _clip_output_path(input_file, output_dir, timestamp))
+        )
 
-        args = ["-i", str(input_file), "-ss", str(start_seconds), "-t", str(duration)]
-        if copy_streams:
-            args += ["-c", "copy"]
-        args += ["-y", str(output_file)]
+    if smart:
+        threads = threads_per_job(jobs) if jobs > 1 else None
+        results = run_parallel(
+            lambda clip: smart_cut_clip(input_file, *clip, threads=threads), clips, jobs
+        )
+        raise_for_failures(results)
+        return [output_file for _, _, output_file in clips]
+
+    if single_pass:
+        args = ["-i", str(input_file)]
+        for start_seconds, clip_duration, output_file in clips:
+            args += ["-ss", str(start_seconds)]
+            args += _clip_output_args(clip_duration, copy_streams)
+            args += ["-y", str(output_file)]
         run_ffmpeg(args)
-        output_files.append(output_file)
+        return [output_file for _, _, output_file in clips]
+
+    arg_lists: List[List[str]] = []
+    for start_seconds, clip_duration, output_file in clips:
+        input_seek, output_seek = build_seek_args(start_seconds, seek)
+        args = [*input_seek, "-i", str(input_file), *output_seek]
+        args += _clip_output_args(clip_duration, copy_streams)
+        args += ["-y", str(output_file)]
+        arg_lists.append(args)
+
+    if jobs > 1:
+        threads = threads_per_job(jobs)
+        arg_lists = [apply_thread_budget(args, threads) for args in arg_lists]
+    raise_for_failures(run_parallel(run_ffmpeg, arg_lists, jobs))
+    return [output_file for _, _, output_file in clips]
+
+
+def _clip_output_path(input_file: Path, output_dir: Path, timestamp: str) -> Path:
+    timestamp_label = sanitize_timecode_label(timestamp)
+    return output_dir / f"{input_file.stem}_clip_{timestamp_label}{input_file.suffix}"
+
 
-    return output_files
+def _clip_output_args(duration: float, copy_streams: bool) -> List[str]:
+    args = ["-t", str(duration)]
+    if copy_streams:
+        args += ["-c", "copy"]
+    return args
@@ -3,18 +3,43 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Any, Dict, List, Sequence
 
 from videotools.ffmpeg import run_ffmpeg
+from videotools.ops.probe import probe_metadata
 from videotools.paths import PROCESSED_DIR, ensure_directories
 
+# Encoder arguments used when an output has to be transcoded, keyed by suffix.
+AUDIO_FORMAT_ENCODERS = {
+    ".wav": ["-c:a", "pcm_s16le"],
+    ".mp3": ["-c:a", "libmp3lame", "-q:a", "2"],
+    ".m4a": ["-c:a", "aac", "-b:a", "192k"],
+    ".opus": ["-c:a", "libopus", "-b:a", "128k"],
+}
+
+# Source codecs that can be stream-copied into each container.
+STREAM_COPY_CODECS = {
+    ".wav": {"pcm_s16le"},
+    ".mp3": {"mp3"},
+    ".m4a": {"aac", "alac"},
+    ".opus": {"opus"},
+}
+
 
 def extract_audio(
     input_file: Path,
     output_file: Path | None = None,
     output_dir: Path | None = None,
     audio_format: str = "wav",
+    track: int = 0,
+    allow_copy: bool = True,
 ) -> Path:
-    """Extract audio track from a video file into WAV or MP3."""
+    """
+    Extract an audio track from a video file into WAV, MP3, M4A or Opus.
+
+    The track is stream-copied when its codec fits the target container
+    (e.g. AAC into .m4a) unless ``allow_copy`` is False.
+    """
     if not input_file.exists():
         raise FileNotFoundError(f"Input file not found: {input_file}")
 
@@ -25,14 +50,98 @@ def extract_audio(
         output_dir.mkdir(parents=True, exist_ok=True)
         output_file = output_dir / f"{input_file.stem}.{audio_format.lower()}"
 
-    suffix = output_file.suffix.lower()
-    if suffix == ".mp3":
-        audio_args = ["-vn", "-acodec", "libmp3lame", "-q:a", "2"]
-    elif suffix == ".wav":
-        audio_args = ["-vn", "-acodec", "pcm_s16le"]
-    else:
-        raise ValueError("Output audio file must end with .wav or .mp3.")
-
-    args = ["-i", str(input_file), *audio_args, "-y", str(output_file)]
+    _validate_suffix(output_file.suffix)
+    streams = _audio_streams(input_file)
+    args = ["-i", str(input_file)]
+    args += _track_output_args(input_file, streams, track, output_file, allow_copy)
     run_ffmpeg(args)
     return output_file
+
+
+def extract_audio_tracks(
+    input_file: Path,
+    formats: Sequence[str] = ("wav",),
+    tracks: Sequence[int] | None = None,
+    output_dir: Path | None = None,
+    allow_copy: bool = True,
+) -> List[Path]:
+    """
+    Extract several audio tracks into several formats with a single ffmpeg run.
+
+    The input is read and demuxed once; each (track, format) pair becomes one
+    output of the same command. Outputs are named ``<stem>.<format>``, or
+    ``<stem>_a<track>.<format>`` when more than one track is extracted.
+
+    Args:
+        input_file: Source media file
+        formats: Output formats (wav, mp3, m4a, opus)
+        tracks: Audio track indices to extract (default: all audio tracks)
+        output_dir: Output directory (default: processed directory)
+        allow_copy: Stream-copy tracks whose codec fits the target container
+
+    Returns:
+        Output paths, ordered by track and then by format
+    """
+    if not input_file.exists():
+        raise FileNotFoundError(f"Input file not found: {input_file}")
+    if not formats:
+        raise ValueError("At least one output format is required.")
+    suffixes = [f".{audio_format.lower().lstrip('.')}" for audio_format in formats]
+    for suffix in suffixes:
+        _validate_suffix(suffix)
+
+    streams = _audio_streams(input_file)
+    tracks = list(range(len(streams)) if tracks is None else tracks)
+    if not tracks:
+        raise ValueError("At least one audio track is required.")
+
+    ensure_directories()
+    if output_dir is None:
+        output_dir = PROCESSED_DIR
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    args = ["-i", str(input_file)]
+    outputs: List[Path] = []
+    for track in tracks:
+        for suffix in suffixes:
+            label = f"_a{track}" if len(tracks) > 1 else ""
+            output_file = output_dir / f"{input_file.stem}{label}{suffix}"
+            args += _track_output_args(input_file, streams, track, output_file, allow_copy)
+            outputs.append(output_file)
+    run_ffmpeg(args)
+    return outputs
+
+
+def _validate_suffix(suffix: str) -> None:
+    if suffix.lower() not in AUDIO_FORMAT_ENCODERS:
+        supported = ", ".join(sorted(AUDIO_FORMAT_ENCODERS))
+        raise ValueError(f"Output audio file must end with one of: {supported}.")
+
+
+def _audio_streams(input_file: Path) -> List[Dict[str, Any]]:
+    streams = [
+        stream
+        for stream in probe_metadata(input_file).get("streams", [])
+        if stream.get("codec_type") == "audio"
+    ]
+    if not streams:
+        raise ValueError(f"Input file has no audio stream: {input_file}")
+    return streams
+
+
+def _track_output_args(
+    input_file: Path,
+    streams: List[Dict[str, Any]],
+    track: int,
+    output_file: Path,
+    allow_copy: bool,
+) -> List[str]:
+    if not 0 <= track < len(streams):
+        raise ValueError(f"{input_file} has no audio track {track} ({len(streams)} found).")
+    suffix = output_file.suffix.lower()
+    codec = streams[track].get("codec_name")
+    if allow_copy and codec in STREAM_COPY_CODECS[suffix]:
+        codec_args = ["-c:a", "copy"]
+    else:
+        codec_args = AUDIO_FORMAT_ENCODERS[suffix]
+    return ["-map", f"0:a:{track}", *codec_args, "-y", str(output_file)]
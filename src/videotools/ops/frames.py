@@ -0,0 +1,127 @@
+"""Stream decoded video frames from ffmpeg as NumPy arrays."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Tuple
+
+from videotools.ffmpeg import iter_ffmpeg_output
+from videotools.ops.probe import display_size, probe_metadata
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+if TYPE_CHECKING:  # pragma: no cover
+    import numpy
+
+# Raw pixel formats ffmpeg can write to stdout, with their channel counts.
+FRAME_PIXEL_FORMATS = {
+    "rgb24": 3,
+    "bgr24": 3,
+    "gray": 1,
+}
+
+
+def iter_frames(
+    input_file: Path,
+    pixel_format: str = "rgb24",
+    width: int | None = None,
+    height: int | None = None,
+    fps: float | None = None,
+    start: float | None = None,
+    duration: float | None = None,
+    track: int = 0,
+    copy: bool = False,
+) -> Iterator["numpy.ndarray"]:
+    """
+    Decode a video stream and yield its frames as NumPy arrays.
+
+    ffmpeg writes ``rawvideo`` to a pipe, which is read straight into one
+    preallocated frame buffer, so no image files are written and no memory
+    is allocated per frame.
+
+    Args:
+        input_file: Source media file
+        pixel_format: ``rgb24``, ``bgr24`` or ``gray``
+        width: Output width; with only one of ``width``/``height`` the other
+            keeps the display aspect ratio (rounded to an even number)
+        height: Output height
+        fps: Resample to this frame rate (e.g. 1 for one frame per second)
+        start: Start time in seconds
+        duration: Maximum duration in seconds
+        track: Video track index
+        copy: Yield independent arrays instead of views of the reused buffer
+
+    Yields:
+        Arrays of shape ``(height, width, 3)`` for RGB/BGR or
+        ``(height, width)`` for gray, as ``uint8``. Unless ``copy`` is True,
+        each array is overwritten by the next frame.
+    """
+    if np is None:
+        raise ValueError("Frame streaming requires NumPy to be installed.")
+    if not input_file.exists():
+        raise FileNotFoundError(f"Input file not found: {input_file}")
+    if pixel_format not in FRAME_PIXEL_FORMATS:
+        raise ValueError(f"Unsupported pixel format: {pixel_format}. Use rgb24, bgr24 or gray.")
+    if fps is not None and fps <= 0:
+        raise ValueError("Frame rate must be positive.")
+    if (width is not None and width <= 0) or (height is not None and height <= 0):
+        raise ValueError("Frame width and height must be positive.")
+
+    streams = [
+        stream
+        for stream in probe_metadata(input_file).get("streams", [])
+        if stream.get("codec_type") == "video"
+    ]
+    if track >= len(streams):
+        raise ValueError(f"Input file has no video track {track}: {input_file}")
+    out_width, out_height = _output_size(streams[track], width, height)
+
+    filters = []
+    if fps is not None:
+        filters.append(f"fps={fps}")
+    if (width, height) != (None, None):
+        filters.append(f"scale={out_width}:{out_height}")
+
+    args = []
+    if start is not None:
+        args += ["-ss", str(start)]
+    args += ["-i", str(input_file)]
+    if duration is not None:
+        args += ["-t", str(duration)]
+    args += ["-map", f"0:v:{track}", "-an", "-sn"]
+    if filters:
+        args += ["-vf", ",".join(filters)]
+    args += ["-pix_fmt", pixel_format, "-f", "rawvideo", "pipe:1"]
+
+    channels = FRAME_PIXEL_FORMATS[pixel_format]
+    shape: Tuple[int, ...] = (out_height, out_width, channels)
+    if channels == 1:
+        shape = (out_height, out_width)
+    buffer = bytearray(out_width * out_height * channels)
+    frame = np.frombuffer(buffer, dtype=np.uint8).reshape(shape)
+    for filled in iter_ffmpeg_output(args, buffer):
+        if filled < len(buffer):
+            # A truncated trailing frame is dropped, but the output is still
+            # read to the end so a failed ffmpeg run raises FFmpegError.
+            continue
+        yield frame.copy() if copy else frame
+
+
+def _output_size(
+    stream: Dict[str, Any], width: int | None, height: int | None
+) -> Tuple[int, int]:
+    source_width, source_height = display_size(stream)
+    if not source_width or not source_height:
+        raise ValueError("Could not determine the video frame size.")
+
+    if width is None and height is None:
+        return source_width, source_height
+    if width is None:
+        width = max(2, round(height * source_width / source_height / 2) * 2)
+    if height is None:
+        height = max(2, round(width * source_height / source_width / 2) * 2)
+    return width, height
+
@@ -0,0 +1,222 @@
+"""Encode several renditions of a video from a single decode."""
+
+from __future__ import annotations
+
+import dataclasses
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Sequence
+
+from videotools.ffmpeg import ProgressCallback, run_ffmpeg, run_ffmpeg_with_progress
+from videotools.ops.probe import probe_video
+from videotools.ops.transcode import (
+    TRANSCODE_AUDIO_ENCODER,
+    TRANSCODE_CRF,
+    TRANSCODE_PRESET,
+    TRANSCODE_VIDEO_ENCODER,
+)
+from videotools.paths import PROCESSED_DIR, ensure_directories
+from videotools.presets import load_preset_file
+
+
+@dataclass(frozen=True)
+class Rendition:
+    """One output of an encoding ladder."""
+
+    name: str
+    height: int
+    video_bitrate: str
+    audio_bitrate: str = "128k"
+
+
+DEFAULT_LADDER = (
+    Rendition("1080p", 1080, "5000k", "192k"),
+    Rendition("720p", 720, "2800k", "128k"),
+    Rendition("480p", 480, "1400k", "96k"),
+)
+
+
+def load_ladder_preset(preset_path: Path) -> List[Rendition]:
+    """
+    Load renditions from a JSON/YAML preset.
+
+    The preset holds a ``renditions`` list of objects with ``name``,
+    ``height``, ``video_bitrate`` and optionally ``audio_bitrate``.
+    """
+    data = load_preset_file(preset_path)
+    entries = data.get("renditions")
+    if not isinstance(entries, list) or not entries:
+        raise ValueError("Preset field 'renditions' must be a non-empty list.")
+
+    renditions = []
+    for entry in entries:
+        if not isinstance(entry, dict):
+            raise ValueError("Each rendition must be an object.")
+        try:
+            renditions.append(
+                Rendition(
+                    name=str(entry["name"]),
+                    height=int(entry["height"]),
+                    video_bitrate=str(entry["video_bitrate"]),
+                    audio_bitrate=str(entry.get("audio_bitrate", "128k")),
+                )
+            )
+        except KeyError as exc:
+            raise ValueError(f"Rendition is missing field {exc}.") from exc
+    return renditions
+
+
+def encode_ladder(
+    input_file: Path,
+    renditions: Sequence[Rendition] = DEFAULT_LADDER,
+    output_dir: Path | None = None,
+    hls: bool = False,
+    segment_seconds: float = 6.0,
+    gop_seconds: float = 2.0,
+    crf: int = TRANSCODE_CRF,
+    preset: str = TRANSCODE_PRESET,
+    on_progress: ProgressCallback | None = None,
+) -> List[Path]:
+    """
+    Encode H.264/AAC renditions in one ffmpeg process.
+
+    The source is decoded once and fanned out with ``split`` and ``scale`` to
+    one encoder per rendition, using the transcode encoder settings capped at
+    each rendition's bitrate. All renditions share a fixed GOP, so their
+    keyframes line up for adaptive streaming. Renditions taller than the
+    source are skipped (the smallest one is kept at source height if none
+    fit). Sizes follow the display orientation of rotated sources.
+
+    With ``hls`` each rendition is written as an HLS playlist with
+    ``segment_seconds`` segments under ``<stem>_hls/``, plus a
+    ``master.m3u8`` listing them.
+
+    Returns:
+        The MP4 files, or the master playlist followed by the variant playlists
+    """
+    if not input_file.exists():
+        raise FileNotFoundError(f"Input file not found: {input_file}")
+    if not renditions:
+        raise ValueError("At least one rendition is required.")
+    if len({rendition.name for rendition in renditions}) != len(renditions):
+        raise ValueError("Rendition names must be unique.")
+    if segment_seconds <= 0 or gop_seconds <= 0:
+        raise ValueError("Segment and GOP lengths must be positive.")
+    for rendition in renditions:
+        if rendition.height <= 0:
+            raise ValueError(f"Rendition height must be positive: {rendition.name}")
+        _bitrate_bps(rendition.video_bitrate)
+        _bitrate_bps(rendition.audio_bitrate)
+
+    metadata = probe_video(input_file)
+    source_width, source_height = (
+        int(value) for value in metadata["display_resolution"].split("x")
+    )
+    if not source_width or not source_height:
+        raise ValueError(f"Input file has no video stream: {input_file}")
+    selected = [rendition for rendition in renditions if rendition.height <= source_height]
+    if not selected:
+        smallest = min(renditions, key=lambda rendition: rendition.height)
+        selected = [dataclasses.replace(smallest, height=source_height)]
+    gop = max(1, round((metadata["fps"] or 25.0) * gop_seconds))
+    has_audio = metadata["audio_codec"] != "unknown"
+
+    ensure_directories()
+    if output_dir is None:
+        output_dir = PROCESSED_DIR
+    if hls:
+        output_dir = output_dir / f"{input_file.stem}_hls"
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    sizes = [
+        (_even(source_width * rendition.height / source_height), rendition.height)
+        for rendition in selected
+    ]
+    labels = [f"v{index}" for index in range(len(selected))]
+    if len(selected) == 1:
+        graph = [f"[0:v:0]scale={sizes[0][0]}:{sizes[0][1]}[out0]"]
+    else:
+        graph = [f"[0:v:0]split={len(selected)}{''.join(f'[{label}]' for label in labels)}"]
+        graph += [
+            f"[{label}]scale={width}:{height}[out{index}]"
+            for index, (label, (width, height)) in enumerate(zip(labels, sizes))
+        ]
+
+    args: List[str] = ["-i", str(input_file), "-filter_complex", ";".join(graph)]
+    outputs: List[Path] = []
+    for index, rendition in enumerate(selected):
+        args += ["-map", f"[out{index}]"]
+        if has_audio:
+            args += ["-map", "0:a:0"]
+        args += [
+            "-c:v",
+            TRANSCODE_VIDEO_ENCODER,
+            "-preset",
+            preset,
+            "-crf",
+            str(crf),
+            "-maxrate",
+            rendition.video_bitrate,
+            "-bufsize",
+            str(2 * _bitrate_bps(rendition.video_bitrate)),
+            "-g",
+            str(gop),
+            "-keyint_min",
+            str(gop),
+            "-sc_threshold",
+            "0",
+            "-pix_fmt",
+            "yuv420p",
+        ]
+        if has_audio:
+            args += ["-c:a", TRANSCODE_AUDIO_ENCODER, "-b:a", rendition.audio_bitrate]
+        if hls:
+            output_file = output_dir / f"{rendition.name}.m3u8"
+            args += [
+                "-f",
+                "hls",
+                "-hls_time",
+                str(segment_seconds),
+                "-hls_playlist_type",
+                "vod",
+                "-hls_segment_filename",
+                str(output_dir / f"{rendition.name}_%05d.ts"),
+            ]
+        else:
+            output_file = output_dir / f"{input_file.stem}_{rendition.name}.mp4"
+            args += ["-movflags", "+faststart"]
+        args += ["-y", str(output_file)]
+        outputs.append(output_file)
+
+    if on_progress is None:
+        run_ffmpeg(args)
+    else:
+        run_ffmpeg_with_progress(args, on_progress, duration=metadata["duration"])
+
+    if hls:
+        master = output_dir / "master.m3u8"
+        lines = ["#EXTM3U", "#EXT-X-VERSION:3"]
+        for rendition, (width, height), playlist in zip(selected, sizes, outputs):
+            bandwidth = _bitrate_bps(rendition.video_bitrate)
+            if has_audio:
+                bandwidth += _bitrate_bps(rendition.audio_bitrate)
+            lines.append(f"#EXT-X-STREAM-INF:BANDWIDTH={bandwidth},RESOLUTION={width}x{height}")
+            lines.append(playlist.name)
+        master.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        outputs.insert(0, master)
+    return outputs
+
+
+def _even(value: float) -> int:
+    return max(2, round(value / 2) * 2)
+
+
+def _bitrate_bps(bitrate: str) -> int:
+    units = {"k": 1_000, "m": 1_000_000}
+    value = bitrate.strip().lower()
+    try:
+        if value and value[-1] in units:
+            return int(float(value[:-1]) * units[value[-1]])
+        return int(float(value))
+    except ValueError as exc:
+        raise ValueError(f"Invalid bitrate: {bitrate}") from exc
@@ -0,0 +1,108 @@
+"""Measure integrated loudness with ffmpeg's loudnorm filter."""
+
+from __future__ import annotations
+
+import json
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+from videotools.cache import get_cached, put_cached
+from videotools.ffmpeg import FFmpegError, run_ffmpeg_analysis
+from videotools.ops.probe import MEDIA_EXTENSIONS
+from videotools.pool import JobResult, run_parallel
+
+LOUDNESS_CACHE_NAMESPACE = "loudness"
+
+# ffmpeg's own loudnorm defaults (EBU R128 broadcast targets).
+DEFAULT_TARGET_I = -24.0
+DEFAULT_TARGET_TP = -2.0
+DEFAULT_TARGET_LRA = 7.0
+
+_MEASUREMENT_KEYS = ("input_i", "input_tp", "input_lra", "input_thresh")
+_JSON_BLOCK = re.compile(r"\{[^{}]*\"input_i\"[^{}]*\}", re.DOTALL)
+
+
+def measure_loudness(input_file: Path, use_cache: bool = True) -> Dict[str, float]:
+    """
+    Run the loudnorm measurement pass and return the input loudness statistics.
+
+    Returns ``input_i`` (LUFS), ``input_tp`` (dBTP), ``input_lra`` (LU) and
+    ``input_thresh`` (LUFS). The values describe the source only, so they are
+    cached per file and reused for any normalization target.
+    """
+    if not input_file.exists():
+        raise FileNotFoundError(f"Input file not found: {input_file}")
+
+    if use_cache:
+        cached = get_cached(LOUDNESS_CACHE_NAMESPACE, input_file)
+        if cached is not None:
+            return cached
+
+    log = run_ffmpeg_analysis(
+        [
+            "-i",
+            str(input_file),
+            "-map",
+            "0:a:0",
+            "-af",
+            "loudnorm=print_format=json",
+            "-f",
+            "null",
+            "-",
+        ]
+    )
+    measurement = _parse_loudnorm_json(log)
+    put_cached(LOUDNESS_CACHE_NAMESPACE, input_file, measurement)
+    return measurement
+
+
+def scan_loudness(
+    paths: Iterable[Path],
+    jobs: int = 4,
+    use_cache: bool = True,
+) -> List[JobResult]:
+    """Measure every file (and every media file under each directory) in parallel."""
+    media_files: List[Path] = []
+    for path in paths:
+        if path.is_dir():
+            media_files += sorted(
+                item
+                for item in path.rglob("*")
+                if item.is_file() and item.suffix.lower() in MEDIA_EXTENSIONS
+            )
+        else:
+            media_files.append(path)
+    return run_parallel(
+        lambda media: measure_loudness(media, use_cache=use_cache), media_files, jobs
+    )
+
+
+def loudnorm_filter(
+    target_i: float = DEFAULT_TARGET_I,
+    target_tp: float = DEFAULT_TARGET_TP,
+    target_lra: float = DEFAULT_TARGET_LRA,
+    measurement: Dict[str, float] | None = None,
+) -> str:
+    """Build a loudnorm filter; with a measurement it runs in linear (two-pass) mode."""
+    options = [f"I={target_i}", f"TP={target_tp}", f"LRA={target_lra}"]
+    if measurement is not None:
+        options += [
+            f"measured_I={measurement['input_i']}",
+            f"measured_TP={measurement['input_tp']}",
+            f"measured_LRA={measurement['input_lra']}",
+            f"measured_thresh={measurement['input_thresh']}",
+            "linear=true",
+        ]
+    return "loudnorm=" + ":".join(options)
+
+
+def _parse_loudnorm_json(log: str) -> Dict[str, float]:
+    matches = _JSON_BLOCK.findall(log)
+    if not matches:
+        raise FFmpegError("loudnorm did not report a measurement (does the input have audio?).")
+    data = json.loads(matches[-1])
+    try:
+        return {key: float(data[key]) for key in _MEASUREMENT_KEYS}
+    except (KeyError, ValueError) as exc:
+        raise FFmpegError(f"Unexpected loudnorm measurement: {data}") from exc
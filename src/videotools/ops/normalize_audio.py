@@ -3,17 +3,61 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Any, Dict, List
 
-from videotools.ffmpeg import run_ffmpeg
+from videotools.ffmpeg import ProgressCallback, run_ffmpeg, run_ffmpeg_with_progress
+from videotools.ops.loudness import (
+    DEFAULT_TARGET_I,
+    DEFAULT_TARGET_LRA,
+    DEFAULT_TARGET_TP,
+    loudnorm_filter,
+    measure_loudness,
+)
+from videotools.ops.probe import probe_metadata, probe_video
+from videotools.output_cache import output_cache_key, restore_output, store_output
 from videotools.paths import PROCESSED_DIR, ensure_directories
 
+# Encoders that re-create the source audio codec after loudness normalization.
+AUDIO_ENCODERS = {
+    "aac": "aac",
+    "ac3": "ac3",
+    "alac": "alac",
+    "eac3": "eac3",
+    "flac": "flac",
+    "mp2": "mp2",
+    "mp3": "libmp3lame",
+    "opus": "libopus",
+    "pcm_s16le": "pcm_s16le",
+    "pcm_s24le": "pcm_s24le",
+    "pcm_f32le": "pcm_f32le",
+    "vorbis": "libvorbis",
+}
+
 
 def normalize_audio(
     input_file: Path,
     output_file: Path | None = None,
     output_dir: Path | None = None,
+    on_progress: ProgressCallback | None = None,
+    use_cache: bool = True,
+    refresh: bool = False,
+    two_pass: bool = False,
+    target_i: float = DEFAULT_TARGET_I,
+    target_tp: float = DEFAULT_TARGET_TP,
+    target_lra: float = DEFAULT_TARGET_LRA,
 ) -> Path:
-    """Normalize audio loudness using ffmpeg loudnorm filter."""
+    """
+    Normalize audio loudness using ffmpeg loudnorm filter.
+
+    When the output keeps the input's container, every non-audio stream
+    (video, subtitles, data) is stream-copied and each audio stream is
+    re-encoded with the source codec, bitrate and sample rate.
+
+    With ``two_pass`` the source loudness is measured first (or taken from the
+    loudness cache) and the second pass applies linear normalization to the
+    target integrated loudness ``target_i`` (LUFS), true peak ``target_tp``
+    (dBTP) and loudness range ``target_lra`` (LU).
+    """
     if not input_file.exists():
         raise FileNotFoundError(f"Input file not found: {input_file}")
 
@@ -24,6 +68,57 @@ def normalize_audio(
         output_dir.mkdir(parents=True, exist_ok=True)
         output_file = output_dir / f"{input_file.stem}_normalized{input_file.suffix}"
 
-    args = ["-i", str(input_file), "-af", "loudnorm", "-y", str(output_file)]
-    run_ffmpeg(args)
+    audio_streams = [
+        stream
+        for stream in probe_metadata(input_file).get("streams", [])
+        if stream.get("codec_type") == "audio"
+    ]
+    if not audio_streams:
+        raise ValueError(f"Input file has no audio stream: {input_file}")
+
+    measurement = None
+    if two_pass:
+        measurement = measure_loudness(input_file, use_cache=use_cache)
+
+    args = ["-i", str(input_file)]
+    if output_file.suffix.lower() == input_file.suffix.lower():
+        args += ["-map", "0", "-c", "copy"]
+        for index, stream in enumerate(audio_streams):
+            # The measurement covers the first audio stream only.
+            stream_filter = loudnorm_filter(
+                target_i, target_tp, target_lra, measurement if index == 0 else None
+            )
+            args += [f"-filter:a:{index}", stream_filter]
+            args += _audio_encoder_args(index, stream)
+    else:
+        # A different container may not hold the source streams; let ffmpeg
+        # pick streams and codecs but keep the sample rate (loudnorm upsamples).
+        args += ["-af", loudnorm_filter(target_i, target_tp, target_lra, measurement)]
+        if audio_streams[0].get("sample_rate"):
+            args += ["-ar", str(audio_streams[0]["sample_rate"])]
+    args += ["-y", str(output_file)]
+    cache_key = output_cache_key(args, [input_file], output_file) if use_cache else None
+    if cache_key and not refresh and restore_output(cache_key, output_file):
+        return output_file
+
+    if on_progress is None:
+        run_ffmpeg(args)
+    else:
+        duration = probe_video(input_file)["duration"]
+        run_ffmpeg_with_progress(args, on_progress, duration=duration)
+    if cache_key:
+        store_output(cache_key, output_file)
     return output_file
+
+
+def _audio_encoder_args(index: int, stream: Dict[str, Any]) -> List[str]:
+    codec = stream.get("codec_name", "")
+    encoder = AUDIO_ENCODERS.get(codec)
+    if encoder is None:
+        raise ValueError(f"Cannot re-encode audio codec after normalization: {codec}")
+    args = [f"-c:a:{index}", encoder]
+    if stream.get("bit_rate") and not codec.startswith("pcm_") and codec not in ("flac", "alac"):
+        args += [f"-b:a:{index}", str(stream["bit_rate"])]
+    if stream.get("sample_rate"):
+        args += [f"-ar:a:{index}", str(stream["sample_rate"])]
+    return args
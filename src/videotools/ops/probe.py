@@ -4,22 +4,55 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Tuple
 
+from videotools.cache import get_cached, put_cached
 from videotools.ffmpeg import run_ffprobe
+from videotools.pool import JobResult, run_parallel
 
+PROBE_CACHE_NAMESPACE = "probe"
 
-def probe_video(input_file: Path) -> Dict[str, Any]:
-    """Return metadata for a video file."""
+MEDIA_EXTENSIONS = {
+    ".avi",
+    ".flv",
+    ".m2ts",
+    ".m4a",
+    ".m4v",
+    ".mkv",
+    ".mov",
+    ".mp3",
+    ".mp4",
+    ".mts",
+    ".ogg",
+    ".opus",
+    ".ts",
+    ".wav",
+    ".webm",
+    ".wmv",
+}
+
+
+def probe_metadata(input_file: Path, use_cache: bool = True) -> Dict[str, Any]:
+    """
+    Return the full ffprobe stream/format JSON for a media file.
+
+    Results are cached on disk keyed by the file's resolved path, size, mtime
+    and inode; pass ``use_cache=False`` to always run ffprobe.
+    """
     if not input_file.exists():
         raise FileNotFoundError(f"Input file not found: {input_file}")
 
+    if use_cache:
+        cached = get_cached(PROBE_CACHE_NAMESPACE, input_file)
+        if cached is not None:
+            return cached
+
     output = run_ffprobe(
         [
             "-v",
             "error",
-            "-show_entries",
-            "format=duration:stream=codec_type,codec_name,width,height,r_frame_rate",
+            "-show_format",
+            "-show_streams",
             "-of",
             "json",
             str(input_file),
@@ -27,6 +60,19 @@ def probe_video(input_file: Path) -> Dict[str, Any]:
         capture_output=True,
     )
     data = json.loads(output or "{}")
+    put_cached(PROBE_CACHE_NAMESPACE, input_file, data)
+    return data
+
+
+def probe_video(input_file: Path, use_cache: bool = True) -> Dict[str, Any]:
+    """
+    Return metadata for a video file.
+
+    ``resolution`` is the coded frame size; ``display_resolution`` swaps it
+    for streams rotated by 90 or 270 degrees, matching the frames ffmpeg
+    produces with its default autorotation.
+    """
+    data = probe_metadata(input_file, use_cache=use_cache)
     streams = data.get("streams", [])
     format_info = data.get("format", {})
 
@@ -38,15 +84,42 @@ def probe_video(input_file: Path) -> Dict[str, Any]:
     height = video_stream.get("height", 0)
     fps = _parse_frame_rate(video_stream.get("r_frame_rate", "0"))
 
+    display_width, display_height = display_size(video_stream)
+
     return {
         "duration": duration,
         "resolution": f"{width}x{height}",
+        "display_resolution": f"{display_width}x{display_height}",
         "fps": fps,
         "video_codec": video_stream.get("codec_name", "unknown"),
         "audio_codec": audio_stream.get("codec_name", "unknown"),
+        "pixel_format": video_stream.get("pix_fmt", "unknown"),
     }
 
 
+def display_size(stream: Dict[str, Any]) -> Tuple[int, int]:
+    """Return the width and height of a video stream as ffmpeg decodes it."""
+    width = int(stream.get("width", 0))
+    height = int(stream.get("height", 0))
+    if _rotation(stream) in (90, 270):
+        # ffmpeg autorotates, so frames come out in display orientation.
+        return height, width
+    return width, height
+
+
+def warm_probe_cache(directory: Path, jobs: int = 4) -> List[JobResult]:
+    """Probe every media file under ``directory`` in parallel to fill the cache."""
+    if not directory.is_dir():
+        raise NotADirectoryError(f"Directory not found: {directory}")
+
+    media_files = sorted(
+        path
+        for path in directory.rglob("*")
+        if path.is_file() and path.suffix.lower() in MEDIA_EXTENSIONS
+    )
+    return run_parallel(probe_metadata, media_files, jobs)
+
+
 def _parse_frame_rate(rate: str) -> float:
     if not rate:
         return 0.0
@@ -60,3 +133,10 @@ def _parse_frame_rate(rate: str) -> float:
         return float(rate)
     except ValueError:
         return 0.0
+
+
+def _rotation(stream: Dict[str, Any]) -> int:
+    for side_data in stream.get("side_data_list", []):
+        if "rotation" in side_data:
+            return int(float(side_data["rotation"])) % 360
+    return int(float(stream.get("tags", {}).get("rotate", 0))) % 360
@@ -0,0 +1,84 @@
+"""Detect scene changes with ffmpeg's scene score."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import List
+
+from videotools.cache import get_cached, put_cached
+from videotools.ffmpeg import iter_ffmpeg_lines
+
+SCENES_CACHE_NAMESPACE = "scenes"
+
+
+def detect_scenes(
+    input_file: Path,
+    threshold: float = 0.3,
+    fps: float = 5.0,
+    width: int = 320,
+    min_scene_seconds: float = 1.0,
+    use_cache: bool = True,
+) -> List[float]:
+    """
+    Return the start times (in seconds) of detected scene changes.
+
+    The first video stream is decoded once, downscaled to ``width`` pixels
+    and sampled at ``fps`` frames per second before the ``select`` filter
+    scores each frame against the previous one; frames scoring above
+    ``threshold`` (0-1) start a new scene. ``metadata=print`` reports the
+    selected frames on stdout, which is parsed as ffmpeg runs. Cuts closer
+    than ``min_scene_seconds`` to the previous one are dropped.
+
+    Results are cached per source file and parameter set; pass
+    ``use_cache=False`` to always run ffmpeg.
+    """
+    if not input_file.exists():
+        raise FileNotFoundError(f"Input file not found: {input_file}")
+    if not 0 < threshold < 1:
+        raise ValueError("Scene threshold must be between 0 and 1.")
+    if fps <= 0 or width <= 0:
+        raise ValueError("Analysis fps and width must be positive.")
+
+    params_key = f"threshold={threshold}:fps={fps}:width={width}"
+    cached = get_cached(SCENES_CACHE_NAMESPACE, input_file) or {}
+    if use_cache and params_key in cached:
+        return _drop_close(cached[params_key], min_scene_seconds)
+
+    video_filter = ",".join(
+        [
+            f"scale={width}:-2",
+            f"fps={fps}",
+            f"select='gt(scene,{threshold})'",
+            "metadata=print:file=-",
+        ]
+    )
+    args = [
+        "-i",
+        str(input_file),
+        "-map",
+        "0:v:0",
+        "-an",
+        "-sn",
+        "-vf",
+        video_filter,
+        "-f",
+        "null",
+        "-",
+    ]
+    times: List[float] = []
+    for line in iter_ffmpeg_lines(args):
+        _, found, value = line.partition("pts_time:")
+        if found:
+            times.append(float(value.split()[0]))
+
+    cached[params_key] = times
+    put_cached(SCENES_CACHE_NAMESPACE, input_file, cached)
+    return _drop_close(times, min_scene_seconds)
+
+
+def _drop_close(times: List[float], min_gap: float) -> List[float]:
+    kept: List[float] = []
+    for seconds in sorted(times):
+        if not kept or seconds - kept[-1] >= min_gap:
+            kept.append(seconds)
+    return kept
@@ -0,0 +1,243 @@
+"""Frame-accurate cuts that only re-encode the GOPs at the clip edges."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Dict, List
+
+from videotools.ffmpeg import run_ffmpeg
+from videotools.keyframes import load_keyframe_index
+from videotools.ops.concat import write_concat_list
+from videotools.ops.probe import probe_metadata
+from videotools.seek import build_seek_args
+from videotools.workspace import job_workspace
+
+# Encoders used to re-render the clip edges so they can be joined with the
+# stream-copied middle of the same codec.
+SMART_CUT_ENCODERS = {
+    "h264": ["-c:v", "libx264", "-crf", "18", "-preset", "medium"],
+    "hevc": ["-c:v", "libx265", "-crf", "20", "-preset", "medium"],
+    "mpeg4": ["-c:v", "mpeg4", "-q:v", "2"],
+}
+
+# Bitstream filters that move parameter sets in-band. The parts are joined as
+# MPEG-TS so the re-encoded edges keep their own SPS/PPS; a joined MP4 would
+# only carry the first part's codec header.
+SMART_CUT_BITSTREAM_FILTERS = {
+    "h264": "h264_mp4toannexb",
+    "hevc": "hevc_mp4toannexb",
+}
+
+# x264 profile names for the profiles ffprobe reports with a different name.
+SMART_CUT_H264_PROFILES = {
+    "constrained baseline": "baseline",
+    "high 10": "high10",
+    "high 4:2:2": "high422",
+    "high 4:4:4 predictive": "high444",
+}
+
+# Stream properties a re-encoded edge must share with the source for the
+# joined clip to decode with the source's codec header.
+SMART_CUT_MATCH_FIELDS = ("codec_name", "profile", "level", "pix_fmt", "width", "height")
+
+
+def smart_cut_clip(
+    input_file: Path,
+    start_seconds: float,
+    duration_seconds: float,
+    output_file: Path,
+    threads: int | None = None,
+) -> Path:
+    """
+    Cut a frame-accurate clip while stream-copying every complete GOP.
+
+    The clip is rendered in up to three video parts: a re-encoded head from
+    the in-point to the first keyframe, the stream-copied GOPs in between and
+    a re-encoded tail from the last keyframe to the out-point. The parts are
+    written as MPEG-TS, so each keeps its parameter sets in-band, and joined
+    with the concat demuxer and muxed with the stream-copied audio of
+    the requested range.
+
+    The edges are encoded with the source's profile, level and pixel format.
+    The joined MP4 carries only one codec header, so if an encoded edge still
+    differs from the source in any of :data:`SMART_CUT_MATCH_FIELDS`, the
+    clip is re-encoded fully instead. Clips without a complete GOP are also
+    re-encoded fully. ``threads`` caps the threads of each encode when clips
+    run in parallel.
+    """
+    if not input_file.exists():
+        raise FileNotFoundError(f"Input file not found: {input_file}")
+    if duration_seconds <= 0:
+        raise ValueError("Duration must be positive.")
+    thread_args = ["-threads", str(threads)] if threads else []
+
+    end_seconds = start_seconds + duration_seconds
+    index = load_keyframe_index(input_file)
+    first_keyframe = index.next(start_seconds)
+    last_keyframe = index.previous(end_seconds) if len(index) else None
+
+    if first_keyframe is None or last_keyframe is None or first_keyframe >= last_keyframe:
+        return _reencode_clip(input_file, start_seconds, duration_seconds, output_file, thread_args)
+
+    source = _video_stream(input_file)
+    video_codec = source.get("codec_name", "unknown")
+    encoder_args = SMART_CUT_ENCODERS.get(video_codec)
+    if encoder_args is None:
+        raise ValueError(f"Smart cut does not support video codec: {video_codec}")
+    encoder_args = [*encoder_args, *_matching_args(source), *thread_args]
+
+    bitstream_args = []
+    if video_codec in SMART_CUT_BITSTREAM_FILTERS:
+        bitstream_args = ["-bsf:v", SMART_CUT_BITSTREAM_FILTERS[video_codec]]
+
+    with job_workspace("smartcut") as work_dir:
+        parts: List[Path] = []
+        if start_seconds < first_keyframe:
+            head = work_dir / "head.ts"
+            _encode_range(input_file, start_seconds, first_keyframe, encoder_args, head)
+            if not _matches_source(head, source):
+                return _reencode_clip(
+                    input_file, start_seconds, duration_seconds, output_file, thread_args
+                )
+            parts.append(head)
+
+        middle = work_dir / "middle.ts"
+        run_ffmpeg(
+            [
+                "-ss",
+                str(first_keyframe),
+                "-i",
+                str(input_file),
+                "-t",
+                str(last_keyframe - first_keyframe),
+                "-map",
+                "0:v:0",
+                "-c",
+                "copy",
+                *bitstream_args,
+                "-f",
+                "mpegts",
+                "-y",
+                str(middle),
+            ]
+        )
+        parts.append(middle)
+
+        if last_keyframe < end_seconds:
+            tail = work_dir / "tail.ts"
+            _encode_range(input_file, last_keyframe, end_seconds, encoder_args, tail)
+            if not _matches_source(tail, source):
+                return _reencode_clip(
+                    input_file, start_seconds, duration_seconds, output_file, thread_args
+                )
+            parts.append(tail)
+
+        list_path = write_concat_list(parts, work_dir / "concat_list.txt")
+        run_ffmpeg(
+            [
+                "-f",
+                "concat",
+                "-safe",
+                "0",
+                "-i",
+                str(list_path),
+                "-ss",
+                str(start_seconds),
+                "-t",
+                str(duration_seconds),
+                "-i",
+                str(input_file),
+                "-map",
+                "0:v:0",
+                "-map",
+                "1:a?",
+                "-c",
+                "copy",
+                "-y",
+                str(output_file),
+            ]
+        )
+    return output_file
+
+
+def _reencode_clip(
+    input_file: Path,
+    start_seconds: float,
+    duration_seconds: float,
+    output_file: Path,
+    thread_args: List[str],
+) -> Path:
+    input_seek, output_seek = build_seek_args(start_seconds, "hybrid")
+    run_ffmpeg(
+        [
+            *input_seek,
+            "-i",
+            str(input_file),
+            *output_seek,
+            "-t",
+            str(duration_seconds),
+            *thread_args,
+            "-y",
+            str(output_file),
+        ]
+    )
+    return output_file
+
+
+def _video_stream(path: Path, use_cache: bool = True) -> Dict[str, Any]:
+    streams = probe_metadata(path, use_cache=use_cache).get("streams", [])
+    return next((stream for stream in streams if stream.get("codec_type") == "video"), {})
+
+
+def _matching_args(source: Dict[str, Any]) -> List[str]:
+    """Return encoder options that reproduce the source's codec configuration."""
+    args: List[str] = []
+    codec = source.get("codec_name")
+    profile = str(source.get("profile", "")).lower()
+    level = source.get("level")
+    if codec == "h264":
+        if profile:
+            args += ["-profile:v", SMART_CUT_H264_PROFILES.get(profile, profile)]
+        if isinstance(level, int) and level > 0:
+            args += ["-level:v", f"{level / 10:.1f}"]
+    elif codec == "hevc":
+        if profile:
+            args += ["-profile:v", profile.replace(" ", "")]
+        if isinstance(level, int) and level > 0:
+            args += ["-x265-params", f"level-idc={level / 30:g}"]
+    if source.get("pix_fmt"):
+        args += ["-pix_fmt", source["pix_fmt"]]
+    return args
+
+
+def _matches_source(part: Path, source: Dict[str, Any]) -> bool:
+    # Parts are scratch files, so their probe results are not cached.
+    encoded = _video_stream(part, use_cache=False)
+    return all(encoded.get(field) == source.get(field) for field in SMART_CUT_MATCH_FIELDS)
+
+
+def _encode_range(
+    input_file: Path,
+    start_seconds: float,
+    end_seconds: float,
+    encoder_args: List[str],
+    output_file: Path,
+) -> None:
+    input_seek, output_seek = build_seek_args(start_seconds, "hybrid")
+    run_ffmpeg(
+        [
+            *input_seek,
+            "-i",
+            str(input_file),
+            *output_seek,
+            "-t",
+            str(end_seconds - start_seconds),
+            "-map",
+            "0:v:0",
+            *encoder_args,
+            "-f",
+            "mpegts",
+            "-y",
+            str(output_file),
+        ]
+    )
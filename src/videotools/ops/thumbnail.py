@@ -1,12 +1,20 @@
-"""Extract a thumbnail image from a video."""
+"""Extract thumbnail images and sprite sheets from a video."""
 
 from __future__ import annotations
 
+import glob
+import re
 from pathlib import Path
+from typing import List, Sequence, Tuple
 
 from videotools.ffmpeg import run_ffmpeg
+from videotools.ops.probe import probe_video
 from videotools.paths import PROCESSED_DIR, ensure_directories
-from videotools.timecode import parse_timecode
+from videotools.seek import build_seek_args
+from videotools.timecode import parse_timecode, sanitize_timecode_label
+
+# Inputs opened by one ffmpeg process when extracting many timestamps.
+THUMBNAIL_BATCH_SIZE = 32
 
 
 def extract_thumbnail(
@@ -15,14 +23,19 @@ def extract_thumbnail(
     output_file: Path | None = None,
     output_dir: Path | None = None,
     image_format: str = "png",
+    seek: str = "hybrid",
+    width: int | None = None,
 ) -> Path:
-    """Extract a single frame at a specified timestamp."""
+    """
+    Extract a single frame at a specified timestamp.
+
+    ``seek`` selects where ``-ss`` is placed (see :mod:`videotools.seek`);
+    ``width`` scales the frame, keeping its aspect ratio.
+    """
     if not input_file.exists():
         raise FileNotFoundError(f"Input file not found: {input_file}")
 
-    image_format = image_format.lower().lstrip(".")
-    if image_format not in {"png", "jpg", "jpeg"}:
-        raise ValueError("Thumbnail format must be png or jpg/jpeg.")
+    image_format = _validate_image_format(image_format)
 
     ensure_directories()
     if output_file is None:
@@ -38,11 +51,13 @@ def extract_thumbnail(
         raise ValueError("Thumbnail format must match output file extension.")
 
     timestamp_seconds = parse_timecode(timestamp)
+    input_seek, output_seek = build_seek_args(timestamp_seconds, seek)
     args = [
+        *input_seek,
         "-i",
         str(input_file),
-        "-ss",
-        str(timestamp_seconds),
+        *output_seek,
+        *(["-vf", f"scale={width}:-2"] if width else []),
         "-frames:v",
         "1",
         "-y",
@@ -50,3 +65,200 @@ def extract_thumbnail(
     ]
     run_ffmpeg(args)
     return output_file
+
+
+def extract_thumbnails(
+    input_file: Path,
+    timestamps: Sequence[str] | None = None,
+    interval: float | None = None,
+    output_dir: Path | None = None,
+    image_format: str = "png",
+    seek: str = "hybrid",
+    width: int | None = None,
+) -> List[Path]:
+    """
+    Extract many frames without starting one ffmpeg per frame.
+
+    With ``timestamps`` every frame gets its own seeking input in a shared
+    ffmpeg process (up to :data:`THUMBNAIL_BATCH_SIZE` per process), so only
+    the GOPs around each timestamp are decoded; files are named
+    ``<stem>_thumb_<timestamp>``. With ``interval`` the video is decoded once
+    through an ``fps`` filter and one frame is written every ``interval``
+    seconds as ``<stem>_thumb_i<index>``. ``width`` scales the frames.
+    """
+    if not input_file.exists():
+        raise FileNotFoundError(f"Input file not found: {input_file}")
+    if (timestamps is None) == (interval is None):
+        raise ValueError("Provide either timestamps or an interval.")
+    image_format = _validate_image_format(image_format)
+    scale_filter = f"scale={width}:-2" if width else None
+
+    ensure_directories()
+    if output_dir is None:
+        output_dir = PROCESSED_DIR
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    if interval is not None:
+        if interval <= 0:
+            raise ValueError("Thumbnail interval must be positive.")
+        pattern = output_dir / f"{input_file.stem}_thumb_i%05d.{image_format}"
+        for stale in _numbered_files(output_dir, f"{input_file.stem}_thumb_i", 5, image_format):
+            stale.unlink()
+        run_ffmpeg(
+            [
+                "-i",
+                str(input_file),
+                "-map",
+                "0:v:0",
+                "-vf",
+                ",".join(filter(None, [f"fps=1/{interval}", scale_filter])),
+                "-start_number",
+                "0",
+                "-y",
+                str(pattern),
+            ]
+        )
+        return _numbered_files(output_dir, f"{input_file.stem}_thumb_i", 5, image_format)
+
+    frames: List[Tuple[float, Path]] = []
+    for timestamp in dict.fromkeys(timestamps or []):
+        label = sanitize_timecode_label(timestamp)
+        frames.append(
+            (
+                parse_timecode(timestamp),
+                output_dir / f"{input_file.stem}_thumb_{label}.{image_format}",
+            )
+        )
+
+    for batch_start in range(0, len(frames), THUMBNAIL_BATCH_SIZE):
+        batch = frames[batch_start : batch_start + THUMBNAIL_BATCH_SIZE]
+        input_args: List[str] = []
+        output_args: List[str] = []
+        for index, (seconds, output_file) in enumerate(batch):
+            input_seek, output_seek = build_seek_args(seconds, seek)
+            input_args += [*input_seek, "-i", str(input_file)]
+            output_args += ["-map", f"{index}:v:0", *output_seek]
+            if scale_filter:
+                output_args += ["-vf", scale_filter]
+            output_args += ["-frames:v", "1", "-y", str(output_file)]
+        run_ffmpeg([*input_args, *output_args])
+    return [output_file for _, output_file in frames]
+
+
+def create_sprite_sheets(
+    input_file: Path,
+    interval: float = 10.0,
+    width: int = 160,
+    columns: int = 10,
+    rows: int = 10,
+    output_dir: Path | None = None,
+    base_url: str = "",
+) -> Tuple[List[Path], Path]:
+    """
+    Tile frames into JPEG sprite sheets and write a WebVTT thumbnail track.
+
+    One frame every ``interval`` seconds is scaled to ``width`` pixels and
+    tiled ``columns`` x ``rows`` per sheet in a single decode; the height
+    follows the display aspect ratio of rotated sources. The VTT has one cue
+    per frame ffmpeg actually sampled, referencing
+    ``<base_url><sheet name>#xywh=x,y,w,h``.
+
+    Returns:
+        The sprite sheet paths and the WebVTT file path
+    """
+    if not input_file.exists():
+        raise FileNotFoundError(f"Input file not found: {input_file}")
+    if interval <= 0 or width <= 0 or columns <= 0 or rows <= 0:
+        raise ValueError("Interval, width, columns and rows must be positive.")
+
+    metadata = probe_video(input_file)
+    source_width, source_height = (
+        int(value) for value in metadata["display_resolution"].split("x")
+    )
+    if not source_width or not source_height:
+        raise ValueError(f"Input file has no video stream: {input_file}")
+    height = max(2, round(width * source_height / source_width / 2) * 2)
+
+    ensure_directories()
+    if output_dir is None:
+        output_dir = PROCESSED_DIR
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    sheet_pattern = output_dir / f"{input_file.stem}_sprite_%03d.jpg"
+    for stale in _numbered_files(output_dir, f"{input_file.stem}_sprite_", 3, "jpg"):
+        stale.unlink()
+    # The sampled frames are also written as a framecrc listing on stdout,
+    # so the cues cover exactly the frames that made it into the sheets.
+    graph = (
+        f"[0:v:0]fps=1/{interval},scale={width}:{height},split[frames][tiles];"
+        f"[tiles]tile={columns}x{rows}[sheets]"
+    )
+    listing = run_ffmpeg(
+        [
+            "-i",
+            str(input_file),
+            "-filter_complex",
+            graph,
+            "-map",
+            "[frames]",
+            "-f",
+            "framecrc",
+            "-",
+            "-map",
+            "[sheets]",
+            "-start_number",
+            "0",
+            "-y",
+            str(sheet_pattern),
+        ],
+        capture_output=True,
+    )
+    sheets = _numbered_files(output_dir, f"{input_file.stem}_sprite_", 3, "jpg")
+    per_sheet = columns * rows
+    frame_count = sum(
+        1 for line in (listing or "").splitlines() if line.strip() and not line.startswith("#")
+    )
+    frame_count = min(frame_count, per_sheet * len(sheets))
+
+    duration = metadata["duration"]
+    cues = ["WEBVTT", ""]
+    for index in range(frame_count):
+        start = index * interval
+        end = start + interval
+        if index == frame_count - 1 and duration > start:
+            # The last sampled frame previews everything up to the end.
+            end = duration
+        column, row = (index % per_sheet) % columns, (index % per_sheet) // columns
+        sheet_name = f"{input_file.stem}_sprite_{index // per_sheet:03d}.jpg"
+        cues.append(f"{_vtt_timestamp(start)} --> {_vtt_timestamp(end)}")
+        cues.append(f"{base_url}{sheet_name}#xywh={column * width},{row * height},{width},{height}")
+        cues.append("")
+    vtt_path = output_dir / f"{input_file.stem}_thumbnails.vtt"
+    vtt_path.write_text("\n".join(cues), encoding="utf-8")
+    return sheets, vtt_path
+
+
+def _numbered_files(directory: Path, prefix: str, digits: int, extension: str) -> List[Path]:
+    # Only exact ``<prefix><digits>.<extension>`` names written by an image
+    # sequence pattern, so other outputs sharing the prefix are left alone.
+    pattern = re.compile(rf"{re.escape(prefix)}\d{{{digits},}}\.{re.escape(extension)}")
+    return sorted(
+        path
+        for path in directory.glob(f"{glob.escape(prefix)}*.{extension}")
+        if pattern.fullmatch(path.name)
+    )
+
+
+def _validate_image_format(image_format: str) -> str:
+    image_format = image_format.lower().lstrip(".")
+    if image_format not in {"png", "jpg", "jpeg"}:
+        raise ValueError("Thumbnail format must be png or jpg/jpeg.")
+    return image_format
+
+
+def _vtt_timestamp(seconds: float) -> str:
+    milliseconds = int(round(seconds * 1000))
+    hours, remainder = divmod(milliseconds, 3_600_000)
+    minutes, remainder = divmod(remainder, 60_000)
+    secs, millis = divmod(remainder, 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}.{millis:03d}"
@@ -2,18 +2,61 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
 from pathlib import Path
+from typing import Any, Dict, List, Tuple
 
-from videotools.ffmpeg import run_ffmpeg
-from videotools.paths import PROCESSED_DIR, ensure_directories
+from videotools.ffmpeg import (
+    FFmpegProgress,
+    ProgressCallback,
+    run_ffmpeg,
+    run_ffmpeg_with_progress,
+)
+from videotools.keyframes import load_keyframe_index
+from videotools.ops.concat import write_concat_list
+from videotools.ops.probe import _parse_frame_rate, probe_metadata, probe_video
+from videotools.output_cache import output_cache_key, restore_output, store_output
+from videotools.paths import PROCESSED_DIR, TEMP_DIR, ensure_directories
+from videotools.pool import raise_for_failures, run_parallel, threads_per_job
+from videotools.workspace import claim_directory
+
+TRANSCODE_VIDEO_ENCODER = "libx264"
+TRANSCODE_AUDIO_ENCODER = "aac"
+# libx264's and ffmpeg's aac defaults, spelled out so chunked encodes match.
+TRANSCODE_CRF = 23
+TRANSCODE_PRESET = "medium"
+TRANSCODE_AUDIO_BITRATE = "128k"
+
+# Source streams that already match the transcode target and can be copied.
+COPY_VIDEO_PIXEL_FORMATS = {"yuv420p", "yuvj420p"}
+COPY_VIDEO_PROFILES = {"Constrained Baseline", "Baseline", "Main", "High"}
+COPY_AUDIO_PROFILES = {"LC", "HE-AAC", "HE-AACv2"}
+
+# Chunked transcodes keep finished chunks here until the job completes.
+CHUNK_DIR = TEMP_DIR / "chunks"
 
 
 def transcode_video(
     input_file: Path,
     output_file: Path | None = None,
     output_dir: Path | None = None,
+    on_progress: ProgressCallback | None = None,
+    use_cache: bool = True,
+    refresh: bool = False,
+    allow_copy: bool = True,
 ) -> Path:
-    """Convert a video to H.264 video + AAC audio in an MP4 container."""
+    """
+    Convert a video to H.264 video + AAC audio in an MP4 container.
+
+    Streams that are already 8-bit 4:2:0 H.264 (Baseline/Main/High) or AAC
+    are stream-copied instead of re-encoded, so a compliant file is only
+    remuxed; pass ``allow_copy=False`` to always re-encode.
+    """
     if not input_file.exists():
         raise FileNotFoundError(f"Input file not found: {input_file}")
 
@@ -24,17 +67,239 @@ def transcode_video(
         output_dir.mkdir(parents=True, exist_ok=True)
         output_file = output_dir / f"{input_file.stem}_transcoded.mp4"
 
-    args = [
-        "-i",
-        str(input_file),
+    args = ["-i", str(input_file)]
+    video = audio = None
+    copy_video = copy_audio = False
+    if allow_copy:
+        video, audio = _main_streams(probe_metadata(input_file))
+        copy_video = video is not None and _is_copyable_video(video[1])
+        copy_audio = audio is not None and _is_copyable_audio(audio[1])
+    if copy_video or copy_audio:
+        args += ["-map", f"0:v:{video[0]}"] if video is not None else []
+        args += ["-map", f"0:a:{audio[0]}"] if audio is not None else []
+    args += [
         "-c:v",
-        "libx264",
+        "copy" if copy_video else TRANSCODE_VIDEO_ENCODER,
         "-c:a",
-        "aac",
+        "copy" if copy_audio else TRANSCODE_AUDIO_ENCODER,
         "-movflags",
         "+faststart",
         "-y",
         str(output_file),
     ]
-    run_ffmpeg(args)
+    cache_key = output_cache_key(args, [input_file], output_file) if use_cache else None
+    if cache_key and not refresh and restore_output(cache_key, output_file):
+        return output_file
+
+    if on_progress is None:
+        run_ffmpeg(args)
+    else:
+        duration = probe_video(input_file)["duration"]
+        run_ffmpeg_with_progress(args, on_progress, duration=duration)
+    if cache_key:
+        store_output(cache_key, output_file)
+    return output_file
+
+
+def transcode_video_chunked(
+    input_file: Path,
+    output_file: Path | None = None,
+    output_dir: Path | None = None,
+    chunk_seconds: float = 60.0,
+    jobs: int = 4,
+    crf: int = TRANSCODE_CRF,
+    preset: str = TRANSCODE_PRESET,
+    gop_seconds: float = 2.0,
+    on_progress: ProgressCallback | None = None,
+    keep_chunks: bool = False,
+) -> Path:
+    """
+    Transcode to H.264/AAC MP4 by encoding keyframe-aligned chunks in parallel.
+
+    The source is split at keyframes roughly every ``chunk_seconds``. Each
+    chunk is encoded by its own ffmpeg process (up to ``jobs`` at a time,
+    sharing the CPU cores) with a fixed GOP and constant-quality rate
+    control, and the audio is encoded once alongside them. The parts are
+    then joined with concat-demuxer stream copy.
+
+    Finished chunks are kept in a directory keyed by the source file and
+    encoder settings, so rerunning a failed or interrupted job only encodes
+    the missing chunks. The directory is removed once the output is written,
+    unless ``keep_chunks`` is True. A run holds the directory while it works,
+    so a concurrent run of the same job fails with ``FileExistsError``
+    instead of writing the same chunks.
+    """
+    if not input_file.exists():
+        raise FileNotFoundError(f"Input file not found: {input_file}")
+    if chunk_seconds <= 0 or gop_seconds <= 0:
+        raise ValueError("Chunk and GOP lengths must be positive.")
+    if jobs < 1:
+        raise ValueError("Number of jobs must be at least 1.")
+
+    ensure_directories()
+    if output_file is None:
+        if output_dir is None:
+            output_dir = PROCESSED_DIR
+        output_dir.mkdir(parents=True, exist_ok=True)
+        output_file = output_dir / f"{input_file.stem}_transcoded.mp4"
+
+    duration = probe_video(input_file)["duration"]
+    if duration <= 0:
+        raise ValueError(f"Cannot split a source without a known duration: {input_file}")
+    # Same stream choice as transcode_video(), so cover art is never encoded.
+    video, audio = _main_streams(probe_metadata(input_file))
+    if video is None:
+        raise ValueError(f"Input file has no video stream: {input_file}")
+    chunks = plan_chunks(load_keyframe_index(input_file).times, duration, chunk_seconds)
+    fps = _parse_frame_rate(video[1].get("r_frame_rate", ""))
+    gop = max(1, round((fps or 25.0) * gop_seconds))
+    encoder_args = [
+        "-c:v",
+        TRANSCODE_VIDEO_ENCODER,
+        "-preset",
+        preset,
+        "-crf",
+        str(crf),
+        "-g",
+        str(gop),
+        "-keyint_min",
+        str(gop),
+        "-sc_threshold",
+        "0",
+        "-pix_fmt",
+        "yuv420p",
+    ]
+    work_dir = _chunk_dir(input_file, chunks, encoder_args)
+    with claim_directory(work_dir):
+        threads = ["-threads", str(threads_per_job(min(jobs, len(chunks))))]
+
+        tasks: List[Tuple[List[str], Path]] = []
+        chunk_files = []
+        for index, (start, end) in enumerate(chunks):
+            chunk_file = work_dir / f"chunk_{index:05d}.mp4"
+            chunk_files.append(chunk_file)
+            args = ["-ss", repr(start), "-i", str(input_file), "-t", repr(end - start)]
+            args += ["-map", f"0:v:{video[0]}", "-an", "-sn", "-dn", *encoder_args, *threads]
+            tasks.append((args, chunk_file))
+        has_audio = audio is not None
+        audio_file = work_dir / "audio.m4a"
+        if has_audio:
+            args = ["-i", str(input_file), "-map", f"0:a:{audio[0]}", "-vn", "-sn", "-dn"]
+            args += ["-c:a", TRANSCODE_AUDIO_ENCODER, "-b:a", TRANSCODE_AUDIO_BITRATE]
+            tasks.append((args, audio_file))
+
+        lock = threading.Lock()
+        started = time.monotonic()
+        completed = sum(
+            end - start for (start, end), path in zip(chunks, chunk_files) if path.exists()
+        )
+
+        def _encode(task: Tuple[List[str], Path]) -> Path:
+            nonlocal completed
+            args, path = task
+            if path.exists():
+                return path
+            partial = path.with_name(f"{path.stem}.part{path.suffix}")
+            run_ffmpeg([*args, "-y", str(partial)])
+            os.replace(partial, path)
+            if on_progress is not None and path != audio_file:
+                start, end = chunks[chunk_files.index(path)]
+                with lock:
+                    completed += end - start
+                    on_progress(
+                        FFmpegProgress(
+                            out_time=completed,
+                            duration=duration,
+                            elapsed=time.monotonic() - started,
+                        )
+                    )
+            return path
+
+        raise_for_failures(run_parallel(_encode, tasks, jobs))
+
+        list_path = write_concat_list(chunk_files, work_dir / "concat_list.txt")
+        args = ["-f", "concat", "-safe", "0", "-i", str(list_path)]
+        if has_audio:
+            args += ["-i", str(audio_file), "-map", "0:v:0", "-map", "1:a:0"]
+        args += ["-c", "copy", "-movflags", "+faststart", "-y", str(output_file)]
+        run_ffmpeg(args)
+
+        if on_progress is not None:
+            on_progress(
+                FFmpegProgress(
+                    out_time=duration,
+                    duration=duration,
+                    elapsed=time.monotonic() - started,
+                    finished=True,
+                )
+            )
+        if not keep_chunks:
+            shutil.rmtree(work_dir, ignore_errors=True)
     return output_file
+
+
+def _main_streams(
+    metadata: Dict[str, Any],
+) -> Tuple[Tuple[int, Dict[str, Any]] | None, Tuple[int, Dict[str, Any]] | None]:
+    """Return the first real video and first audio stream with their type indices."""
+    streams = metadata.get("streams", [])
+    videos = [stream for stream in streams if stream.get("codec_type") == "video"]
+    audios = [stream for stream in streams if stream.get("codec_type") == "audio"]
+    # Skip cover art, which ffprobe also reports as a video stream.
+    video = next(
+        (
+            (index, stream)
+            for index, stream in enumerate(videos)
+            if not stream.get("disposition", {}).get("attached_pic")
+        ),
+        None,
+    )
+    audio = (0, audios[0]) if audios else None
+    return video, audio
+
+
+def _is_copyable_video(stream: Dict[str, Any]) -> bool:
+    return (
+        stream.get("codec_name") == "h264"
+        and stream.get("pix_fmt") in COPY_VIDEO_PIXEL_FORMATS
+        and stream.get("profile") in COPY_VIDEO_PROFILES
+    )
+
+
+def _is_copyable_audio(stream: Dict[str, Any]) -> bool:
+    return stream.get("codec_name") == "aac" and stream.get("profile") in COPY_AUDIO_PROFILES
+
+
+def plan_chunks(
+    keyframes: Tuple[float, ...] | List[float],
+    duration: float,
+    chunk_seconds: float,
+) -> List[Tuple[float, float]]:
+    """
+    Split ``[0, duration)`` into ranges that start on keyframes.
+
+    Every range but the last is at least ``chunk_seconds`` long and ends on
+    the next keyframe after that, so chunks can be decoded independently
+    and joined without gaps or overlaps. A zero duration yields no ranges.
+    """
+    boundaries = [0.0]
+    for keyframe in keyframes:
+        if keyframe - boundaries[-1] >= chunk_seconds and keyframe < duration:
+            boundaries.append(keyframe)
+    boundaries.append(max(duration, boundaries[-1]))
+    return [(start, end) for start, end in zip(boundaries, boundaries[1:]) if end > start]
+
+
+def _chunk_dir(
+    input_file: Path, chunks: List[Tuple[float, float]], encoder_args: List[str]
+) -> Path:
+    stat = input_file.stat()
+    payload = json.dumps(
+        {
+            "input": [str(input_file.resolve()), stat.st_size, stat.st_mtime_ns],
+            "chunks": chunks,
+            "encoder": encoder_args,
+        }
+    )
+    digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+    return CHUNK_DIR / f"{input_file.stem}-{digest}"
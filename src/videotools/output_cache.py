@@ -0,0 +1,128 @@
+"""Content-addressed cache of ffmpeg outputs to skip redundant encodes."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import List, Sequence
+
+from videotools.capabilities import get_capabilities
+from videotools.ffmpeg import FFmpegError
+from videotools.paths import CACHE_DIR
+
+OUTPUT_CACHE_DIR = CACHE_DIR / "outputs"
+OUTPUT_CACHE_MAX_BYTES = 50 * 1024**3
+
+_STAMP_SUFFIX = ".used"
+
+
+def output_cache_key(
+    args: Sequence[str],
+    input_files: Sequence[Path],
+    output_file: Path,
+) -> str | None:
+    """
+    Return the cache key for an ffmpeg invocation, or None if it can't be cached.
+
+    The key covers the identity (path, size, mtime) of every input, the full
+    argument list with the output path replaced by a placeholder, the output
+    extension and the ffmpeg version.
+    """
+    try:
+        version = get_capabilities().version
+    except FFmpegError:
+        return None
+
+    inputs = []
+    for input_file in input_files:
+        stat = input_file.stat()
+        inputs.append([str(input_file.resolve()), stat.st_size, stat.st_mtime_ns])
+    output_arg = str(output_file)
+    payload = {
+        "args": ["<output>" if arg == output_arg else arg for arg in args],
+        "inputs": inputs,
+        "suffix": output_file.suffix.lower(),
+        "ffmpeg": version,
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def restore_output(cache_key: str, output_file: Path) -> bool:
+    """
+    Copy a cached artifact to ``output_file``; return False on a cache miss.
+
+    Entries are always copied, never linked: ffmpeg ``-y`` truncates its output
+    in place, which would otherwise rewrite the cached artifact as well.
+    """
+    entry = _entry_path(cache_key, output_file.suffix)
+    if not entry.exists():
+        return False
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = output_file.with_name(f".{output_file.name}.{os.getpid()}.tmp")
+    try:
+        shutil.copy2(entry, temp_path)
+        temp_path.replace(output_file)
+    except OSError:
+        temp_path.unlink(missing_ok=True)
+        raise
+    _touch(entry)
+    return True
+
+
+def store_output(cache_key: str, output_file: Path, max_bytes: int | None = None) -> None:
+    """Add a freshly written artifact to the cache and prune it to ``max_bytes``."""
+    if not output_file.exists():
+        return
+    entry = _entry_path(cache_key, output_file.suffix)
+    entry.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = entry.with_name(f"{entry.name}.{os.getpid()}.tmp")
+    try:
+        shutil.copy2(output_file, temp_path)
+        temp_path.replace(entry)
+    except OSError:
+        temp_path.unlink(missing_ok=True)
+        return
+    _touch(entry)
+    prune_output_cache(OUTPUT_CACHE_MAX_BYTES if max_bytes is None else max_bytes)
+
+
+def prune_output_cache(max_bytes: int) -> int:
+    """Remove least recently used artifacts until the cache fits ``max_bytes``."""
+    if not OUTPUT_CACHE_DIR.exists():
+        return 0
+
+    entries: List[tuple[float, int, Path]] = []
+    for entry in OUTPUT_CACHE_DIR.iterdir():
+        if entry.name.endswith((_STAMP_SUFFIX, ".tmp")) or not entry.is_file():
+            continue
+        stamp = _stamp_path(entry)
+        used_at = stamp.stat().st_mtime if stamp.exists() else entry.stat().st_mtime
+        entries.append((used_at, entry.stat().st_size, entry))
+
+    total = sum(size for _, size, _ in entries)
+    removed = 0
+    for _, size, entry in sorted(entries):
+        if total <= max_bytes:
+            break
+        entry.unlink(missing_ok=True)
+        _stamp_path(entry).unlink(missing_ok=True)
+        total -= size
+        removed += 1
+    return removed
+
+
+def _entry_path(cache_key: str, suffix: str) -> Path:
+    return OUTPUT_CACHE_DIR / f"{cache_key}{suffix.lower()}"
+
+
+def _stamp_path(entry: Path) -> Path:
+    # Last-use times live in a separate file so the artifact keeps the mtime
+    # of the encode it came from.
+    return entry.with_name(entry.name + _STAMP_SUFFIX)
+
+
+def _touch(entry: Path) -> None:
+    _stamp_path(entry).touch()
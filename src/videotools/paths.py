@@ -1,18 +1,42 @@
-"""Path utilities for default video tool directories."""
+"""Path utilities for default video tool directories.
+
+The defaults can be overridden with environment variables:
+
+- ``VIDEOTOOLS_ROOT``: base directory holding ``data/`` (default: the source
+  checkout, or the current directory for installed packages)
+- ``VIDEOTOOLS_DATA_DIR``: data directory (default: ``<root>/data``)
+- ``VIDEOTOOLS_TMPDIR``: root of per-job scratch workspaces (default:
+  ``<data>/temp``); point it at ``/dev/shm`` to keep scratch I/O in RAM
+"""
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
-ROOT_DIR = Path(__file__).resolve().parents[2]
-DATA_DIR = ROOT_DIR / "data"
+
+def _default_root() -> Path:
+    source_root = Path(__file__).resolve().parents[2]
+    if (source_root / "pyproject.toml").exists():
+        return source_root
+    return Path.cwd()
+
+
+def _env_path(name: str) -> Path | None:
+    value = os.environ.get(name)
+    return Path(value).expanduser().resolve() if value else None
+
+
+ROOT_DIR = _env_path("VIDEOTOOLS_ROOT") or _default_root()
+DATA_DIR = _env_path("VIDEOTOOLS_DATA_DIR") or ROOT_DIR / "data"
 VIDEO_DIR = DATA_DIR / "video"
 RAW_DIR = VIDEO_DIR / "raw"
 PROCESSED_DIR = VIDEO_DIR / "processed"
-TEMP_DIR = DATA_DIR / "temp"
+TEMP_DIR = _env_path("VIDEOTOOLS_TMPDIR") or DATA_DIR / "temp"
+CACHE_DIR = DATA_DIR / "cache"
 
 
 def ensure_directories() -> None:
     """Ensure default data directories exist."""
-    for directory in (DATA_DIR, VIDEO_DIR, RAW_DIR, PROCESSED_DIR, TEMP_DIR):
+    for directory in (DATA_DIR, VIDEO_DIR, RAW_DIR, PROCESSED_DIR, TEMP_DIR, CACHE_DIR):
         directory.mkdir(parents=True, exist_ok=True)
@@ -0,0 +1,104 @@
+"""Parallel execution helpers for batches of ffmpeg jobs."""
+
+from __future__ import annotations
+
+import contextvars
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, List, Sequence, TypeVar
+
+from videotools.ffmpeg import FFmpegError
+
+T = TypeVar("T")
+
+
+@dataclass
+class JobResult:
+    """Outcome of a single job executed by :func:`run_parallel`."""
+
+    index: int
+    item: Any
+    value: Any = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class FFmpegBatchError(FFmpegError):
+    """Exception raised when one or more jobs in a batch fail."""
+
+    def __init__(self, results: List[JobResult]) -> None:
+        self.results = results
+        failures = [result for result in results if not result.ok]
+        lines = [f"{len(failures)} of {len(results)} jobs failed:"]
+        for result in failures:
+            lines.append(f"  [{result.index}] {result.error}")
+        super().__init__("\n".join(lines))
+
+
+def available_cores() -> int:
+    """Return the number of CPU cores usable by this process."""
+    if hasattr(os, "sched_getaffinity"):
+        return max(1, len(os.sched_getaffinity(0)))
+    return max(1, os.cpu_count() or 1)
+
+
+def threads_per_job(jobs: int) -> int:
+    """Split the available cores evenly between ``jobs`` concurrent processes."""
+    if jobs < 1:
+        raise ValueError("Number of jobs must be at least 1.")
+    return max(1, available_cores() // jobs)
+
+
+def apply_thread_budget(args: Sequence[str], threads: int) -> List[str]:
+    """Insert ``-threads`` in front of the output path of an ffmpeg argument list."""
+    if not args:
+        raise ValueError("ffmpeg arguments must include an output path.")
+    return [*args[:-1], "-threads", str(threads), args[-1]]
+
+
+def run_parallel(
+    func: Callable[[T], Any],
+    items: Iterable[T],
+    jobs: int,
+) -> List[JobResult]:
+    """
+    Run ``func`` for every item using up to ``jobs`` concurrent workers.
+
+    Results are returned in input order; exceptions raised by ``func`` are
+    captured on the corresponding :class:`JobResult` instead of propagating.
+    Every item is run even after a failure, also with ``jobs=1``, so serial
+    and parallel batches report the same results.
+    """
+    if jobs < 1:
+        raise ValueError("Number of jobs must be at least 1.")
+
+    items = list(items)
+
+    def _run(index: int) -> JobResult:
+        item = items[index]
+        try:
+            return JobResult(index=index, item=item, value=func(item))
+        except Exception as exc:  # noqa: BLE001 - collected per job
+            return JobResult(index=index, item=item, error=exc)
+
+    if jobs == 1 or len(items) <= 1:
+        return [_run(index) for index in range(len(items))]
+
+    # ffmpeg does the heavy lifting in child processes, so threads are enough
+    # to keep every worker busy. Each job runs in a copy of the caller's
+    # context so process scopes (see videotools.ffmpeg) follow it.
+    contexts = [contextvars.copy_context() for _ in items]
+    with ThreadPoolExecutor(max_workers=min(jobs, len(items))) as executor:
+        return list(
+            executor.map(lambda index: contexts[index].run(_run, index), range(len(items)))
+        )
+
+
+def raise_for_failures(results: List[JobResult]) -> None:
+    """Raise :class:`FFmpegBatchError` if any job in ``results`` failed."""
+    if any(not result.ok for result in results):
+        raise FFmpegBatchError(results)
@@ -48,6 +48,11 @@ def get_required_preset_path(preset: dict[str, Any], key: str, preset_path: Path
 
 def load_audio_to_video_preset(preset_path: Path) -> dict[str, Any]:
     """Load audio-to-video preset data from JSON or YAML."""
+    return load_preset_file(preset_path)
+
+
+def load_preset_file(preset_path: Path) -> dict[str, Any]:
+    """Load a JSON or YAML file whose top level is an object."""
     if not preset_path.exists():
         raise FileNotFoundError(f"Preset file not found: {preset_path}")
 
@@ -0,0 +1,61 @@
+"""Seek strategies for placing ffmpeg ``-ss`` options."""
+
+from __future__ import annotations
+
+from typing import List, Tuple
+
+SEEK_STRATEGIES = ("fast", "accurate", "hybrid")
+
+# Amount decoded after the input-side seek in hybrid mode. It only needs to
+# absorb demuxers whose seek lands slightly past the requested time; the
+# keyframe before the landing point is found by ffmpeg itself.
+HYBRID_PREROLL_SECONDS = 5.0
+
+
+def validate_seek_strategy(strategy: str) -> str:
+    """Return the normalized seek strategy or raise ValueError."""
+    normalized = strategy.strip().lower()
+    if normalized not in SEEK_STRATEGIES:
+        raise ValueError(
+            f"Invalid seek strategy: {strategy}. Use one of: {', '.join(SEEK_STRATEGIES)}."
+        )
+    return normalized
+
+
+def default_seek_strategy(copy_streams: bool) -> str:
+    """
+    Return the default strategy for a cut.
+
+    Hybrid seeking produces the same frames as accurate seeking when the
+    output is re-encoded. Stream copy cannot trim between keyframes, so it
+    keeps the output-side seek it has always used.
+    """
+    return "accurate" if copy_streams else "hybrid"
+
+
+def build_seek_args(start_seconds: float, strategy: str) -> Tuple[List[str], List[str]]:
+    """
+    Build seek arguments for a start time.
+
+    Returns a tuple of ``(input_args, output_args)``; input arguments must be
+    placed before ``-i`` and output arguments after it.
+
+    - ``fast`` seeks on the input side to the nearest keyframe only.
+    - ``accurate`` decodes from the start of the file and trims on the output side.
+    - ``hybrid`` seeks on the input side to shortly before the start time and
+      trims the remainder exactly on the output side.
+    """
+    strategy = validate_seek_strategy(strategy)
+    if start_seconds < 0:
+        raise ValueError("Start time must be non-negative.")
+
+    if strategy == "fast":
+        return ["-noaccurate_seek", "-ss", str(start_seconds)], []
+    if strategy == "accurate":
+        return [], ["-ss", str(start_seconds)]
+
+    preroll = min(start_seconds, HYBRID_PREROLL_SECONDS)
+    input_start = round(start_seconds - preroll, 6)
+    input_args = ["-ss", str(input_start)] if input_start > 0 else []
+    output_args = ["-ss", str(round(preroll, 6))] if preroll > 0 else []
+    return input_args, output_args
@@ -0,0 +1,141 @@
+"""Isolated per-job scratch directories."""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import socket
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Sequence
+
+from videotools.paths import TEMP_DIR
+
+WORKSPACE_PREFIX = "vtjob-"
+OWNER_FILE = ".owner"
+
+# Workspaces whose owner can't be checked (it ran on another host, or the
+# owner file is unreadable) are removed by gc_workspaces() after this long.
+STALE_WORKSPACE_SECONDS = 24 * 3600
+
+
+@contextmanager
+def job_workspace(name: str = "job", keep: bool = False) -> Iterator[Path]:
+    """
+    Create a unique scratch directory for one job and remove it afterwards.
+
+    Workspaces live under ``TEMP_DIR`` (``VIDEOTOOLS_TMPDIR``) and are removed
+    whether the job succeeds or fails, unless ``keep`` is True.
+    """
+    TEMP_DIR.mkdir(parents=True, exist_ok=True)
+    path = Path(tempfile.mkdtemp(prefix=f"{WORKSPACE_PREFIX}{name}_", dir=TEMP_DIR))
+    (path / OWNER_FILE).write_text(json.dumps(_owner()), encoding="utf-8")
+    try:
+        yield path
+    finally:
+        if not keep:
+            shutil.rmtree(path, ignore_errors=True)
+
+
+@contextmanager
+def claim_directory(path: Path) -> Iterator[Path]:
+    """
+    Hold exclusive use of a shared scratch directory, such as a chunk cache.
+
+    The directory is created if needed and an owner file is written into it
+    atomically; it is removed again on exit, leaving the contents in place.
+    A claim left by a stale owner (see :func:`gc_workspaces`) is taken over.
+
+    Raises:
+        FileExistsError: If another live process holds the directory
+    """
+    path.mkdir(parents=True, exist_ok=True)
+    owner_file = path / OWNER_FILE
+    temp_path = path / f"{OWNER_FILE}.{os.getpid()}.tmp"
+    temp_path.write_text(json.dumps(_owner()), encoding="utf-8")
+    try:
+        for _ in range(2):
+            try:
+                os.link(temp_path, owner_file)
+                break
+            except FileExistsError:
+                if owner_file.exists() and not _is_stale(path, STALE_WORKSPACE_SECONDS):
+                    raise FileExistsError(f"Directory is in use by another job: {path}") from None
+                owner_file.unlink(missing_ok=True)
+        else:
+            raise FileExistsError(f"Directory is in use by another job: {path}")
+    finally:
+        temp_path.unlink(missing_ok=True)
+    try:
+        yield path
+    finally:
+        owner_file.unlink(missing_ok=True)
+
+
+def gc_workspaces(
+    max_age_seconds: float = STALE_WORKSPACE_SECONDS,
+    shared_dirs: Sequence[Path] = (),
+) -> List[Path]:
+    """
+    Remove workspaces left behind by crashed or killed jobs.
+
+    A workspace owned by a process on this host is stale once that process
+    has exited. Workspaces whose owner can't be checked (another host, or a
+    missing or unreadable owner file) are stale when older than
+    ``max_age_seconds``. Subdirectories of ``shared_dirs`` (directories used
+    through :func:`claim_directory`) are removed once older than
+    ``max_age_seconds`` and not held by a running process. Returns the
+    removed paths.
+    """
+    candidates = []
+    if TEMP_DIR.exists():
+        candidates += [(path, True) for path in sorted(TEMP_DIR.glob(f"{WORKSPACE_PREFIX}*"))]
+    for shared_dir in shared_dirs:
+        if shared_dir.exists():
+            # Shared directories hold resumable work, so they are only removed
+            # for age, and never while their owner is still running.
+            candidates += [(path, False) for path in sorted(shared_dir.iterdir())]
+
+    removed = []
+    for path, orphans_are_stale in candidates:
+        if path.is_dir() and _is_stale(path, max_age_seconds, orphans_are_stale):
+            shutil.rmtree(path, ignore_errors=True)
+            removed.append(path)
+    return removed
+
+
+def _owner() -> Dict[str, Any]:
+    return {"pid": os.getpid(), "host": socket.gethostname(), "created_at": time.time()}
+
+
+def _is_stale(path: Path, max_age_seconds: float, orphans_are_stale: bool = True) -> bool:
+    try:
+        owner = json.loads((path / OWNER_FILE).read_text(encoding="utf-8"))
+        created_at = float(owner["created_at"])
+        # Windows can't probe a pid without side effects; use the age there.
+        local = owner["host"] == socket.gethostname() and os.name != "nt"
+        pid = int(owner["pid"])
+    except (OSError, ValueError, KeyError, TypeError):
+        created_at = path.stat().st_mtime
+        local = False
+    if local:
+        # The owner can be checked directly: a running job is never stale,
+        # however long it has been running.
+        if _pid_alive(pid):
+            return False
+        if orphans_are_stale:
+            return True
+    return time.time() - created_at > max_age_seconds
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
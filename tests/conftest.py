@@ -0,0 +1,23 @@
+"""Shared fixtures for the test suite."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+import videotools.cache as cache
+import videotools.capabilities as capabilities
+import videotools.keyframes as keyframes
+import videotools.output_cache as output_cache
+
+
+@pytest.fixture(autouse=True)
+def isolated_caches(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep every on-disk cache inside the test's temporary directory."""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(cache, "CACHE_DB_PATH", cache_dir / "metadata.sqlite3")
+    monkeypatch.setattr(capabilities, "CAPABILITIES_CACHE_PATH", cache_dir / "capabilities.json")
+    monkeypatch.setattr(keyframes, "KEYFRAME_CACHE_DIR", cache_dir / "keyframes")
+    monkeypatch.setattr(keyframes, "_loaded", {})
+    monkeypatch.setattr(output_cache, "OUTPUT_CACHE_DIR", cache_dir / "outputs")
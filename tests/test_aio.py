@@ -0,0 +1,121 @@
+"""Tests for the asyncio API."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+import videotools.aio as aio
+from videotools.ffmpeg import FFmpegError
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="uses POSIX shebang scripts")
+
+FAKE_FFMPEG = """#!{python}
+import os
+import sys
+import time
+with open({pid_file!r}, "a") as handle:
+    handle.write(f"{{os.getpid()}}\\n")
+if "-version" in sys.argv:
+    print("ffmpeg version 6.1.1")
+    sys.exit(0)
+if "-fail" in sys.argv:
+    print("something broke", file=sys.stderr)
+    sys.exit(1)
+time.sleep(30)
+"""
+
+
+@pytest.fixture
+def fake_ffmpeg(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    pid_file = tmp_path / "pids.txt"
+    script = tmp_path / "ffmpeg"
+    script.write_text(FAKE_FFMPEG.format(python=sys.executable, pid_file=str(pid_file)))
+    script.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ.get('PATH', '')}")
+    return pid_file
+
+
+def _is_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    return True
+
+
+def _wait_until_dead(pid_file: Path) -> None:
+    pids = [int(line) for line in pid_file.read_text().split()]
+    deadline = time.monotonic() + 5
+    while any(_is_alive(pid) for pid in pids) and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert not any(_is_alive(pid) for pid in pids)
+
+
+def test_run_ffmpeg_async_captures_output(fake_ffmpeg: Path) -> None:
+    output = asyncio.run(aio.run_ffmpeg_async(["-version"], capture_output=True))
+    assert output is not None and output.startswith("ffmpeg version")
+
+
+def test_run_ffmpeg_async_reports_errors(fake_ffmpeg: Path) -> None:
+    with pytest.raises(FFmpegError, match="something broke"):
+        asyncio.run(aio.run_ffmpeg_async(["-fail"]))
+
+
+def test_run_ffmpeg_async_timeout_terminates_child(fake_ffmpeg: Path) -> None:
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(aio.run_ffmpeg_async(["-i", "in.mp4", "out.mp4"], timeout=0.5))
+    _wait_until_dead(fake_ffmpeg)
+
+
+def test_async_op_cancellation_terminates_child(fake_ffmpeg: Path, tmp_path: Path) -> None:
+    input_file = tmp_path / "input.mp4"
+    input_file.write_text("data")
+
+    async def main() -> None:
+        task = asyncio.create_task(
+            aio.extract_thumbnail(input_file, "0:01", output_file=tmp_path / "thumb.png")
+        )
+        while not fake_ffmpeg.exists():
+            await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(main())
+    _wait_until_dead(fake_ffmpeg)
+
+
+def test_async_ops_respect_concurrency_limit(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(aio, "_executor", None)
+    aio.set_concurrency_limit(2)
+    lock = threading.Lock()
+    running = 0
+    peak = 0
+
+    def work(value: int) -> int:
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+        return value
+
+    async_work = aio._async_op(work)
+
+    async def main() -> list[int]:
+        return await asyncio.gather(*(async_work(value) for value in range(6)))
+
+    try:
+        assert asyncio.run(main()) == list(range(6))
+        assert peak == 2
+    finally:
+        aio.set_concurrency_limit(aio.available_cores())
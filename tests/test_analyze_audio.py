@@ -0,0 +1,70 @@
+"""Tests for silence and highlight detection."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+import videotools.ops.analyze_audio as analyze  # noqa: E402
+from videotools.ops.analyze_audio import analyze_audio, analyze_audio_files, rms_envelope  # noqa: E402
+
+RATE = analyze.ANALYSIS_SAMPLE_RATE
+
+
+def _tone(seconds: float, amplitude: float) -> "np.ndarray":
+    t = np.arange(int(seconds * RATE)) / RATE
+    return (amplitude * np.sin(2 * np.pi * 440 * t)).astype(np.float32)
+
+
+def _signal() -> "np.ndarray":
+    # 10 s talk, 1 s pause, 5 s loud section, 90 s talk, 1 s pause, 5 s loud, 10 s talk.
+    parts = [
+        _tone(10, 0.05), np.zeros(RATE, dtype=np.float32), _tone(5, 0.9),
+        _tone(90, 0.05), np.zeros(RATE, dtype=np.float32), _tone(5, 0.9), _tone(10, 0.05),
+    ]
+    return np.concatenate(parts)
+
+
+@pytest.fixture
+def streamed(monkeypatch: pytest.MonkeyPatch) -> None:
+    def fake_chunks(input_file: Path, chunk_frames: int, **kwargs: object):
+        signal = _signal()
+        for offset in range(0, len(signal), chunk_frames):
+            yield signal[offset:offset + chunk_frames].reshape(-1, 1)
+
+    monkeypatch.setattr(analyze, "iter_pcm_chunks", fake_chunks)
+
+
+def test_rms_envelope_handles_chunk_boundaries() -> None:
+    signal = np.full(1000, 0.5, dtype=np.float32)
+    chunks = [signal[:333].reshape(-1, 1), signal[333:].reshape(-1, 1)]
+    envelope = rms_envelope(chunks, window_frames=100)
+    assert envelope.shape == (10,)
+    assert np.allclose(envelope, 20 * np.log10(0.5))
+
+
+def test_analysis_finds_pauses_and_highlights(tmp_path: Path, streamed: None) -> None:
+    analysis = analyze_audio(tmp_path / "talk.wav", clip_duration=60.0)
+    assert analysis.duration == pytest.approx(122.0)
+    assert [round(s.start) for s in analysis.silences] == [10, 106]
+    assert [round(s.start) for s in analysis.highlights] == [pytest.approx(10, abs=2),
+                                                              pytest.approx(106, abs=2)]
+    # Each clip starts at the end of the pause before its loud section.
+    assert analysis.candidates == [pytest.approx(11.0), pytest.approx(107.0)]
+    assert analysis.timestamps() == ["00:00:11", "00:01:47"]
+
+
+def test_candidates_respect_clip_spacing(tmp_path: Path, streamed: None) -> None:
+    analysis = analyze_audio(tmp_path / "talk.wav", clip_duration=120.0)
+    assert len(analysis.candidates) == 1
+
+
+def test_analyze_files_collects_results(tmp_path: Path, streamed: None) -> None:
+    (tmp_path / "a.wav").write_text("a")
+    (tmp_path / "notes.txt").write_text("b")
+    results = analyze_audio_files([tmp_path], jobs=1, clip_duration=60.0)
+    assert [result.item.name for result in results] == ["a.wav"]
+    assert results[0].ok and len(results[0].value.candidates) == 2
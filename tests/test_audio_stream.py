@@ -0,0 +1,74 @@
+"""Tests for streaming ffmpeg output and PCM chunks."""
+
+from __future__ import annotations
+
+import os
+import struct
+import sys
+from pathlib import Path
+
+import pytest
+
+from videotools.ffmpeg import FFmpegError, iter_ffmpeg_output
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="uses a POSIX shebang script")
+
+# Writes float32 samples 0, 1, 2, ... (as raw little-endian PCM) to stdout.
+FAKE_FFMPEG = """#!{python}
+import struct, sys, time
+for index in range({samples}):
+    sys.stdout.buffer.write(struct.pack("<f", float(index)))
+    if index % 1000 == 0:
+        sys.stdout.buffer.flush()
+sys.stdout.buffer.flush()
+print("done", file=sys.stderr)
+{tail}
+"""
+
+
+def _install_fake_ffmpeg(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, samples: int, tail: str = ""
+) -> None:
+    script = tmp_path / "ffmpeg"
+    script.write_text(FAKE_FFMPEG.format(python=sys.executable, samples=samples, tail=tail))
+    script.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ.get('PATH', '')}")
+
+
+def test_output_is_streamed_through_reused_buffer(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _install_fake_ffmpeg(tmp_path, monkeypatch, samples=2500)
+    buffer = bytearray(4 * 1000)
+    values: list[float] = []
+    sizes = []
+    for filled in iter_ffmpeg_output(["-i", "in.wav", "pipe:1"], buffer):
+        sizes.append(filled)
+        values += struct.unpack(f"<{filled // 4}f", bytes(buffer[:filled]))
+    assert sizes == [4000, 4000, 2000]
+    assert values == [float(index) for index in range(2500)]
+
+
+def test_failed_command_raises_with_stderr(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    _install_fake_ffmpeg(tmp_path, monkeypatch, samples=10, tail="sys.exit(1)")
+    with pytest.raises(FFmpegError, match="done"):
+        list(iter_ffmpeg_output(["pipe:1"], bytearray(64)))
+
+
+def test_closing_early_stops_ffmpeg(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    _install_fake_ffmpeg(tmp_path, monkeypatch, samples=10, tail="time.sleep(30)")
+    chunks = iter_ffmpeg_output(["pipe:1"], bytearray(8))
+    assert next(chunks) == 8
+    chunks.close()
+
+
+def test_pcm_chunks_have_fixed_shape(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    pytest.importorskip("numpy")
+    from videotools.ops.audio_stream import iter_pcm_chunks
+
+    _install_fake_ffmpeg(tmp_path, monkeypatch, samples=2500)
+    media = tmp_path / "in.wav"
+    media.write_text("audio")
+    chunks = list(iter_pcm_chunks(media, channels=2, chunk_frames=500, copy=True))
+    assert [chunk.shape for chunk in chunks] == [(500, 2), (500, 2), (250, 2)]
+    assert chunks[-1][-1].tolist() == [2498.0, 2499.0]
@@ -0,0 +1,96 @@
+"""Tests for the metadata cache and cached probing."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+import videotools.cache as cache
+import videotools.ops.probe as probe
+from videotools.cache import evict_cache, get_cached, put_cached
+
+PROBE_JSON = {
+    "streams": [
+        {"codec_type": "video", "codec_name": "h264", "width": 1920, "height": 1080,
+         "r_frame_rate": "30000/1001", "pix_fmt": "yuv420p"},
+        {"codec_type": "audio", "codec_name": "aac", "channels": 2},
+    ],
+    "format": {"duration": "12.5", "format_name": "mov,mp4,m4a,3gp,3g2,mj2"},
+}
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(cache, "CACHE_DB_PATH", tmp_path / "cache" / "metadata.sqlite3")
+
+
+def test_cache_round_trip_and_invalidation(tmp_path: Path) -> None:
+    media = tmp_path / "input.mp4"
+    media.write_text("data")
+    put_cached("probe", media, {"a": 1})
+    assert get_cached("probe", media) == {"a": 1}
+    assert get_cached("other", media) is None
+
+    media.write_text("changed")
+    os.utime(media, ns=(1, 1))
+    assert get_cached("probe", media) is None
+
+
+def test_evict_cache_by_count(tmp_path: Path) -> None:
+    for name in ("a.mp4", "b.mp4", "c.mp4"):
+        media = tmp_path / name
+        media.write_text(name)
+        put_cached("probe", media, name)
+    assert evict_cache(max_entries=1) == 2
+    assert evict_cache(max_age_seconds=-1) == 1
+
+
+def test_evict_cache_by_size(tmp_path: Path) -> None:
+    for name in ("a.mp4", "b.mp4", "c.mp4"):
+        media = tmp_path / name
+        media.write_text(name)
+        put_cached("probe", media, "x" * 98)  # 100 bytes as JSON
+    get_cached("probe", tmp_path / "a.mp4")
+    assert evict_cache(max_bytes=250) == 1
+    assert get_cached("probe", tmp_path / "a.mp4") is not None
+    assert get_cached("probe", tmp_path / "b.mp4") is None
+    assert evict_cache(max_bytes=0) == 2
+
+
+def test_probe_video_uses_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    media = tmp_path / "input.mp4"
+    media.write_text("data")
+    calls: list[list[str]] = []
+
+    def fake_probe(args: list[str], capture_output: bool = True) -> str:
+        calls.append(args)
+        return json.dumps(PROBE_JSON)
+
+    monkeypatch.setattr(probe, "run_ffprobe", fake_probe)
+
+    first = probe.probe_video(media)
+    second = probe.probe_video(media)
+    assert first == second
+    assert first["resolution"] == "1920x1080"
+    assert first["fps"] == pytest.approx(29.97, rel=1e-3)
+    assert len(calls) == 1
+    assert probe.probe_metadata(media)["format"]["format_name"].startswith("mov")
+
+    probe.probe_video(media, use_cache=False)
+    assert len(calls) == 2
+
+
+def test_warm_probe_cache_scans_media_files(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    (tmp_path / "nested").mkdir()
+    (tmp_path / "nested" / "a.mp4").write_text("a")
+    (tmp_path / "b.mov").write_text("b")
+    (tmp_path / "notes.txt").write_text("c")
+    monkeypatch.setattr(probe, "run_ffprobe", lambda args, capture_output=True: json.dumps(PROBE_JSON))
+
+    results = probe.warm_probe_cache(tmp_path, jobs=2)
+    assert sorted(result.item.name for result in results) == ["a.mp4", "b.mov"]
+    assert all(result.ok for result in results)
+    assert get_cached("probe", tmp_path / "b.mov") == PROBE_JSON
@@ -0,0 +1,91 @@
+"""Tests for ffmpeg capability detection."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+import videotools.capabilities as capabilities
+import videotools.ffmpeg as ffmpeg
+from videotools.capabilities import _parse_listing, _parse_version, get_capabilities
+from videotools.ffmpeg import FFmpegError, ensure_ffmpeg_exists
+
+ENCODERS = """Encoders:
+ V..... = Video
+ A..... = Audio
+ ------
+ V....D libx264              libx264 H.264 / AVC / MPEG-4 AVC
+ A....D aac                  AAC (Advanced Audio Coding)
+"""
+FILTERS = """Filters:
+  T.. = Timeline support
+ ... loudnorm          A->A       EBU R128 loudness normalization
+ TSC scale             V->V       Scale the input video size.
+"""
+MUXERS = """ File formats:
+ D. = Demuxing supported
+ .E = Muxing supported
+ --
+  E mp4             MP4 (MPEG-4 Part 14)
+  E hls             Apple HTTP Live Streaming
+"""
+
+
+def test_parse_listings() -> None:
+    assert _parse_listing(ENCODERS) == ["aac", "libx264"]
+    assert _parse_listing(FILTERS) == ["loudnorm", "scale"]
+    assert _parse_listing(MUXERS) == ["hls", "mp4"]
+    assert _parse_version("ffmpeg version 6.1.1 Copyright (c) 2000-2023") == "6.1.1"
+
+
+def test_ensure_ffmpeg_exists_only_checks_path(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(ffmpeg.shutil, "which", lambda tool: None)
+    monkeypatch.setattr(
+        ffmpeg.subprocess, "Popen", lambda *args, **kwargs: pytest.fail("spawned a process")
+    )
+    with pytest.raises(FFmpegError):
+        ensure_ffmpeg_exists()
+
+
+def test_capabilities_cached_until_binary_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    ffmpeg_bin = tmp_path / "ffmpeg"
+    ffprobe_bin = tmp_path / "ffprobe"
+    ffmpeg_bin.write_text("")
+    ffprobe_bin.write_text("")
+    outputs = {
+        "-version": "ffmpeg version 6.1.1 Copyright",
+        "-encoders": ENCODERS,
+        "-filters": FILTERS,
+        "-muxers": MUXERS,
+    }
+    calls: list[list[str]] = []
+
+    def fake_run(args: list[str], capture_output: bool = False) -> str:
+        calls.append(args)
+        return outputs[args[-1]]
+
+    monkeypatch.setattr(capabilities, "run_ffmpeg", fake_run)
+    monkeypatch.setattr(
+        capabilities, "find_ffmpeg_binaries", lambda: (str(ffmpeg_bin), str(ffprobe_bin))
+    )
+    monkeypatch.setattr(capabilities, "CAPABILITIES_CACHE_PATH", tmp_path / "caps.json")
+    monkeypatch.setattr(capabilities, "_loaded", {})
+
+    detected = get_capabilities()
+    assert detected.version == "6.1.1"
+    assert detected.has_encoder("libx264")
+    assert detected.has_filter("loudnorm")
+    assert detected.has_muxer("hls")
+    assert len(calls) == 4
+
+    monkeypatch.setattr(capabilities, "_loaded", {})
+    assert get_capabilities() == detected
+    assert len(calls) == 4
+
+    os.utime(ffmpeg_bin, ns=(1, 1))
+    get_capabilities()
+    assert len(calls) == 8
@@ -0,0 +1,28 @@
+"""Tests for the command line entry point."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("typer")
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+
+
+def test_cli_import_does_not_load_numpy() -> None:
+    # A fresh interpreter, since the test session may already have imported NumPy.
+    python_path = os.pathsep.join(filter(None, [str(SRC_DIR), os.environ.get("PYTHONPATH")]))
+    env = {**os.environ, "PYTHONPATH": python_path}
+    result = subprocess.run(
+        [sys.executable, "-c", "import sys, videotools.cli; print('numpy' in sys.modules)"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    assert result.stdout.strip() == "False"
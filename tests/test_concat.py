@@ -0,0 +1,128 @@
+"""Tests for the concat preflight and conforming."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+import videotools.ops.concat as concat
+import videotools.workspace as workspace
+from videotools.ops.concat import concat_preflight, stream_signature
+
+
+def _metadata(
+    codec: str = "h264",
+    width: int = 1920,
+    audio: bool = True,
+    rate: str = "30/1",
+    time_base: str = "1/15360",
+) -> dict:
+    streams = [
+        {"codec_type": "video", "codec_name": codec, "width": width, "height": 1080,
+         "pix_fmt": "yuv420p", "r_frame_rate": rate, "time_base": time_base},
+    ]
+    if audio:
+        streams.append({"codec_type": "audio", "codec_name": "aac", "sample_rate": "48000",
+                        "channels": 2, "channel_layout": "stereo"})
+    return {"streams": streams, "format": {"duration": "10.0"}}
+
+
+@pytest.fixture
+def media(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> dict[str, dict]:
+    probes: dict[str, dict] = {}
+    monkeypatch.setattr(concat, "probe_metadata", lambda path: probes[path.name])
+    monkeypatch.setattr(workspace, "TEMP_DIR", tmp_path / "temp")
+    return probes
+
+
+def _inputs(tmp_path: Path, media: dict[str, dict], **specs: dict) -> list[Path]:
+    paths = []
+    for name, metadata in specs.items():
+        path = tmp_path / f"{name}.mp4"
+        path.write_text(name)
+        media[path.name] = metadata
+        paths.append(path)
+    return paths
+
+
+def test_preflight_picks_majority(tmp_path: Path, media: dict[str, dict]) -> None:
+    inputs = _inputs(
+        tmp_path, media, a=_metadata(), b=_metadata(width=1280), c=_metadata()
+    )
+    target, mismatched = concat_preflight(inputs, jobs=2)
+    assert target == stream_signature(_metadata())
+    assert mismatched == [1]
+    assert stream_signature(_metadata(width=1280)).differences(target) == ["width"]
+
+
+def test_concat_conforms_only_mismatched_inputs(
+    tmp_path: Path, media: dict[str, dict], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    inputs = _inputs(
+        tmp_path, media, a=_metadata(), b=_metadata(width=1280, audio=False), c=_metadata()
+    )
+    calls: list[list[str]] = []
+    concat_lists: list[str] = []
+
+    def fake_run(args: list[str], capture_output: bool = False) -> None:
+        calls.append(args)
+        if "concat" in args:
+            concat_lists.append(Path(args[args.index("-i") + 1]).read_text())
+
+    monkeypatch.setattr(concat, "run_ffmpeg", fake_run)
+    concat.concat_videos(inputs, output_file=tmp_path / "out.mp4", jobs=1)
+
+    conform_args, concat_args = calls
+    assert conform_args[1] == str(inputs[1])
+    assert "anullsrc=r=48000:cl=stereo" in conform_args
+    assert conform_args[conform_args.index("-c:a") + 1] == "aac"
+    assert "scale=1920:1080:force_original_aspect_ratio=decrease" in (
+        conform_args[conform_args.index("-vf") + 1]
+    )
+    assert concat_args[-3:] == ["copy", "-y", str(tmp_path / "out.mp4")]
+    listed = concat_lists[0].splitlines()
+    assert str(inputs[0].resolve()) in listed[0]
+    assert "conformed_001.mp4" in listed[1]
+    assert str(inputs[2].resolve()) in listed[2]
+    assert not list((tmp_path / "temp").iterdir())
+
+
+def test_concat_without_conform_rejects_mismatch(
+    tmp_path: Path, media: dict[str, dict], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    inputs = _inputs(tmp_path, media, a=_metadata(), b=_metadata(codec="hevc"))
+    monkeypatch.setattr(concat, "run_ffmpeg", lambda args, capture_output=False: None)
+    with pytest.raises(ValueError, match="video_codec"):
+        concat.concat_videos(inputs, output_file=tmp_path / "out.mp4", conform=False)
+
+
+def test_timescale_only_mismatch_copies_video(
+    tmp_path: Path, media: dict[str, dict], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    inputs = _inputs(
+        tmp_path,
+        media,
+        a=_metadata(rate="30000/1001"),
+        b=_metadata(rate="2997/100", time_base="1/90000"),
+        c=_metadata(rate="30000/1001"),
+    )
+    calls: list[list[str]] = []
+    monkeypatch.setattr(
+        concat, "run_ffmpeg", lambda args, capture_output=False: calls.append(args)
+    )
+    concat.concat_videos(inputs, output_file=tmp_path / "out.mp4", jobs=1)
+
+    remux, _ = calls
+    assert remux[1] == str(inputs[1])
+    assert remux[remux.index("-c:v") + 1] == "copy"
+    assert remux[remux.index("-c:a") + 1] == "copy"
+    assert remux[remux.index("-video_track_timescale") + 1] == "15360"
+    assert "-vf" not in remux
+
+
+def test_frame_rates_compare_by_value() -> None:
+    ntsc = stream_signature(_metadata(rate="30000/1001"))
+    assert ntsc.matches(stream_signature(_metadata(rate="2997/100")))
+    assert not ntsc.matches(stream_signature(_metadata(rate="30/1")))
+    assert ntsc.differences(stream_signature(_metadata(rate="2997/100"))) == []
@@ -0,0 +1,70 @@
+"""Tests for single-pass, multi-track audio extraction."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+import videotools.ops.extract_audio as extract
+from videotools.ops.extract_audio import extract_audio, extract_audio_tracks
+
+PROBE_JSON = {
+    "streams": [
+        {"codec_type": "video", "codec_name": "h264"},
+        {"codec_type": "audio", "codec_name": "aac"},
+        {"codec_type": "audio", "codec_name": "opus"},
+    ],
+}
+
+
+@pytest.fixture
+def calls(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> list[list[str]]:
+    recorded: list[list[str]] = []
+    monkeypatch.setattr(extract, "probe_metadata", lambda path: PROBE_JSON)
+    monkeypatch.setattr(extract, "run_ffmpeg", lambda args: recorded.append(args))
+    return recorded
+
+
+def _output_specs(args: list[str]) -> list[tuple[str, str, str]]:
+    specs = []
+    for index, arg in enumerate(args):
+        if arg == "-map":
+            codec = args[args.index("-c:a", index) + 1]
+            output = args[args.index("-y", index) + 1]
+            specs.append((args[index + 1], codec, Path(output).name))
+    return specs
+
+
+def test_extracts_all_tracks_and_formats_in_one_run(
+    tmp_path: Path, calls: list[list[str]]
+) -> None:
+    source = tmp_path / "talk.mkv"
+    source.write_text("video")
+    outputs = extract_audio_tracks(source, formats=["m4a", "opus"], output_dir=tmp_path)
+
+    assert [path.name for path in outputs] == [
+        "talk_a0.m4a", "talk_a0.opus", "talk_a1.m4a", "talk_a1.opus"
+    ]
+    assert len(calls) == 1
+    assert _output_specs(calls[0]) == [
+        ("0:a:0", "copy", "talk_a0.m4a"),
+        ("0:a:0", "libopus", "talk_a0.opus"),
+        ("0:a:1", "aac", "talk_a1.m4a"),
+        ("0:a:1", "copy", "talk_a1.opus"),
+    ]
+
+
+def test_single_extract_copies_or_transcodes(tmp_path: Path, calls: list[list[str]]) -> None:
+    source = tmp_path / "talk.mp4"
+    source.write_text("video")
+    extract_audio(source, output_file=tmp_path / "talk.m4a")
+    extract_audio(source, output_file=tmp_path / "talk2.m4a", allow_copy=False)
+    extract_audio(source, output_file=tmp_path / "talk.wav", track=1)
+
+    assert _output_specs(calls[0]) == [("0:a:0", "copy", "talk.m4a")]
+    assert _output_specs(calls[1]) == [("0:a:0", "aac", "talk2.m4a")]
+    assert _output_specs(calls[2]) == [("0:a:1", "pcm_s16le", "talk.wav")]
+
+    with pytest.raises(ValueError):
+        extract_audio(source, output_file=tmp_path / "talk.wav", track=5)
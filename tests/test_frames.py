@@ -0,0 +1,89 @@
+"""Tests for streaming raw video frames."""
+
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+import videotools.ops.frames as frames  # noqa: E402
+from videotools.ffmpeg import FFmpegError  # noqa: E402
+from videotools.ops.frames import iter_frames  # noqa: E402
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="uses a POSIX shebang script")
+
+# Logs its arguments and writes 3.5 frames of 4x2 RGB where every byte is the frame index.
+FAKE_FFMPEG = """#!{python}
+import os
+import sys
+with open({log!r}, "a") as log:
+    log.write(" ".join(sys.argv[1:]) + "\\n")
+for index in range(3):
+    sys.stdout.buffer.write(bytes([index]) * 24)
+sys.stdout.buffer.write(bytes(12))
+sys.stdout.flush()
+if os.environ.get("FAKE_FFMPEG_FAIL"):
+    sys.stderr.write("Conversion failed!\\n")
+    sys.exit(1)
+"""
+
+
+@pytest.fixture
+def ffmpeg_log(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    log = tmp_path / "calls.log"
+    script = tmp_path / "ffmpeg"
+    script.write_text(FAKE_FFMPEG.format(python=sys.executable, log=str(log)))
+    script.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ.get('PATH', '')}")
+    stream = {"codec_type": "video", "width": 1080, "height": 1920,
+              "side_data_list": [{"rotation": -90}]}
+    monkeypatch.setattr(frames, "probe_metadata", lambda path: {"streams": [stream]})
+    return log
+
+
+def test_frames_reuse_one_buffer(tmp_path: Path, ffmpeg_log: Path) -> None:
+    media = tmp_path / "clip.mp4"
+    media.write_text("video")
+
+    views = []
+    for frame in iter_frames(media, width=4, height=2, fps=1, start=5, duration=10):
+        assert frame.shape == (2, 4, 3) and frame.dtype == np.uint8
+        assert int(frame[0, 0, 0]) == len(views)
+        views.append(frame)
+    assert len(views) == 3
+    assert views[0] is views[-1] or np.shares_memory(views[0], views[-1])
+
+    args = ffmpeg_log.read_text().split()
+    assert args[args.index("-vf") + 1] == "fps=1,scale=4:2"
+    assert args[args.index("-pix_fmt") + 1] == "rgb24"
+    assert args.index("-ss") < args.index("-i") < args.index("-t")
+
+
+def test_copy_and_aspect_from_rotated_stream(tmp_path: Path, ffmpeg_log: Path) -> None:
+    media = tmp_path / "clip.mp4"
+    media.write_text("video")
+    assert frames._output_size({"width": 1080, "height": 1920, "tags": {"rotate": "90"}},
+                               320, None) == (320, 180)
+
+    with pytest.raises(ValueError):
+        list(iter_frames(media, pixel_format="yuv420p"))
+    copies = list(iter_frames(media, pixel_format="gray", width=8, height=3, copy=True))
+    assert [int(frame[0, 0]) for frame in copies] == [0, 1, 2]
+
+
+def test_failed_run_after_partial_frame_raises(
+    tmp_path: Path, ffmpeg_log: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("FAKE_FFMPEG_FAIL", "1")
+    media = tmp_path / "clip.mp4"
+    media.write_text("video")
+
+    received = []
+    with pytest.raises(FFmpegError, match="Conversion failed"):
+        for frame in iter_frames(media, width=4, height=2, copy=True):
+            received.append(frame)
+    assert len(received) == 3
@@ -0,0 +1,104 @@
+"""Tests for the keyframe index."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+import videotools.keyframes as keyframes
+import videotools.ops.cut_duration as cut_duration
+from videotools.keyframes import KeyframeIndex, load_keyframe_index, snap_cut
+
+PACKETS = (
+    "packet,0.000000,K__\npacket,0.040000,___\npacket,4.000000,K__\npacket,2.000000,K_\n"
+    "packet,N/A,K__\npacket,6.000000,K__\nformat,0.000000\n"
+)
+
+
+@pytest.fixture
+def keyframe_source(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> tuple[Path, list]:
+    input_file = tmp_path / "input.mp4"
+    input_file.write_text("data")
+    calls: list[list[str]] = []
+
+    def fake_probe(args: list[str], capture_output: bool = True) -> str:
+        calls.append(args)
+        return PACKETS
+
+    monkeypatch.setattr(keyframes, "run_ffprobe", fake_probe)
+    monkeypatch.setattr(keyframes, "KEYFRAME_CACHE_DIR", tmp_path / "cache")
+    monkeypatch.setattr(keyframes, "_loaded", {})
+    return input_file, calls
+
+
+def test_index_lookup() -> None:
+    index = KeyframeIndex((0.0, 2.0, 4.0))
+    assert index.previous(3.9) == 2.0
+    assert index.previous(4.0) == 4.0
+    assert index.next(2.1) == 4.0
+    assert index.next(4.1) is None
+    assert index.between(1.0, 4.0) == (2.0,)
+
+
+def test_index_persists_sidecar(keyframe_source, monkeypatch: pytest.MonkeyPatch) -> None:
+    input_file, calls = keyframe_source
+    index = load_keyframe_index(input_file)
+    assert index.times == (0.0, 2.0, 4.0, 6.0)
+    assert len(list((keyframes.KEYFRAME_CACHE_DIR).glob("*.kfi"))) == 1
+
+    monkeypatch.setattr(keyframes, "_loaded", {})
+    assert load_keyframe_index(input_file).times == index.times
+    assert len(calls) == 1
+
+
+def test_index_invalidated_when_file_changes(keyframe_source) -> None:
+    input_file, calls = keyframe_source
+    load_keyframe_index(input_file)
+    input_file.write_text("changed data")
+    load_keyframe_index(input_file)
+    assert len(calls) == 2
+
+
+def test_index_is_relative_to_container_start(keyframe_source, monkeypatch) -> None:
+    input_file, _ = keyframe_source
+    # MPEG-TS style timestamps: the file starts at 1.4 s.
+    packets = "packet,1.400000,K__\npacket,3.400000,K__\npacket,5.400000,K__\nformat,1.400000\n"
+    monkeypatch.setattr(keyframes, "run_ffprobe", lambda args, capture_output=True: packets)
+    assert load_keyframe_index(input_file).times == pytest.approx((0.0, 2.0, 4.0))
+    assert snap_cut(input_file, 2.5, 1.0) == pytest.approx((2.0, 2.0))
+
+
+def test_snap_cut_covers_requested_range(keyframe_source) -> None:
+    input_file, _ = keyframe_source
+    assert snap_cut(input_file, 2.5, 1.0) == (2.0, 2.0)
+    assert snap_cut(input_file, 5.0, 3.0) == (4.0, 4.0)
+
+
+def test_cut_snap_uses_keyframe_boundaries(
+    keyframe_source, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    input_file, _ = keyframe_source
+    calls: list[list[str]] = []
+    monkeypatch.setattr(cut_duration, "run_ffmpeg", lambda args: calls.append(args))
+
+    cut_duration.cut_by_duration(
+        input_file,
+        start_time="2.5",
+        duration="1",
+        output_file=tmp_path / "clip.mp4",
+        copy_streams=True,
+        snap=True,
+    )
+    args = calls[0]
+    assert args[args.index("-ss") + 1] == "2.0"
+    assert args.index("-ss") < args.index("-i")
+    assert args[args.index("-t") + 1] == "2.0"
+
+
+def test_snap_requires_copy(keyframe_source, tmp_path: Path) -> None:
+    input_file, _ = keyframe_source
+    with pytest.raises(ValueError):
+        cut_duration.cut_by_duration(
+            input_file, "0", "1", output_file=tmp_path / "clip.mp4", snap=True
+        )
@@ -0,0 +1,125 @@
+"""Tests for single-decode encoding ladders."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+import videotools.ops.ladder as ladder
+from videotools.ops.ladder import DEFAULT_LADDER, Rendition, encode_ladder, load_ladder_preset
+
+
+@pytest.fixture
+def calls(monkeypatch: pytest.MonkeyPatch) -> list[list[str]]:
+    recorded: list[list[str]] = []
+    monkeypatch.setattr(ladder, "run_ffmpeg", lambda args: recorded.append(args))
+    monkeypatch.setattr(
+        ladder,
+        "probe_video",
+        lambda path: {"duration": 60.0, "resolution": "1920x1080",
+                      "display_resolution": "1920x1080", "fps": 30.0, "audio_codec": "aac"},
+    )
+    return recorded
+
+
+def _option_values(args: list[str], option: str) -> list[str]:
+    return [args[index + 1] for index, arg in enumerate(args) if arg == option]
+
+
+def test_one_process_splits_into_renditions(tmp_path: Path, calls: list[list[str]]) -> None:
+    media = tmp_path / "upload.mov"
+    media.write_text("video")
+
+    outputs = encode_ladder(media, output_dir=tmp_path)
+
+    assert [path.name for path in outputs] == [
+        "upload_1080p.mp4", "upload_720p.mp4", "upload_480p.mp4"
+    ]
+    assert len(calls) == 1
+    args = calls[0]
+    assert args.count("-i") == 1
+    graph = args[args.index("-filter_complex") + 1]
+    assert graph.startswith("[0:v:0]split=3[v0][v1][v2]")
+    assert "[v1]scale=1280:720[out1]" in graph and "[v2]scale=854:480[out2]" in graph
+    assert _option_values(args, "-maxrate") == ["5000k", "2800k", "1400k"]
+    assert set(_option_values(args, "-g")) == {"60"}
+    assert _option_values(args, "-c:v") == ["libx264"] * 3
+
+
+def test_skips_renditions_above_source(tmp_path: Path, calls: list[list[str]],
+                                       monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(
+        ladder,
+        "probe_video",
+        lambda path: {"duration": 60.0, "resolution": "640x360",
+                      "display_resolution": "640x360", "fps": 25.0, "audio_codec": "unknown"},
+    )
+    media = tmp_path / "small.mp4"
+    media.write_text("video")
+
+    outputs = encode_ladder(media, output_dir=tmp_path)
+
+    assert [path.name for path in outputs] == ["small_480p.mp4"]
+    args = calls[0]
+    assert args[args.index("-filter_complex") + 1] == "[0:v:0]scale=640:360[out0]"
+    assert "0:a:0" not in args
+
+
+def test_rotated_source_keeps_portrait_aspect(tmp_path: Path, calls: list[list[str]],
+                                             monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(
+        ladder,
+        "probe_video",
+        lambda path: {"duration": 60.0, "resolution": "1920x1080",
+                      "display_resolution": "1080x1920", "fps": 30.0, "audio_codec": "aac"},
+    )
+    media = tmp_path / "phone.mp4"
+    media.write_text("video")
+
+    encode_ladder(media, DEFAULT_LADDER[1:], output_dir=tmp_path, hls=True)
+
+    graph = calls[0][calls[0].index("-filter_complex") + 1]
+    assert "[v0]scale=404:720[out0]" in graph and "[v1]scale=270:480[out1]" in graph
+    master = (tmp_path / "phone_hls" / "master.m3u8").read_text()
+    assert "RESOLUTION=404x720" in master and "RESOLUTION=270x480" in master
+
+
+def test_hls_writes_master_playlist(tmp_path: Path, calls: list[list[str]]) -> None:
+    media = tmp_path / "upload.mov"
+    media.write_text("video")
+
+    outputs = encode_ladder(media, DEFAULT_LADDER[1:], output_dir=tmp_path, hls=True)
+
+    hls_dir = tmp_path / "upload_hls"
+    assert outputs == [hls_dir / "master.m3u8", hls_dir / "720p.m3u8", hls_dir / "480p.m3u8"]
+    assert _option_values(calls[0], "-f") == ["hls", "hls"]
+    assert outputs[0].read_text().splitlines() == [
+        "#EXTM3U",
+        "#EXT-X-VERSION:3",
+        "#EXT-X-STREAM-INF:BANDWIDTH=2928000,RESOLUTION=1280x720",
+        "720p.m3u8",
+        "#EXT-X-STREAM-INF:BANDWIDTH=1496000,RESOLUTION=854x480",
+        "480p.m3u8",
+    ]
+
+
+def test_load_ladder_preset(tmp_path: Path) -> None:
+    preset = tmp_path / "ladder.json"
+    preset.write_text(json.dumps({"renditions": [
+        {"name": "360p", "height": 360, "video_bitrate": "800k"},
+    ]}))
+    assert load_ladder_preset(preset) == [Rendition("360p", 360, "800k", "128k")]
+
+    preset.write_text(json.dumps({"renditions": [{"name": "360p"}]}))
+    with pytest.raises(ValueError, match="height"):
+        load_ladder_preset(preset)
+
+
+def test_rejects_invalid_bitrate(tmp_path: Path, calls: list[list[str]]) -> None:
+    media = tmp_path / "upload.mov"
+    media.write_text("video")
+    with pytest.raises(ValueError):
+        encode_ladder(media, [Rendition("bad", 720, "fast")])
+    assert not calls
@@ -0,0 +1,132 @@
+"""Tests for loudness measurement and two-pass normalization."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+import videotools.cache as cache
+import videotools.ops.loudness as loudness
+import videotools.ops.normalize_audio as normalize
+from videotools.ffmpeg import FFmpegError
+from videotools.ops.loudness import loudnorm_filter, measure_loudness, scan_loudness
+
+LOUDNORM_LOG = """Input #0, wav, from 'in.wav':
+[Parsed_loudnorm_0 @ 0x55d0c8a4b2c0]
+{
+	"input_i" : "-27.61",
+	"input_tp" : "-4.47",
+	"input_lra" : "18.06",
+	"input_thresh" : "-39.20",
+	"output_i" : "-16.58",
+	"output_tp" : "-1.50",
+	"output_lra" : "14.78",
+	"output_thresh" : "-27.71",
+	"normalization_type" : "dynamic",
+	"target_offset" : "0.58"
+}
+"""
+
+PROBE_JSON = {
+    "streams": [
+        {"codec_type": "video", "codec_name": "h264"},
+        {"codec_type": "audio", "codec_name": "aac", "bit_rate": "128000",
+         "sample_rate": "44100"},
+        {"codec_type": "audio", "codec_name": "pcm_s16le", "bit_rate": "1411200",
+         "sample_rate": "48000"},
+        {"codec_type": "subtitle", "codec_name": "mov_text"},
+    ],
+    "format": {"duration": "60.0"},
+}
+
+
+@pytest.fixture
+def analyses(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> list[list[str]]:
+    monkeypatch.setattr(cache, "CACHE_DB_PATH", tmp_path / "cache" / "metadata.sqlite3")
+    calls: list[list[str]] = []
+
+    def fake_analysis(args: list[str]) -> str:
+        calls.append(args)
+        return LOUDNORM_LOG
+
+    monkeypatch.setattr(loudness, "run_ffmpeg_analysis", fake_analysis)
+    return calls
+
+
+def test_measure_loudness_parses_and_caches(tmp_path: Path, analyses: list[list[str]]) -> None:
+    media = tmp_path / "in.wav"
+    media.write_text("audio")
+    expected = {"input_i": -27.61, "input_tp": -4.47, "input_lra": 18.06, "input_thresh": -39.2}
+    assert measure_loudness(media) == expected
+    assert measure_loudness(media) == expected
+    assert len(analyses) == 1
+    assert "loudnorm=print_format=json" in analyses[0]
+
+
+def test_measure_loudness_without_audio_fails(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, analyses: list[list[str]]
+) -> None:
+    monkeypatch.setattr(loudness, "run_ffmpeg_analysis", lambda args: "no json here")
+    media = tmp_path / "silent.mp4"
+    media.write_text("video")
+    with pytest.raises(FFmpegError):
+        measure_loudness(media, use_cache=False)
+
+
+def test_scan_loudness_expands_directories(tmp_path: Path, analyses: list[list[str]]) -> None:
+    (tmp_path / "show").mkdir()
+    for name in ("show/a.wav", "show/b.mp4", "show/notes.txt", "c.mp3"):
+        (tmp_path / name).write_text(name)
+    results = scan_loudness([tmp_path / "show", tmp_path / "c.mp3"], jobs=2)
+    assert [result.item.name for result in results] == ["a.wav", "b.mp4", "c.mp3"]
+    assert all(result.ok for result in results)
+
+
+def test_two_pass_reuses_measurement_across_targets(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, analyses: list[list[str]]
+) -> None:
+    media = tmp_path / "in.wav"
+    media.write_text("audio")
+    encodes: list[list[str]] = []
+    monkeypatch.setattr(normalize, "output_cache_key", lambda *args: None)
+    monkeypatch.setattr(normalize, "probe_metadata", lambda path: PROBE_JSON)
+    monkeypatch.setattr(normalize, "run_ffmpeg", lambda args: encodes.append(args))
+
+    normalize.normalize_audio(media, output_file=tmp_path / "a.wav", two_pass=True)
+    normalize.normalize_audio(
+        media, output_file=tmp_path / "b.wav", two_pass=True, target_i=-16, target_tp=-1.5
+    )
+    assert len(analyses) == 1
+    first_filter = encodes[0][encodes[0].index("-filter:a:0") + 1]
+    second_filter = encodes[1][encodes[1].index("-filter:a:0") + 1]
+    assert "measured_I=-27.61" in first_filter and "linear=true" in first_filter
+    assert second_filter.startswith("loudnorm=I=-16:TP=-1.5:LRA=7.0:")
+
+
+def test_single_pass_filter_uses_targets_only() -> None:
+    assert loudnorm_filter() == "loudnorm=I=-24.0:TP=-2.0:LRA=7.0"
+
+
+def test_normalize_copies_non_audio_streams(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    media = tmp_path / "lecture.mp4"
+    media.write_text("video")
+    encodes: list[list[str]] = []
+    monkeypatch.setattr(normalize, "output_cache_key", lambda *args: None)
+    monkeypatch.setattr(normalize, "probe_metadata", lambda path: PROBE_JSON)
+    monkeypatch.setattr(normalize, "run_ffmpeg", lambda args: encodes.append(args))
+
+    normalize.normalize_audio(media, output_file=tmp_path / "out.mp4")
+    args = encodes[0]
+    assert args[2:6] == ["-map", "0", "-c", "copy"]
+    assert args[args.index("-c:a:0") + 1] == "aac"
+    assert args[args.index("-b:a:0") + 1] == "128000"
+    assert args[args.index("-ar:a:0") + 1] == "44100"
+    assert args[args.index("-c:a:1") + 1] == "pcm_s16le"
+    assert "-b:a:1" not in args
+
+    normalize.normalize_audio(media, output_file=tmp_path / "out.wav")
+    assert "-map" not in encodes[1]
+    assert encodes[1][encodes[1].index("-ar") + 1] == "44100"
@@ -0,0 +1,113 @@
+"""Tests for the manifest runner."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+import videotools.manifest as manifest
+from videotools.manifest import ManifestError, journal_path_for, load_manifest, run_manifest
+
+
+def _write_manifest(tmp_path: Path, data: dict) -> Path:
+    path = tmp_path / "manifest.json"
+    path.write_text(json.dumps(data), encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def fake_ops(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> list[tuple[str, dict]]:
+    calls: list[tuple[str, dict]] = []
+    lock = threading.Lock()
+
+    def make(op: str):
+        def run(**kwargs):
+            with lock:
+                calls.append((op, kwargs))
+            time.sleep(0.01)
+            output = kwargs.get("output_file") or tmp_path / f"{op}_{len(calls)}.mp4"
+            output.write_text(op)
+            return output
+
+        return run
+
+    for op in ("cut", "concat", "thumbnail", "transcode"):
+        monkeypatch.setitem(manifest.MANIFEST_OPS, op, make(op))
+    return calls
+
+
+def _graph(tmp_path: Path) -> dict:
+    (tmp_path / "raw.mp4").write_text("raw")
+    return {
+        "jobs": 2,
+        "nodes": {
+            "a": {"op": "cut", "input_file": "raw.mp4", "start_time": "0", "duration": "5",
+                  "output_file": "a.mp4"},
+            "b": {"op": "transcode", "input_file": "raw.mp4", "output_file": "b.mp4"},
+            "merged": {"op": "concat", "input_files": ["@a", "@b"], "output_file": "merged.mp4"},
+            "thumb": {"op": "thumbnail", "input_file": "@merged", "timestamp": "0:01",
+                      "output_file": "thumb.png"},
+        },
+    }
+
+
+def test_manifest_runs_in_dependency_order(tmp_path: Path, fake_ops) -> None:
+    path = _write_manifest(tmp_path, _graph(tmp_path))
+    results = run_manifest(path)
+
+    order = [op for op, _ in fake_ops]
+    assert order.index("concat") > max(order.index("cut"), order.index("transcode"))
+    assert order[-1] == "thumbnail"
+    concat_kwargs = dict(fake_ops)["concat"]
+    assert concat_kwargs["input_files"] == [tmp_path / "a.mp4", tmp_path / "b.mp4"]
+    assert results["thumb"].outputs == [tmp_path / "thumb.png"]
+
+
+def test_manifest_resumes_from_journal(tmp_path: Path, fake_ops) -> None:
+    path = _write_manifest(tmp_path, _graph(tmp_path))
+    run_manifest(path)
+    assert len(fake_ops) == 4
+
+    (tmp_path / "thumb.png").unlink()
+    results = run_manifest(path)
+    assert len(fake_ops) == 5
+    assert fake_ops[-1][0] == "thumbnail"
+    assert results["a"].resumed and not results["thumb"].resumed
+    assert journal_path_for(path).exists()
+
+
+def test_manifest_reruns_downstream_when_params_change(tmp_path: Path, fake_ops) -> None:
+    data = _graph(tmp_path)
+    path = _write_manifest(tmp_path, data)
+    run_manifest(path)
+
+    data["nodes"]["a"]["duration"] = "6"
+    _write_manifest(tmp_path, data)
+    run_manifest(path)
+    rerun = [op for op, _ in fake_ops[4:]]
+    assert sorted(rerun) == ["concat", "cut", "thumbnail"]
+
+
+def test_manifest_reports_failures(tmp_path: Path, fake_ops, monkeypatch: pytest.MonkeyPatch) -> None:
+    def fail(**kwargs):
+        raise RuntimeError("encoder exploded")
+
+    monkeypatch.setitem(manifest.MANIFEST_OPS, "transcode", fail)
+    path = _write_manifest(tmp_path, _graph(tmp_path))
+    with pytest.raises(ManifestError, match="encoder exploded") as excinfo:
+        run_manifest(path)
+    assert "not run: merged, thumb" in str(excinfo.value)
+
+
+def test_manifest_validation(tmp_path: Path) -> None:
+    cycle = {"nodes": {"a": {"op": "cut", "input_file": "@b"}, "b": {"op": "cut", "input_file": "@a"}}}
+    with pytest.raises(ManifestError, match="cycle"):
+        load_manifest(_write_manifest(tmp_path, cycle))
+    with pytest.raises(ManifestError, match="unknown op"):
+        load_manifest(_write_manifest(tmp_path, {"nodes": {"a": {"op": "explode"}}}))
+    with pytest.raises(ManifestError, match="unknown node"):
+        load_manifest(_write_manifest(tmp_path, {"nodes": {"a": {"op": "cut", "input_file": "@zzz"}}}))
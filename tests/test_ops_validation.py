@@ -10,7 +10,7 @@ import videotools.ops.cut_fixed as cut_fixed
 from videotools.ops.audio_to_video import audio_to_video
 from videotools.ops.concat import concat_videos
 from videotools.ops.extract_audio import extract_audio
-from videotools.ops.probe import _parse_frame_rate
+from videotools.ops.probe import _parse_frame_rate, display_size
 from videotools.ops.thumbnail import extract_thumbnail
 from videotools.timecode import format_timecode
 
@@ -71,6 +71,11 @@ def test_audio_to_video_builds_args(tmp_path: Path, monkeypatch: pytest.MonkeyPa
         calls.append(args)
 
     monkeypatch.setattr("videotools.ops.audio_to_video.run_ffmpeg", fake_run)
+    monkeypatch.setattr(
+        "videotools.ops.audio_to_video.probe_metadata",
+        lambda path: {"streams": [{"codec_type": "audio", "codec_name": "mp3"}]},
+    )
+    monkeypatch.setattr("videotools.workspace.TEMP_DIR", tmp_path / "temp")
 
     output_path = audio_to_video(
         audio_file=audio_file,
@@ -80,19 +85,59 @@ def test_audio_to_video_builds_args(tmp_path: Path, monkeypatch: pytest.MonkeyPa
         audio_codec="aac",
         audio_bitrate="256k",
         pixel_format="yuv420p",
+        use_cache=False,
     )
     assert output_path.suffix == ".mp4"
-    assert calls
+    assert len(calls) == 2
+    assert "-loop" in calls[0]
+    assert "stillimage" in calls[0]
+    assert "-shortest" in calls[1]
+    assert calls[1][:2] == ["-stream_loop", "-1"]
+    assert calls[1][calls[1].index("-c:v") + 1] == "copy"
+    assert calls[1][calls[1].index("-b:a") + 1] == "256k"
+
+    calls.clear()
+    audio_to_video(audio_file, image_file, output_dir=tmp_path, use_cache=False,
+                   encode_once=False)
+    assert len(calls) == 1
     assert "-loop" in calls[0]
     assert "-shortest" in calls[0]
     assert "stillimage" in calls[0]
 
 
+def test_audio_to_video_copies_aac(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    audio_file = tmp_path / "input.m4a"
+    image_file = tmp_path / "image.jpg"
+    audio_file.write_text("data")
+    image_file.write_text("data")
+    calls: list[list[str]] = []
+
+    monkeypatch.setattr("videotools.ops.audio_to_video.run_ffmpeg", calls.append)
+    monkeypatch.setattr(
+        "videotools.ops.audio_to_video.probe_metadata",
+        lambda path: {"streams": [{"codec_type": "audio", "codec_name": "aac"}]},
+    )
+    monkeypatch.setattr("videotools.workspace.TEMP_DIR", tmp_path / "temp")
+
+    audio_to_video(audio_file, image_file, output_dir=tmp_path, use_cache=False)
+    assert calls[1][calls[1].index("-c:a") + 1] == "copy"
+    assert "-b:a" not in calls[1]
+    assert calls[1][calls[1].index("-movflags") + 1] == "+faststart"
+
+
 def test_parse_frame_rate_invalid_values() -> None:
     assert _parse_frame_rate("10/0") == 0.0
     assert _parse_frame_rate("bad") == 0.0
 
 
+def test_display_size_follows_rotation() -> None:
+    assert display_size({"width": 1920, "height": 1080}) == (1920, 1080)
+    assert display_size({"width": 1920, "height": 1080, "tags": {"rotate": "90"}}) == (1080, 1920)
+    rotated = {"width": 1920, "height": 1080, "side_data_list": [{"rotation": -90}]}
+    assert display_size(rotated) == (1080, 1920)
+    assert display_size({"width": 1920, "height": 1080, "tags": {"rotate": "180"}}) == (1920, 1080)
+
+
 def test_cut_fixed_handles_float_duration(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     input_file = tmp_path / "input.mp4"
     input_file.write_text("data")
@@ -134,3 +179,29 @@ def test_cut_fixed_handles_copy_streams(tmp_path: Path, monkeypatch: pytest.Monk
     )
     assert "-c" in calls[0]
     assert "copy" in calls[0]
+
+
+def test_cut_fixed_single_pass_uses_one_invocation(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    input_file = tmp_path / "input.mp4"
+    input_file.write_text("data")
+    calls: list[list[str]] = []
+
+    def fake_run(args: list[str]) -> None:
+        calls.append(args)
+
+    monkeypatch.setattr(cut_fixed, "run_ffmpeg", fake_run)
+
+    outputs = cut_fixed.cut_fixed_clips(
+        input_file=input_file,
+        timestamps=["0:00", "1:12"],
+        duration=30,
+        output_dir=tmp_path,
+        single_pass=True,
+    )
+    assert len(calls) == 1
+    assert calls[0].count("-i") == 1
+    assert outputs == [tmp_path / "input_clip_0-00.mp4", tmp_path / "input_clip_1-12.mp4"]
+    for output in outputs:
+        assert str(output) in calls[0]
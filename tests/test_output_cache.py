@@ -0,0 +1,109 @@
+"""Tests for the content-addressed output cache."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+import videotools.ops.transcode as transcode
+import videotools.output_cache as output_cache
+from videotools.ffmpeg import FFmpegError
+from videotools.output_cache import prune_output_cache
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(output_cache, "OUTPUT_CACHE_DIR", tmp_path / "cache" / "outputs")
+    monkeypatch.setattr(output_cache, "get_capabilities", lambda: SimpleNamespace(version="6.1"))
+
+
+@pytest.fixture
+def encodes(monkeypatch: pytest.MonkeyPatch) -> list[list[str]]:
+    calls: list[list[str]] = []
+
+    def fake_run(args: list[str], capture_output: bool = False) -> None:
+        calls.append(args)
+        Path(args[-1]).write_text(f"encoded {len(calls)}")
+
+    monkeypatch.setattr(transcode, "run_ffmpeg", fake_run)
+    monkeypatch.setattr(
+        transcode,
+        "probe_metadata",
+        lambda path: {"streams": [{"codec_type": "video", "codec_name": "prores"}]},
+    )
+    return calls
+
+
+def test_transcode_reuses_cached_output(tmp_path: Path, encodes: list[list[str]]) -> None:
+    source = tmp_path / "input.mov"
+    source.write_text("video")
+
+    first = transcode.transcode_video(source, output_file=tmp_path / "a.mp4")
+    second = transcode.transcode_video(source, output_file=tmp_path / "b.mp4")
+    assert len(encodes) == 1
+    assert second.read_text() == first.read_text() == "encoded 1"
+
+    transcode.transcode_video(source, output_file=tmp_path / "b.mp4", refresh=True)
+    assert len(encodes) == 2
+    assert (tmp_path / "b.mp4").read_text() == "encoded 2"
+
+    transcode.transcode_video(source, output_file=tmp_path / "c.mp4", use_cache=False)
+    assert len(encodes) == 3
+
+
+def test_changed_input_misses_cache(tmp_path: Path, encodes: list[list[str]]) -> None:
+    source = tmp_path / "input.mov"
+    source.write_text("video")
+    transcode.transcode_video(source, output_file=tmp_path / "out.mp4")
+
+    source.write_text("edited video")
+    os.utime(source, ns=(1, 1))
+    transcode.transcode_video(source, output_file=tmp_path / "out.mp4")
+    assert len(encodes) == 2
+
+
+def test_cache_disabled_without_ffmpeg(
+    tmp_path: Path, encodes: list[list[str]], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def missing() -> None:
+        raise FFmpegError("ffmpeg not found")
+
+    monkeypatch.setattr(output_cache, "get_capabilities", missing)
+    source = tmp_path / "input.mov"
+    source.write_text("video")
+    transcode.transcode_video(source, output_file=tmp_path / "out.mp4")
+    transcode.transcode_video(source, output_file=tmp_path / "out.mp4")
+    assert len(encodes) == 2
+
+
+def test_prune_drops_least_recently_used(tmp_path: Path) -> None:
+    for index, name in enumerate(("old", "new")):
+        output = tmp_path / f"{name}.mp4"
+        output.write_bytes(b"x" * 100)
+        output_cache.store_output(name, output)
+        stamp = output_cache.OUTPUT_CACHE_DIR / f"{name}.mp4.used"
+        os.utime(stamp, (index, index))
+
+    assert prune_output_cache(150) == 1
+    assert not output_cache.restore_output("old", tmp_path / "restored.mp4")
+    assert output_cache.restore_output("new", tmp_path / "restored.mp4")
+
+
+def test_reencode_over_restored_output_keeps_cache_entry(
+    tmp_path: Path, encodes: list[list[str]]
+) -> None:
+    source = tmp_path / "input.mov"
+    source.write_text("video")
+    output = tmp_path / "out.mp4"
+    transcode.transcode_video(source, output_file=output)
+    transcode.transcode_video(source, output_file=output)
+    assert len(encodes) == 1
+
+    # An uncached encode writes over the restored file in place, like ffmpeg -y.
+    transcode.transcode_video(source, output_file=output, use_cache=False)
+    transcode.transcode_video(source, output_file=tmp_path / "again.mp4")
+    assert output.read_text() == "encoded 2"
+    assert (tmp_path / "again.mp4").read_text() == "encoded 1"
@@ -0,0 +1,83 @@
+"""Tests for parallel job helpers."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+import videotools.ops.cut_fixed as cut_fixed
+import videotools.pool as pool
+from videotools.pool import (
+    FFmpegBatchError,
+    apply_thread_budget,
+    raise_for_failures,
+    run_parallel,
+    threads_per_job,
+)
+
+
+def test_apply_thread_budget_inserts_before_output() -> None:
+    args = apply_thread_budget(["-i", "in.mp4", "-y", "out.mp4"], 4)
+    assert args == ["-i", "in.mp4", "-y", "-threads", "4", "out.mp4"]
+
+
+def test_threads_per_job_splits_cores(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(pool, "available_cores", lambda: 32)
+    assert threads_per_job(4) == 8
+    assert threads_per_job(64) == 1
+    with pytest.raises(ValueError):
+        threads_per_job(0)
+
+
+def test_run_parallel_collects_errors_in_order() -> None:
+    def work(value: int) -> int:
+        if value == 2:
+            raise RuntimeError("boom")
+        return value * 10
+
+    results = run_parallel(work, [1, 2, 3], jobs=3)
+    assert [result.value for result in results] == [10, None, 30]
+    assert not results[1].ok
+    with pytest.raises(FFmpegBatchError, match="1 of 3 jobs failed"):
+        raise_for_failures(results)
+
+
+def test_serial_run_continues_after_failure() -> None:
+    seen: list[int] = []
+
+    def work(value: int) -> int:
+        seen.append(value)
+        if value == 1:
+            raise RuntimeError("boom")
+        return value
+
+    results = run_parallel(work, [1, 2, 3], jobs=1)
+    assert seen == [1, 2, 3]
+    assert [result.ok for result in results] == [False, True, True]
+
+
+def test_cut_fixed_jobs_passes_thread_budget(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    input_file = tmp_path / "input.mp4"
+    input_file.write_text("data")
+    calls: list[list[str]] = []
+
+    def fake_run(args: list[str]) -> None:
+        calls.append(args)
+
+    monkeypatch.setattr(cut_fixed, "run_ffmpeg", fake_run)
+    monkeypatch.setattr(pool, "available_cores", lambda: 8)
+
+    outputs = cut_fixed.cut_fixed_clips(
+        input_file=input_file,
+        timestamps=["0:00", "0:30"],
+        duration=10,
+        output_dir=tmp_path,
+        jobs=2,
+    )
+    assert len(outputs) == 2
+    assert len(calls) == 2
+    for args in calls:
+        assert args[args.index("-threads") + 1] == "4"
@@ -0,0 +1,69 @@
+"""Tests for the streaming ffmpeg progress runner."""
+
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+from videotools.ffmpeg import FFmpegError, FFmpegProgress, STDERR_TAIL_LINES, iter_ffmpeg_progress
+
+FAKE_FFMPEG = """#!{python}
+import sys
+for index in range(200):
+    print(f"noise line {{index}}", file=sys.stderr)
+for out_time_us, speed in ((2_000_000, "2.0x"), (5_000_000, "2.5x")):
+    print("fps=25.0")
+    print("bitrate=1000.0kbits/s")
+    print("total_size=12345")
+    print(f"out_time_us={{out_time_us}}")
+    print(f"speed={{speed}}")
+    print("progress=continue", flush=True)
+print("out_time_us=10000000")
+print("speed=N/A")
+print("progress=end", flush=True)
+sys.exit({exit_code})
+"""
+
+
+def _install_fake_ffmpeg(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, exit_code: int) -> None:
+    script = tmp_path / "ffmpeg"
+    script.write_text(FAKE_FFMPEG.format(python=sys.executable, exit_code=exit_code))
+    script.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ.get('PATH', '')}")
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="uses a POSIX shebang script")
+def test_iter_progress_parses_reports(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    _install_fake_ffmpeg(tmp_path, monkeypatch, exit_code=0)
+    reports = list(iter_ffmpeg_progress(["-i", "in.mp4", "out.mp4"], duration=10.0))
+
+    assert [report.out_time for report in reports] == [2.0, 5.0, 10.0]
+    assert reports[0].fps == 25.0
+    assert reports[0].bitrate == "1000.0kbits/s"
+    assert reports[0].total_size == 12345
+    assert reports[1].fraction == pytest.approx(0.5)
+    assert reports[1].eta == pytest.approx(2.0)
+    assert reports[-1].finished
+    assert reports[-1].fraction == 1.0
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="uses a POSIX shebang script")
+def test_iter_progress_keeps_bounded_stderr_tail(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _install_fake_ffmpeg(tmp_path, monkeypatch, exit_code=1)
+    with pytest.raises(FFmpegError) as excinfo:
+        list(iter_ffmpeg_progress(["-i", "in.mp4", "out.mp4"]))
+
+    message = str(excinfo.value)
+    assert "noise line 199" in message
+    assert f"noise line {199 - STDERR_TAIL_LINES}" not in message
+
+
+def test_progress_eta_falls_back_to_wall_clock() -> None:
+    progress = FFmpegProgress(out_time=30.0, duration=120.0, elapsed=15.0)
+    assert progress.eta == pytest.approx(45.0)
+    assert FFmpegProgress(out_time=30.0).eta is None
@@ -0,0 +1,56 @@
+"""Tests for scene-change detection."""
+
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+import videotools.cache as cache
+from videotools.ops.scenes import detect_scenes
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="uses a POSIX shebang script")
+
+FAKE_FFMPEG = """#!{python}
+import sys
+with open({log!r}, "a") as log:
+    log.write(" ".join(sys.argv[1:]) + "\\n")
+for frame, pts_time, score in ((12, 2.4, 0.51), (13, 2.6, 0.44), (60, 12.0, 0.9)):
+    print(f"frame:{{frame}}   pts:{{frame * 3072}}  pts_time:{{pts_time}}")
+    print(f"lavfi.scene_score={{score}}", flush=True)
+"""
+
+
+@pytest.fixture
+def ffmpeg_log(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setattr(cache, "CACHE_DB_PATH", tmp_path / "cache" / "metadata.sqlite3")
+    log = tmp_path / "calls.log"
+    script = tmp_path / "ffmpeg"
+    script.write_text(FAKE_FFMPEG.format(python=sys.executable, log=str(log)))
+    script.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ.get('PATH', '')}")
+    return log
+
+
+def test_detect_scenes_parses_and_caches(tmp_path: Path, ffmpeg_log: Path) -> None:
+    media = tmp_path / "match.mp4"
+    media.write_text("video")
+
+    assert detect_scenes(media) == [2.4, 12.0]
+    assert detect_scenes(media, min_scene_seconds=0) == [2.4, 2.6, 12.0]
+    calls = ffmpeg_log.read_text().splitlines()
+    assert len(calls) == 1
+    assert "select='gt(scene,0.3)'" in calls[0] and "fps=5.0" in calls[0]
+
+    detect_scenes(media, threshold=0.5)
+    detect_scenes(media, use_cache=False)
+    assert len(ffmpeg_log.read_text().splitlines()) == 3
+
+
+def test_detect_scenes_validates_threshold(tmp_path: Path) -> None:
+    media = tmp_path / "match.mp4"
+    media.write_text("video")
+    with pytest.raises(ValueError):
+        detect_scenes(media, threshold=1.5)
@@ -0,0 +1,120 @@
+"""Tests for seek strategies."""
+
+from __future__ import annotations
+
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from videotools.ops.cut_duration import cut_by_duration
+from videotools.seek import HYBRID_PREROLL_SECONDS, build_seek_args, validate_seek_strategy
+
+requires_ffmpeg = pytest.mark.skipif(
+    shutil.which("ffmpeg") is None or shutil.which("ffprobe") is None,
+    reason="ffmpeg and ffprobe are required",
+)
+
+
+def _effective_start(input_args: list[str], output_args: list[str]) -> float:
+    input_start = float(input_args[input_args.index("-ss") + 1]) if "-ss" in input_args else 0.0
+    output_start = float(output_args[output_args.index("-ss") + 1]) if "-ss" in output_args else 0.0
+    return input_start + output_start
+
+
+@pytest.mark.parametrize("start", [0.0, 2.5, 72.0, 3 * 3600 + 0.04])
+def test_hybrid_and_accurate_share_effective_start(start: float) -> None:
+    hybrid = build_seek_args(start, "hybrid")
+    accurate = build_seek_args(start, "accurate")
+    assert _effective_start(*hybrid) == pytest.approx(start)
+    assert _effective_start(*accurate) == pytest.approx(start)
+    assert accurate[0] == []
+
+
+def test_hybrid_seeks_input_side_before_start() -> None:
+    input_args, output_args = build_seek_args(600.0, "hybrid")
+    assert input_args == ["-ss", str(600.0 - HYBRID_PREROLL_SECONDS)]
+    assert output_args == ["-ss", str(HYBRID_PREROLL_SECONDS)]
+
+
+def test_fast_seek_is_input_side_only() -> None:
+    input_args, output_args = build_seek_args(30.0, "fast")
+    assert "-ss" in input_args
+    assert output_args == []
+
+
+def test_invalid_seek_strategy() -> None:
+    with pytest.raises(ValueError):
+        validate_seek_strategy("nearest")
+    with pytest.raises(ValueError):
+        build_seek_args(-1.0, "accurate")
+
+
+def _frame_timestamps(path: Path) -> list[str]:
+    result = subprocess.run(
+        [
+            "ffprobe",
+            "-v",
+            "error",
+            "-select_streams",
+            "v:0",
+            "-show_entries",
+            "frame=pts_time",
+            "-of",
+            "csv=p=0",
+            str(path),
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.split()
+
+
+def _frame_hashes(path: Path) -> list[str]:
+    result = subprocess.run(
+        ["ffmpeg", "-v", "error", "-i", str(path), "-map", "0:v", "-f", "framemd5", "-"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return [line.rsplit(",", 1)[-1].strip() for line in result.stdout.splitlines() if not line.startswith("#")]
+
+
+@requires_ffmpeg
+def test_hybrid_cut_matches_accurate_cut(tmp_path: Path) -> None:
+    source = tmp_path / "source.mp4"
+    subprocess.run(
+        [
+            "ffmpeg",
+            "-v",
+            "error",
+            "-f",
+            "lavfi",
+            "-i",
+            "testsrc=duration=20:size=160x120:rate=25",
+            "-c:v",
+            "libx264",
+            "-g",
+            "50",
+            "-pix_fmt",
+            "yuv420p",
+            "-y",
+            str(source),
+        ],
+        check=True,
+    )
+
+    outputs = {}
+    for strategy in ("accurate", "hybrid"):
+        outputs[strategy] = cut_by_duration(
+            source,
+            start_time="7.36",
+            duration="2",
+            output_file=tmp_path / f"{strategy}.mp4",
+            seek=strategy,
+        )
+
+    assert _frame_timestamps(outputs["hybrid"]) == _frame_timestamps(outputs["accurate"])
+    assert _frame_hashes(outputs["hybrid"]) == _frame_hashes(outputs["accurate"])
@@ -0,0 +1,170 @@
+"""Tests for the smart-render cut engine."""
+
+from __future__ import annotations
+
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+import videotools.cache as cache
+import videotools.keyframes as keyframes
+import videotools.ops.cut_duration as cut_duration
+import videotools.ops.cut_fixed as cut_fixed
+import videotools.ops.smart_cut as smart_cut
+import videotools.pool as pool
+import videotools.workspace as workspace
+from videotools.keyframes import KeyframeIndex
+
+requires_ffmpeg = pytest.mark.skipif(
+    shutil.which("ffmpeg") is None or shutil.which("ffprobe") is None,
+    reason="ffmpeg and ffprobe are required",
+)
+
+SOURCE_STREAM = {
+    "codec_type": "video",
+    "codec_name": "h264",
+    "profile": "High",
+    "level": 40,
+    "pix_fmt": "yuv420p",
+    "width": 1920,
+    "height": 1080,
+}
+
+
+@pytest.fixture
+def smart_env(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> tuple[Path, list]:
+    input_file = tmp_path / "input.mp4"
+    input_file.write_text("data")
+    calls: list[list[str]] = []
+
+    monkeypatch.setattr(smart_cut, "run_ffmpeg", lambda args: calls.append(args))
+    monkeypatch.setattr(
+        smart_cut, "load_keyframe_index", lambda path: KeyframeIndex((0.0, 2.0, 4.0, 6.0, 8.0))
+    )
+    monkeypatch.setattr(
+        smart_cut,
+        "probe_metadata",
+        lambda path, use_cache=True: {"streams": [dict(SOURCE_STREAM)]},
+    )
+    monkeypatch.setattr(workspace, "TEMP_DIR", tmp_path / "temp")
+    return input_file, calls
+
+
+def test_smart_cut_reencodes_only_edges(smart_env, tmp_path: Path) -> None:
+    input_file, calls = smart_env
+    smart_cut.smart_cut_clip(input_file, 1.5, 5.0, tmp_path / "clip.mp4")
+
+    head, middle, tail, join = calls
+    assert "libx264" in head and head[head.index("-t") + 1] == "0.5"
+    assert head[head.index("-profile:v") + 1] == "high"
+    assert head[head.index("-level:v") + 1] == "4.0"
+    assert head[head.index("-pix_fmt") + 1] == "yuv420p"
+    assert middle[middle.index("-ss") + 1] == "2.0"
+    assert middle[middle.index("-t") + 1] == "4.0"
+    assert "copy" in middle and "libx264" not in middle
+    assert "libx264" in tail and tail[tail.index("-t") + 1] == "0.5"
+    assert [Path(part[-1]).suffix for part in (head, middle, tail)] == [".ts"] * 3
+    assert middle[middle.index("-bsf:v") + 1] == "h264_mp4toannexb"
+    assert join[join.index("-f") + 1] == "concat"
+    assert join[-1] == str(tmp_path / "clip.mp4")
+    assert not list((tmp_path / "temp").iterdir())
+
+
+def test_smart_cut_skips_head_on_keyframe_start(smart_env, tmp_path: Path) -> None:
+    input_file, calls = smart_env
+    smart_cut.smart_cut_clip(input_file, 2.0, 4.0, tmp_path / "clip.mp4")
+    assert len(calls) == 2
+    assert "copy" in calls[0]
+
+
+def test_smart_cut_without_full_gop_reencodes(smart_env, tmp_path: Path) -> None:
+    input_file, calls = smart_env
+    smart_cut.smart_cut_clip(input_file, 2.5, 1.0, tmp_path / "clip.mp4")
+    assert len(calls) == 1
+    assert "copy" not in calls[0]
+
+
+def test_smart_cut_rejects_unsupported_codec(
+    smart_env, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    input_file, _ = smart_env
+    monkeypatch.setattr(
+        smart_cut,
+        "probe_metadata",
+        lambda path, use_cache=True: {"streams": [{"codec_type": "video", "codec_name": "prores"}]},
+    )
+    with pytest.raises(ValueError):
+        smart_cut.smart_cut_clip(input_file, 1.5, 5.0, tmp_path / "clip.mp4")
+
+
+def test_smart_cut_falls_back_when_edge_header_differs(
+    smart_env, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    input_file, calls = smart_env
+
+    def fake_probe(path: Path, use_cache: bool = True) -> dict:
+        stream = dict(SOURCE_STREAM)
+        if path.suffix == ".ts":
+            stream["level"] = 41
+        return {"streams": [stream]}
+
+    monkeypatch.setattr(smart_cut, "probe_metadata", fake_probe)
+    smart_cut.smart_cut_clip(input_file, 1.5, 5.0, tmp_path / "clip.mp4")
+
+    head, full = calls
+    assert Path(head[-1]).suffix == ".ts"
+    assert full[-1] == str(tmp_path / "clip.mp4") and "copy" not in full
+    assert not list((tmp_path / "temp").iterdir())
+
+
+def test_smart_cut_rejects_seek_strategy(smart_env, tmp_path: Path) -> None:
+    input_file, calls = smart_env
+    with pytest.raises(ValueError):
+        cut_duration.cut_by_duration(input_file, "0:01", "0:05", smart=True, seek="fast")
+    with pytest.raises(ValueError):
+        cut_fixed.cut_fixed_clips(
+            input_file, ["0:01"], duration=5.0, output_dir=tmp_path, smart=True, seek="fast"
+        )
+    assert not calls
+
+
+def test_parallel_smart_cuts_share_cores(
+    smart_env, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    input_file, calls = smart_env
+    monkeypatch.setattr(pool, "available_cores", lambda: 8)
+    cut_fixed.cut_fixed_clips(
+        input_file, ["0:01.5", "0:03"], duration=5.0, output_dir=tmp_path, smart=True, jobs=2
+    )
+    encodes = [args for args in calls if "libx264" in args]
+    assert encodes and all(args[args.index("-threads") + 1] == "4" for args in encodes)
+
+
+@requires_ffmpeg
+def test_smart_cut_output_decodes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(cache, "CACHE_DB_PATH", tmp_path / "cache" / "metadata.sqlite3")
+    monkeypatch.setattr(keyframes, "KEYFRAME_CACHE_DIR", tmp_path / "keyframes")
+    monkeypatch.setattr(keyframes, "_loaded", {})
+    monkeypatch.setattr(workspace, "TEMP_DIR", tmp_path / "temp")
+    source = tmp_path / "source.mp4"
+    subprocess.run(
+        [
+            "ffmpeg", "-v", "error", "-f", "lavfi", "-i", "testsrc=duration=6:size=160x120:rate=25",
+            "-c:v", "libx264", "-preset", "veryfast", "-crf", "30", "-g", "25", "-pix_fmt",
+            "yuv420p", "-y", str(source),
+        ],
+        check=True,
+    )
+    clip = smart_cut.smart_cut_clip(source, 1.3, 3.0, tmp_path / "clip.mp4")
+
+    decoded = subprocess.run(
+        ["ffmpeg", "-v", "error", "-i", str(clip), "-f", "framemd5", "-"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert decoded.stderr.strip() == ""
+    frames = [line for line in decoded.stdout.splitlines() if not line.startswith("#")]
+    assert abs(len(frames) - 75) <= 1
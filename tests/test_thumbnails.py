@@ -0,0 +1,201 @@
+"""Tests for batch thumbnails and sprite sheets."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+import videotools.ops.thumbnail as thumbnail
+from videotools.ops.thumbnail import create_sprite_sheets, extract_thumbnail, extract_thumbnails
+
+
+@pytest.fixture
+def written() -> dict[str, int]:
+    """Images the fake ffmpeg writes per sequence and frames it lists as framecrc."""
+    return {"images": 3, "frames": 3}
+
+
+@pytest.fixture
+def calls(monkeypatch: pytest.MonkeyPatch, written: dict[str, int]) -> list[list[str]]:
+    recorded: list[list[str]] = []
+
+    def fake_run(args: list[str], capture_output: bool = False) -> str | None:
+        recorded.append(args)
+        # Emulate ffmpeg writing image sequences for %-patterns.
+        pattern = args[-1]
+        if "%" in pattern:
+            for index in range(written["images"]):
+                Path(pattern % index).write_text("image")
+        if "framecrc" in args:
+            frames = [f"0, {index}, {index}, 1, 43200, 0x0" for index in range(written["frames"])]
+            return "\n".join(["#tb 0: 1/1", *frames]) + "\n"
+        return None
+
+    monkeypatch.setattr(thumbnail, "run_ffmpeg", fake_run)
+    monkeypatch.setattr(
+        thumbnail,
+        "probe_video",
+        lambda path: {
+            "duration": 25.0,
+            "resolution": "1920x1080",
+            "display_resolution": "1920x1080",
+        },
+    )
+    return recorded
+
+
+def test_timestamps_share_one_process(
+    tmp_path: Path, calls: list[list[str]], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(thumbnail, "THUMBNAIL_BATCH_SIZE", 2)
+    media = tmp_path / "talk.mp4"
+    media.write_text("video")
+
+    outputs = extract_thumbnails(
+        media, timestamps=["0:05", "1:30", "0:05", "12:00"], output_dir=tmp_path, seek="fast"
+    )
+
+    assert [path.name for path in outputs] == [
+        "talk_thumb_0-05.png",
+        "talk_thumb_1-30.png",
+        "talk_thumb_12-00.png",
+    ]
+    assert len(calls) == 2
+    assert calls[0].count("-i") == 2 and calls[1].count("-i") == 1
+    assert calls[0][calls[0].index("-map") + 1] == "0:v:0"
+    assert "1:v:0" in calls[0]
+
+
+def test_interval_decodes_once(tmp_path: Path, calls: list[list[str]]) -> None:
+    media = tmp_path / "talk.mp4"
+    media.write_text("video")
+
+    outputs = extract_thumbnails(media, interval=30, output_dir=tmp_path, width=320)
+
+    assert len(calls) == 1
+    assert calls[0][calls[0].index("-vf") + 1] == "fps=1/30,scale=320:-2"
+    assert [path.name for path in outputs] == [
+        "talk_thumb_i00000.png",
+        "talk_thumb_i00001.png",
+        "talk_thumb_i00002.png",
+    ]
+
+
+def test_interval_keeps_other_thumbnails(tmp_path: Path, calls: list[list[str]]) -> None:
+    media = tmp_path / "talk [v2].mp4"
+    media.write_text("video")
+    by_timestamp = tmp_path / "talk [v2]_thumb_12.png"
+    by_timestamp.write_text("keep")
+    (tmp_path / "talk [v2]_thumb_i00007.png").write_text("stale")
+
+    outputs = extract_thumbnails(media, interval=30, output_dir=tmp_path)
+
+    assert by_timestamp.read_text() == "keep"
+    assert [path.name for path in outputs] == [
+        "talk [v2]_thumb_i00000.png",
+        "talk [v2]_thumb_i00001.png",
+        "talk [v2]_thumb_i00002.png",
+    ]
+
+
+def test_single_thumbnail_scales_to_output_file(tmp_path: Path, calls: list[list[str]]) -> None:
+    media = tmp_path / "talk.mp4"
+    media.write_text("video")
+
+    output = extract_thumbnail(media, "0:05", output_file=tmp_path / "cover.png", width=320)
+
+    assert output == tmp_path / "cover.png"
+    assert calls[0][calls[0].index("-vf") + 1] == "scale=320:-2"
+    assert calls[0][-1] == str(output)
+
+
+def test_requires_timestamps_or_interval(tmp_path: Path) -> None:
+    media = tmp_path / "talk.mp4"
+    media.write_text("video")
+    with pytest.raises(ValueError):
+        extract_thumbnails(media)
+    with pytest.raises(ValueError):
+        extract_thumbnails(media, timestamps=["0:01"], interval=5)
+
+
+def test_sprite_sheets_and_vtt(tmp_path: Path, calls: list[list[str]]) -> None:
+    media = tmp_path / "talk.mp4"
+    media.write_text("video")
+
+    sheets, vtt = create_sprite_sheets(
+        media, interval=10, width=160, columns=2, rows=1, output_dir=tmp_path, base_url="/p/"
+    )
+
+    assert calls[0][calls[0].index("-filter_complex") + 1] == (
+        "[0:v:0]fps=1/10,scale=160:90,split[frames][tiles];[tiles]tile=2x1[sheets]"
+    )
+    assert sheets[0].name == "talk_sprite_000.jpg"
+    assert vtt.read_text().splitlines() == [
+        "WEBVTT",
+        "",
+        "00:00:00.000 --> 00:00:10.000",
+        "/p/talk_sprite_000.jpg#xywh=0,0,160,90",
+        "",
+        "00:00:10.000 --> 00:00:20.000",
+        "/p/talk_sprite_000.jpg#xywh=160,0,160,90",
+        "",
+        "00:00:20.000 --> 00:00:25.000",
+        "/p/talk_sprite_001.jpg#xywh=0,0,160,90",
+    ]
+
+
+def test_sprite_sheets_follow_rotation(
+    tmp_path: Path, calls: list[list[str]], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    media = tmp_path / "phone.mp4"
+    media.write_text("video")
+    monkeypatch.setattr(
+        thumbnail,
+        "probe_video",
+        lambda path: {
+            "duration": 5.0,
+            "resolution": "1920x1080",
+            "display_resolution": "1080x1920",
+        },
+    )
+
+    _, vtt = create_sprite_sheets(media, interval=10, width=90, output_dir=tmp_path)
+
+    assert "scale=90:160" in calls[0][calls[0].index("-filter_complex") + 1]
+    assert vtt.read_text().splitlines()[3] == "phone_sprite_000.jpg#xywh=0,0,90,160"
+
+
+def test_sprite_cues_follow_sampled_frames(
+    tmp_path: Path, calls: list[list[str]], written: dict[str, int],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # 21 s at one frame per 10 s would be three cues, but the fps filter
+    # only produced two frames, both on the first sheet.
+    monkeypatch.setattr(
+        thumbnail,
+        "probe_video",
+        lambda path: {
+            "duration": 21.0,
+            "resolution": "1920x1080",
+            "display_resolution": "1920x1080",
+        },
+    )
+    written.update(images=1, frames=2)
+    media = tmp_path / "talk.mp4"
+    media.write_text("video")
+
+    sheets, vtt = create_sprite_sheets(
+        media, interval=10, width=160, columns=2, rows=1, output_dir=tmp_path
+    )
+
+    assert [sheet.name for sheet in sheets] == ["talk_sprite_000.jpg"]
+    assert vtt.read_text().splitlines() == [
+        "WEBVTT",
+        "",
+        "00:00:00.000 --> 00:00:10.000",
+        "talk_sprite_000.jpg#xywh=0,0,160,90",
+        "",
+        "00:00:10.000 --> 00:00:21.000",
+        "talk_sprite_000.jpg#xywh=160,0,160,90",
+    ]
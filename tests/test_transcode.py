@@ -0,0 +1,53 @@
+"""Tests for the transcode stream-copy fast path."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import videotools.ops.transcode as transcode
+from videotools.ops.transcode import transcode_video
+
+H264 = {"codec_type": "video", "codec_name": "h264", "profile": "High", "pix_fmt": "yuv420p"}
+H264_10BIT = {**H264, "profile": "High 10", "pix_fmt": "yuv420p10le"}
+AAC = {"codec_type": "audio", "codec_name": "aac", "profile": "LC"}
+PCM = {"codec_type": "audio", "codec_name": "pcm_s16le"}
+COVER = {"codec_type": "video", "codec_name": "mjpeg", "disposition": {"attached_pic": 1}}
+
+
+def _transcode(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, streams: list[dict[str, Any]], **kwargs: Any
+) -> list[str]:
+    calls: list[list[str]] = []
+    monkeypatch.setattr(transcode, "run_ffmpeg", lambda args: calls.append(args))
+    monkeypatch.setattr(transcode, "probe_metadata", lambda path: {"streams": streams})
+    source = tmp_path / "camera.mov"
+    source.write_text("video")
+    transcode_video(source, output_file=tmp_path / "out.mp4", use_cache=False, **kwargs)
+    return calls[0]
+
+
+def _codecs(args: list[str]) -> tuple[str, str]:
+    return args[args.index("-c:v") + 1], args[args.index("-c:a") + 1]
+
+
+def test_compliant_input_is_remuxed(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    args = _transcode(tmp_path, monkeypatch, [COVER, H264, AAC])
+    assert _codecs(args) == ("copy", "copy")
+    assert args[args.index("-movflags") + 1] == "+faststart"
+    assert [args[i + 1] for i, arg in enumerate(args) if arg == "-map"] == ["0:v:1", "0:a:0"]
+
+
+def test_only_incompatible_stream_is_encoded(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    assert _codecs(_transcode(tmp_path, monkeypatch, [H264, PCM])) == ("copy", "aac")
+    assert _codecs(_transcode(tmp_path, monkeypatch, [H264_10BIT, AAC])) == ("libx264", "copy")
+
+
+def test_copy_can_be_disabled(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    args = _transcode(tmp_path, monkeypatch, [H264, AAC], allow_copy=False)
+    assert _codecs(args) == ("libx264", "aac")
+    assert "-map" not in args
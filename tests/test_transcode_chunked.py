@@ -0,0 +1,153 @@
+"""Tests for chunked, resumable transcoding."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+import videotools.ops.transcode as transcode
+from videotools.ffmpeg import FFmpegError
+from videotools.keyframes import KeyframeIndex
+from videotools.ops.transcode import plan_chunks, transcode_video_chunked
+from videotools.pool import FFmpegBatchError
+
+STREAMS = [
+    {"codec_type": "video", "codec_name": "h264", "r_frame_rate": "25/1"},
+    {"codec_type": "audio", "codec_name": "aac"},
+]
+
+
+@pytest.fixture
+def failing() -> set[str]:
+    """Chunk start times whose encode fails."""
+    return set()
+
+
+@pytest.fixture
+def encodes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, failing: set[str]
+) -> list[list[str]]:
+    recorded: list[list[str]] = []
+
+    def fake_run(args: list[str]) -> None:
+        recorded.append(args)
+        if "-ss" in args and args[args.index("-ss") + 1] in failing:
+            raise FFmpegError("encoder crashed")
+        Path(args[-1]).write_text("encoded")
+
+    monkeypatch.setattr(transcode, "run_ffmpeg", fake_run)
+    monkeypatch.setattr(transcode, "CHUNK_DIR", tmp_path / "chunks")
+    monkeypatch.setattr(
+        transcode,
+        "probe_video",
+        lambda path: {"duration": 200.0, "fps": 25.0, "audio_codec": "aac"},
+    )
+    monkeypatch.setattr(transcode, "probe_metadata", lambda path: {"streams": list(STREAMS)})
+    monkeypatch.setattr(
+        transcode,
+        "load_keyframe_index",
+        lambda path: KeyframeIndex((0.0, 2.0, 62.0, 64.0, 130.0, 190.0)),
+    )
+    return recorded
+
+
+def test_plan_chunks_starts_on_keyframes() -> None:
+    chunks = plan_chunks((0.0, 2.0, 62.0, 64.0, 130.0, 190.0), 200.0, 60.0)
+    assert chunks == [(0.0, 62.0), (62.0, 130.0), (130.0, 190.0), (190.0, 200.0)]
+    assert plan_chunks((), 10.0, 60.0) == [(0.0, 10.0)]
+    assert plan_chunks((0.0,), 0.0, 60.0) == []
+
+
+def test_zero_duration_is_rejected(
+    tmp_path: Path, encodes: list[list[str]], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(
+        transcode,
+        "probe_video",
+        lambda path: {"duration": 0.0, "fps": 25.0, "audio_codec": "aac"},
+    )
+    media = tmp_path / "live.ts"
+    media.write_text("video")
+
+    with pytest.raises(ValueError, match="duration"):
+        transcode_video_chunked(media, tmp_path / "out.mp4")
+    assert not encodes and not (tmp_path / "out.mp4").exists()
+
+
+def test_chunks_are_encoded_and_joined(tmp_path: Path, encodes: list[list[str]]) -> None:
+    media = tmp_path / "long.mp4"
+    media.write_text("video")
+    output = tmp_path / "out.mp4"
+
+    assert transcode_video_chunked(media, output, chunk_seconds=60, jobs=2) == output
+
+    chunk_encodes = [args for args in encodes if "-ss" in args]
+    starts = sorted(float(args[args.index("-ss") + 1]) for args in chunk_encodes)
+    assert starts == [0.0, 62.0, 130.0, 190.0]
+    assert all(args[args.index("-g") + 1] == "50" for args in chunk_encodes)
+    assert all("-sc_threshold" in args for args in chunk_encodes)
+    join = encodes[-1]
+    assert join[:2] == ["-f", "concat"] and join[join.index("-c") + 1] == "copy"
+    assert "1:a:0" in join
+    assert not any((tmp_path / "chunks").iterdir())
+
+
+def test_rerun_only_encodes_missing_chunks(
+    tmp_path: Path, encodes: list[list[str]], failing: set[str]
+) -> None:
+    media = tmp_path / "long.mp4"
+    media.write_text("video")
+    failing.add("130.0")
+
+    with pytest.raises(FFmpegBatchError):
+        transcode_video_chunked(media, tmp_path / "out.mp4", jobs=1)
+    failing.clear()
+    encodes.clear()
+
+    transcode_video_chunked(media, tmp_path / "out.mp4", jobs=1)
+    assert [args[args.index("-ss") + 1] for args in encodes if "-ss" in args] == ["130.0"]
+    assert not any("-vn" in args for args in encodes)
+
+
+def test_concurrent_run_is_refused(
+    tmp_path: Path, encodes: list[list[str]], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    media = tmp_path / "long.mp4"
+    media.write_text("video")
+    nested: list[Exception] = []
+
+    def fake_run(args: list[str]) -> None:
+        if not nested:
+            try:
+                transcode_video_chunked(media, tmp_path / "other.mp4")
+            except FileExistsError as exc:
+                nested.append(exc)
+        Path(args[-1]).write_text("encoded")
+
+    monkeypatch.setattr(transcode, "run_ffmpeg", fake_run)
+    transcode_video_chunked(media, tmp_path / "out.mp4", jobs=1)
+
+    assert len(nested) == 1
+    assert not (tmp_path / "other.mp4").exists()
+    assert (tmp_path / "out.mp4").exists()
+
+
+def test_cover_art_is_skipped(
+    tmp_path: Path, encodes: list[list[str]], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cover = {"codec_type": "video", "codec_name": "mjpeg", "r_frame_rate": "90000/1",
+             "disposition": {"attached_pic": 1}}
+    monkeypatch.setattr(
+        transcode, "probe_metadata", lambda path: {"streams": [cover, *STREAMS]}
+    )
+    media = tmp_path / "podcast.mp4"
+    media.write_text("video")
+
+    transcode_video_chunked(media, tmp_path / "out.mp4", jobs=1)
+
+    chunk_encodes = [args for args in encodes if "-ss" in args]
+    assert all(args[args.index("-map") + 1] == "0:v:1" for args in chunk_encodes)
+    assert all(args[args.index("-g") + 1] == "50" for args in chunk_encodes)
+    audio = next(args for args in encodes if "-vn" in args)
+    assert audio[audio.index("-map") + 1] == "0:a:0"
@@ -0,0 +1,106 @@
+"""Tests for per-job scratch workspaces."""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+import videotools.workspace as workspace
+from videotools.workspace import OWNER_FILE, claim_directory, gc_workspaces, job_workspace
+
+
+@pytest.fixture(autouse=True)
+def isolated_root(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    root = tmp_path / "scratch"
+    monkeypatch.setattr(workspace, "TEMP_DIR", root)
+    return root
+
+
+def test_workspaces_are_unique_and_removed(isolated_root: Path) -> None:
+    with job_workspace("concat") as first, job_workspace("concat") as second:
+        assert first != second
+        assert first.parent == second.parent == isolated_root
+        (first / "list.txt").write_text("a")
+
+    with pytest.raises(RuntimeError):
+        with job_workspace("concat") as failed:
+            raise RuntimeError("boom")
+
+    assert not first.exists() and not second.exists() and not failed.exists()
+
+
+def test_gc_removes_orphaned_and_old_workspaces(isolated_root: Path) -> None:
+    dead = subprocess.Popen([sys.executable, "-c", "pass"])
+    dead.wait()
+
+    with job_workspace("live", keep=True) as live:
+        pass
+    with job_workspace("orphan", keep=True) as orphan:
+        owner = json.loads((orphan / OWNER_FILE).read_text())
+        owner["pid"] = dead.pid
+        (orphan / OWNER_FILE).write_text(json.dumps(owner))
+    with job_workspace("old", keep=True) as old:
+        owner = json.loads((old / OWNER_FILE).read_text())
+        owner.update(host="elsewhere", created_at=0)
+        (old / OWNER_FILE).write_text(json.dumps(owner))
+
+    assert sorted(gc_workspaces()) == sorted([orphan, old])
+    assert live.exists()
+
+
+def test_gc_keeps_old_workspace_of_live_local_job(isolated_root: Path) -> None:
+    with job_workspace("long", keep=True) as long_running:
+        owner = json.loads((long_running / OWNER_FILE).read_text())
+        owner["created_at"] = 0
+        (long_running / OWNER_FILE).write_text(json.dumps(owner))
+    with job_workspace("unreadable", keep=True) as unreadable:
+        (unreadable / OWNER_FILE).write_text("not json")
+        os.utime(unreadable, (0, 0))
+
+    assert gc_workspaces() == [unreadable]
+    assert long_running.exists()
+
+
+def test_claim_directory_is_exclusive(isolated_root: Path) -> None:
+    shared = isolated_root / "chunks" / "job"
+    with claim_directory(shared):
+        with pytest.raises(FileExistsError):
+            with claim_directory(shared):
+                pass
+        (shared / "chunk.mp4").write_text("done")
+    assert (shared / "chunk.mp4").exists() and not (shared / OWNER_FILE).exists()
+
+    dead = subprocess.Popen([sys.executable, "-c", "pass"])
+    dead.wait()
+    with claim_directory(shared):
+        owner = json.loads((shared / OWNER_FILE).read_text())
+        owner["pid"] = dead.pid
+        (shared / OWNER_FILE).write_text(json.dumps(owner))
+        with claim_directory(shared):
+            pass
+
+
+def test_gc_removes_old_unclaimed_shared_dirs(isolated_root: Path) -> None:
+    chunks = isolated_root / "chunks"
+    dead = subprocess.Popen([sys.executable, "-c", "pass"])
+    dead.wait()
+
+    (chunks / "released").mkdir(parents=True)
+    os.utime(chunks / "released", (0, 0))
+    (chunks / "interrupted").mkdir()
+    owner = {"pid": dead.pid, "host": socket.gethostname(), "created_at": time.time()}
+    (chunks / "interrupted" / OWNER_FILE).write_text(json.dumps(owner))
+    with claim_directory(chunks / "running"):
+        owner = json.loads((chunks / "running" / OWNER_FILE).read_text())
+        owner["created_at"] = 0
+        (chunks / "running" / OWNER_FILE).write_text(json.dumps(owner))
+
+        assert gc_workspaces(shared_dirs=[chunks]) == [chunks / "released"]
+        assert (chunks / "interrupted").exists() and (chunks / "running").exists()